@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Decode/encode helpers for audio build stages (NumPy + ffmpeg pipes)
+
+Clips are decoded once to mono float32 PCM through an ffmpeg pipe, analysed
+in-process with NumPy, and (if needed) encoded once from memory - no temp
+WAV files and no separate ffmpeg analysis pass.
+Requires: pip install numpy, and ffmpeg on the PATH.
+"""
+
+import math
+import subprocess
+
+import numpy as np
+
+import mp3_frames
+
+SILENCE_THRESHOLD_DB = -50.0
+WINDOW = 0.01  # seconds per analysis window
+
+# ITU-R BS.1770 integrated loudness: 400 ms blocks every 100 ms, gated
+LOUDNESS_BLOCK = 0.4
+LOUDNESS_STEP = 0.1
+ABSOLUTE_GATE_LUFS = -70.0
+RELATIVE_GATE_LU = -10.0
+
+
+def native_sample_rate(data, default=24000):
+    """Sample rate from the first MP3 frame header"""
+    frames = mp3_frames.parse_frames(data)
+    if not frames:
+        return default
+    return mp3_frames.parse_header(data, frames[0][0])[2]
+
+
+def decode(path, sample_rate=None):
+    """Decode an audio file to (mono float32 samples in [-1, 1], sample_rate)"""
+    if sample_rate is None:
+        with open(path, "rb") as f:
+            sample_rate = native_sample_rate(f.read())
+    result = subprocess.run(
+        ["ffmpeg", "-hide_banner", "-loglevel", "error", "-i", str(path),
+         "-f", "s16le", "-ac", "1", "-ar", str(sample_rate), "pipe:1"],
+        capture_output=True, check=True,
+    )
+    samples = np.frombuffer(result.stdout, dtype="<i2").astype(np.float32) / 32768.0
+    return samples, sample_rate
+
+
+def encode(samples, sample_rate, path, bitrate="64k", fmt="mp3", codec_args=()):
+    """Encode mono float32 samples to `path` in a single ffmpeg call"""
+    pcm = (np.clip(samples, -1.0, 1.0) * 32767.0).astype("<i2").tobytes()
+    subprocess.run(
+        ["ffmpeg", "-hide_banner", "-loglevel", "error",
+         "-f", "s16le", "-ac", "1", "-ar", str(sample_rate), "-i", "pipe:0",
+         *codec_args, "-b:a", bitrate, "-f", fmt, "-y", str(path)],
+        input=pcm, capture_output=True, check=True,
+    )
+
+
+def amplitude_db(amplitude):
+    """dBFS of a linear amplitude (same floor as window_levels_db)"""
+    return 20 * math.log10(amplitude + 1e-12)
+
+
+def window_levels_db(samples, sample_rate, window=WINDOW):
+    """Peak level (dBFS) of each `window`-second block"""
+    size = max(1, int(sample_rate * window))
+    count = max(1, -(-len(samples) // size))  # last partial block included
+    blocks = np.zeros(count * size, dtype=np.float32)
+    blocks[:len(samples)] = np.abs(samples)
+    return 20 * np.log10(blocks.reshape(count, size).max(axis=1) + 1e-12)
+
+
+def silence_bounds(samples, sample_rate, threshold_db=SILENCE_THRESHOLD_DB, window=WINDOW):
+    """
+    (start_s, end_s) of the audible part of a clip.
+
+    Returns None for a clip that is silent throughout.
+    """
+    levels = window_levels_db(samples, sample_rate, window)
+    loud = np.nonzero(levels > threshold_db)[0]
+    if len(loud) == 0:
+        return None
+    size = max(1, int(sample_rate * window))
+    start = loud[0] * size / sample_rate
+    end = min(len(samples), (loud[-1] + 1) * size) / sample_rate
+    return start, end
+
+
+def k_weighting(sample_rate):
+    """BS.1770 K-weighting as two biquads [(b, a), (b, a)] for `sample_rate` (libebur128's formulas)"""
+    # Stage 1: high shelf (head effects)
+    k = math.tan(math.pi * 1681.9744509555319 / sample_rate)
+    q = 0.7071752369554193
+    vh = 10 ** (3.99984385397 / 20)
+    vb = vh ** 0.499666774155
+    a0 = 1 + k / q + k * k
+    shelf = ([(vh + vb * k / q + k * k) / a0, 2 * (k * k - vh) / a0, (vh - vb * k / q + k * k) / a0],
+             [1.0, 2 * (k * k - 1) / a0, (1 - k / q + k * k) / a0])
+    # Stage 2: high pass (RLB weighting)
+    k = math.tan(math.pi * 38.13547087613982 / sample_rate)
+    q = 0.5003270373253953
+    a0 = 1 + k / q + k * k
+    highpass = ([1.0, -2.0, 1.0], [1.0, 2 * (k * k - 1) / a0, (1 - k / q + k * k) / a0])
+    return [shelf, highpass]
+
+
+def k_weighted(samples, sample_rate):
+    """Apply K-weighting in the frequency domain (one FFT instead of a per-sample IIR loop)"""
+    # Zero padding keeps the filters' decaying tails from wrapping around
+    n = 1 << (len(samples) + sample_rate // 2 - 1).bit_length()
+    z = np.exp(-2j * np.pi * np.fft.rfftfreq(n))
+    response = np.ones(len(z), dtype=np.complex128)
+    for b, a in k_weighting(sample_rate):
+        response *= (b[0] + b[1] * z + b[2] * z * z) / (a[0] + a[1] * z + a[2] * z * z)
+    return np.fft.irfft(np.fft.rfft(samples, n) * response, n)[:len(samples)]
+
+
+def integrated_loudness(samples, sample_rate):
+    """
+    Gated integrated loudness (LUFS) of a mono clip, per ITU-R BS.1770.
+
+    Clips shorter than one 400 ms block are measured as a single block.
+    Returns None when nothing is above the absolute gate (silence).
+    """
+    if len(samples) == 0:
+        return None
+    weighted = k_weighted(samples.astype(np.float64), sample_rate) ** 2
+    block = int(LOUDNESS_BLOCK * sample_rate)
+    step = int(LOUDNESS_STEP * sample_rate)
+    if len(weighted) <= block:
+        powers = np.array([weighted.mean()])
+    else:
+        cumulative = np.concatenate(([0.0], np.cumsum(weighted)))
+        starts = np.arange(0, len(weighted) - block + 1, step)
+        powers = (cumulative[starts + block] - cumulative[starts]) / block
+
+    def lufs(power):
+        return -0.691 + 10 * np.log10(power + 1e-20)
+
+    gated = powers[lufs(powers) > ABSOLUTE_GATE_LUFS]
+    if len(gated) == 0:
+        return None
+    gated = gated[lufs(gated) > lufs(gated.mean()) + RELATIVE_GATE_LU]
+    return float(lufs(gated.mean()))
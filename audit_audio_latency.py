@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Audit time-to-first-sound of every game audio clip
+Output: a per-category report; exit status 1 when the latency budget is exceeded
+
+When a child taps 🔊 the clip starts playing at once, but the word is only
+heard after the leading silence the TTS engine left in. This audit
+measures, for every clip in every public/*_audio category:
+
+- leading silence (ms before the first sample above -50 dBFS)
+- file size (bytes fetched before it can play)
+- decoded size (what Web Audio holds in memory: float32 at 48 kHz)
+
+and prints p50/p90/p95/max per category plus the worst clips overall.
+Clips that fail to decode (corrupt or truncated files) are budget
+violations.
+
+Measurements come from build_audio_index.py (same cache, so clips that
+were already indexed are not decoded again).
+
+The budget is checked per category at --percentile, and for every single
+clip against --max-ms:
+
+    python audit_audio_latency.py                          # p95 <= 150 ms, every clip <= 300 ms
+    python audit_audio_latency.py --budget-ms 100 --percentile 90
+    python audit_audio_latency.py public/number_audio --json
+
+Fix a failing category with: python trim_audio_silence.py public/<category>
+"""
+
+import argparse
+import json
+import sys
+from contextlib import redirect_stdout
+from pathlib import Path
+
+from build_audio_index import build_index, default_directories
+from build_events import percentile
+
+BUDGET_MS = 150.0   # leading silence allowed at --percentile in every category
+MAX_MS = 300.0      # leading silence allowed in any single clip
+PERCENTILE = 95
+WEB_AUDIO_RATE = 48000  # AudioContext rate browsers decode to
+WEB_AUDIO_BYTES = 4     # float32 per sample
+
+
+def clip_stats(clips, public_dir):
+    """[(category, path, leading silence ms, file bytes, decoded bytes)] for every clip"""
+    rows = []
+    for path, meta in clips.items():
+        if meta["onset"] is None:
+            onset_ms = meta["duration"] * 1000  # silent: nothing is ever heard
+        else:
+            onset_ms = meta["onset"] * 1000
+        file_bytes = (public_dir / path).stat().st_size
+        decoded_bytes = round(meta["duration"] * WEB_AUDIO_RATE) * WEB_AUDIO_BYTES
+        # .ogg alternates are audited as their own category next to the .mp3 originals
+        category, suffix = path.split("/")[0], Path(path).suffix
+        if suffix != ".mp3":
+            category += f" ({suffix[1:]})"
+        rows.append((category, path, round(onset_ms, 1), file_bytes, decoded_bytes))
+    return rows
+
+
+def audit(rows, failures=None, budget_ms=BUDGET_MS, max_ms=MAX_MS, pct=PERCENTILE, top=10):
+    """
+    Per-category percentiles, worst clips and budget violations. Every clip
+    in `failures` ({path: decode error}) counts as a violation: a corrupt
+    clip never plays at all.
+    """
+    categories = {}
+    for category, path, onset_ms, file_bytes, decoded_bytes in rows:
+        categories.setdefault(category, []).append((onset_ms, file_bytes, decoded_bytes))
+
+    report = {"budget_ms": budget_ms, "max_ms": max_ms, "percentile": pct,
+              "categories": {}, "worst": [], "violations": []}
+    for category, values in sorted(categories.items()):
+        onsets = sorted(v[0] for v in values)
+        stats = {
+            "clips": len(values),
+            "p50_ms": percentile(onsets, 50),
+            "p90_ms": percentile(onsets, 90),
+            "p95_ms": percentile(onsets, 95),
+            "max_ms": onsets[-1],
+            "at_percentile_ms": percentile(onsets, pct),
+            "file_kb": round(sum(v[1] for v in values) / 1024, 1),
+            "decoded_kb": round(sum(v[2] for v in values) / 1024, 1),
+        }
+        report["categories"][category] = stats
+        if stats["at_percentile_ms"] > budget_ms:
+            report["violations"].append(
+                f"{category}: p{pct:g} leading silence {stats['at_percentile_ms']:.0f} ms "
+                f"> {budget_ms:.0f} ms")
+
+    by_onset = sorted(rows, key=lambda row: row[2], reverse=True)
+    report["worst"] = [{"path": path, "onset_ms": onset_ms, "file_bytes": file_bytes}
+                       for _, path, onset_ms, file_bytes, _ in by_onset[:top]]
+    for _, path, onset_ms, _, _ in by_onset:
+        if onset_ms <= max_ms:
+            break
+        report["violations"].append(f"{path}: leading silence {onset_ms:.0f} ms > {max_ms:.0f} ms")
+    for path, error in sorted((failures or {}).items()):
+        report["violations"].append(f"{path}: failed to decode ({error})")
+    return report
+
+
+def print_report(report):
+    pct = report["percentile"]
+    print(f"\n{'Category':<18} {'Clips':>6} {'p50':>7} {'p90':>7} {'p95':>7} {'Max':>7} "
+          f"{'Files':>9} {'Decoded':>9}")
+    for category, s in report["categories"].items():
+        flag = " ✗" if s["at_percentile_ms"] > report["budget_ms"] else ""
+        print(f"{category:<18} {s['clips']:>6} {s['p50_ms']:>5.0f}ms {s['p90_ms']:>5.0f}ms "
+              f"{s['p95_ms']:>5.0f}ms {s['max_ms']:>5.0f}ms {s['file_kb']:>7.0f}KB "
+              f"{s['decoded_kb']:>7.0f}KB{flag}")
+
+    print("\nSlowest to first sound:")
+    for clip in report["worst"]:
+        print(f"  {clip['onset_ms']:>6.0f} ms  {clip['file_bytes'] / 1024:>5.1f} KB  {clip['path']}")
+
+    print(f"\nBudget: p{pct:g} <= {report['budget_ms']:.0f} ms per category, "
+          f"every clip <= {report['max_ms']:.0f} ms")
+    for violation in report["violations"]:
+        print(f"✗ {violation}")
+    if not report["violations"]:
+        print("✓ Within budget")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Audit leading silence and size of every audio clip")
+    parser.add_argument("directories", nargs="*", default=None,
+                        help="Audio directories to audit (default: public/*_audio)")
+    parser.add_argument("--budget-ms", type=float, default=BUDGET_MS,
+                        help=f"Leading silence allowed at --percentile per category (default: {BUDGET_MS})")
+    parser.add_argument("--percentile", type=float, default=PERCENTILE,
+                        help=f"Percentile checked against --budget-ms (default: {PERCENTILE})")
+    parser.add_argument("--max-ms", type=float, default=MAX_MS,
+                        help=f"Leading silence allowed in any single clip (default: {MAX_MS})")
+    parser.add_argument("--top", type=int, default=10, help="Worst clips to list (default: 10)")
+    parser.add_argument("--workers", type=int, default=None, help="Decoding processes (default: one per CPU)")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    # Keep stdout pure JSON with --json: indexing progress goes to stderr
+    with redirect_stdout(sys.stderr if args.json else sys.stdout):
+        clips, failures = build_index(args.directories or default_directories(), args.workers)
+    if not clips and not failures:
+        print("✗ No audio clips found")
+        sys.exit(1)
+    report = audit(clip_stats(clips, Path("public")), failures, args.budget_ms, args.max_ms,
+                   args.percentile, args.top)
+
+    if args.json:
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+    else:
+        print_report(report)
+    if report["violations"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+Benchmark the asset pipeline against local stand-ins
+Output: benchmark_results.json (wall time, peak RSS and files/s per case)
+
+Cases (each run at every --sizes N):
+- tts_cold / tts_warm   N phrases through the TTS scheduler and synthesis
+                        cache with the fake backend (canned audio after
+                        --tts-latency seconds), then again from the cache
+- pokeapi_cold / _warm  fetch_pokemon_data.fetch_all for N Pokemon (data +
+                        artwork) from a local PokeAPI mirror, then again
+                        from the HTTP cache
+- cards                 create_pokemon_cards.py duplex PDF (print image
+                        pre-pass + imposition) for N synthetic artworks
+
+Nothing touches the network or public/. Fixtures (synthetic artwork and
+PokeAPI snapshots) are generated deterministically once and kept in
+.build_cache/benchmark/. Every case runs in a fresh child process, so peak
+RSS is per case (the child's own peak, or its largest worker's).
+
+    python benchmark_pipeline.py                       # all cases, 151 items
+    python benchmark_pipeline.py --sizes 151 1000 10000 --cases cards
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+FIXTURE_DIR = Path(".build_cache") / "benchmark"
+OUTPUT_FILE = "benchmark_results.json"
+DEFAULT_SIZES = [151]
+ARTWORK_SIZE = 475  # official artwork is 475x475
+TTS_LATENCY = 0.05
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+
+def synthetic_artwork(directory, count, seed=151):
+    """`count` RGBA images named like the real artwork (001_pokemon1.png), made once"""
+    from PIL import Image, ImageDraw
+
+    directory = Path(directory)
+    marker = directory / ".complete"
+    if marker.exists():
+        return directory
+    directory.mkdir(parents=True, exist_ok=True)
+
+    rng = random.Random(seed)
+    for index in range(1, count + 1):
+        image = Image.new("RGBA", (ARTWORK_SIZE, ARTWORK_SIZE), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(image)
+        for _ in range(12):
+            x0, y0 = rng.randrange(0, 300), rng.randrange(0, 300)
+            x1, y1 = x0 + rng.randrange(40, 175), y0 + rng.randrange(40, 175)
+            color = tuple(rng.randrange(256) for _ in range(3)) + (255,)
+            draw.ellipse((x0, y0, x1, y1), fill=color)
+        image.save(directory / f"{index:03d}_pokemon{index}.png")
+    marker.touch()
+    return directory
+
+
+def synthetic_snapshot(directory, count, artwork_dir):
+    """A pokeapi_http snapshot serving /pokemon/{id} documents and their artwork"""
+    directory = Path(directory)
+    if (directory / "index.json").exists():
+        return directory
+    directory.mkdir(parents=True, exist_ok=True)
+
+    rng = random.Random(count)
+    stats = ["hp", "attack", "defense", "special-attack", "special-defense", "speed"]
+    index = {}
+    for pokemon_id, artwork in enumerate(sorted(Path(artwork_dir).glob("*.png")), start=1):
+        artwork_url = ("https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/"
+                       f"other/official-artwork/{pokemon_id}.png")
+        document = {
+            "name": f"pokemon{pokemon_id}",
+            "height": rng.randrange(3, 40),
+            "weight": rng.randrange(10, 2000),
+            "types": [{"type": {"url": f"https://pokeapi.co/api/v2/type/{rng.randrange(1, 19)}/"}}],
+            "stats": [{"stat": {"name": name}, "base_stat": rng.randrange(20, 160)} for name in stats],
+            "sprites": {"other": {"official-artwork": {"front_default": artwork_url}}},
+        }
+        for url, filename, body, content_type in (
+            (f"https://pokeapi.co/api/v2/pokemon/{pokemon_id}", f"pokemon_{pokemon_id}.json",
+             json.dumps(document).encode(), "application/json"),
+            (artwork_url, f"artwork_{pokemon_id}.png", artwork.read_bytes(), "image/png"),
+        ):
+            (directory / filename).write_bytes(body)
+            index[url] = {"file": filename, "etag": None, "last_modified": None,
+                          "content_type": content_type}
+        if pokemon_id == count:
+            break
+
+    with open(directory / "index.json", "w", encoding="utf-8") as f:
+        json.dump(index, f)
+    return directory
+
+
+def prepare_fixtures(cases, size):
+    """Absolute paths of what `cases` need at `size` (generated here, so it isn't measured)"""
+    fixtures = {}
+    if any(case.startswith(("pokeapi", "cards")) for case in cases):
+        fixtures["artwork"] = str(synthetic_artwork(FIXTURE_DIR / f"artwork_{size}", size).resolve())
+    if any(case.startswith("pokeapi") for case in cases):
+        fixtures["snapshot"] = str(synthetic_snapshot(FIXTURE_DIR / f"pokeapi_{size}", size,
+                                                      fixtures["artwork"]).resolve())
+    return fixtures
+
+
+# ---------------------------------------------------------------------------
+# Cases (run in a child process; each returns the number of files produced)
+
+def run_tts(size, workdir, fixtures, latency, warm):
+    from tts_backends import backend_job, get_backend
+    from tts_cache import SynthesisCache
+    from tts_scheduler import run_jobs
+
+    backend = get_backend("fake", "sv", options={"latency": latency})
+    output_dir = os.path.join(workdir, "tts_audio")
+    cache_dir = os.path.join(workdir, "tts_cache")
+    os.makedirs(output_dir, exist_ok=True)
+    phrases = {os.path.join(output_dir, f"{i}.mp3"): f"fras nummer {i}" for i in range(size)}
+
+    def render():
+        cache = SynthesisCache(output_dir, engine=backend.name, voice=backend.voice,
+                               options=backend.options, cache_dir=cache_dir)
+        pending = [f for f, text in phrases.items() if not cache.restore(f, text)]
+        results = asyncio.run(run_jobs([backend_job(backend, phrases[f], f) for f in pending]))
+        for filename, result in zip(pending, results):
+            if result:
+                cache.store(filename, phrases[filename])
+        cache.save()
+
+    if warm:
+        render()  # populate the cache, then measure the rerun
+        for filename in phrases:
+            os.remove(filename)
+    return measure(render, size)
+
+
+def run_pokeapi(size, workdir, fixtures, latency, warm):
+    import fetch_pokemon_data
+    import pokeapi_http
+
+    server = pokeapi_http.serve_snapshot(fixtures["snapshot"], port=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    mirror = f"http://127.0.0.1:{server.server_address[1]}"
+    cache_dir = os.path.join(workdir, "http_cache")
+    images_dir = os.path.join(workdir, "pokemon_images")
+
+    def fetch():
+        # A fresh session per run: warm runs are served from its disk cache
+        pokeapi_http._session = pokeapi_http.CachedSession(cache_dir=cache_dir, mirror=mirror)
+        fetch_pokemon_data.fetch_all(list(range(1, size + 1)), images_dir)
+
+    try:
+        if warm:
+            fetch()
+        return measure(fetch, size * 2)  # one document + one artwork per Pokemon
+    finally:
+        server.shutdown()
+
+
+def run_cards(size, workdir, fixtures, latency, warm):
+    import create_pokemon_cards
+
+    def build():
+        create_pokemon_cards.create_pokemon_cards_pdf(
+            image_dir=fixtures["artwork"], output_pdf=os.path.join(workdir, "cards.pdf"), sides="duplex")
+
+    return measure(build, size)
+
+
+CASES = {
+    "tts_cold": (run_tts, False),
+    "tts_warm": (run_tts, True),
+    "pokeapi_cold": (run_pokeapi, False),
+    "pokeapi_warm": (run_pokeapi, True),
+    "cards": (run_cards, False),
+}
+
+
+def measure(fn, files):
+    start = time.perf_counter()
+    fn()
+    return {"wall_s": round(time.perf_counter() - start, 3), "files": files}
+
+
+def peak_rss_mb():
+    """Peak RSS of this process and of its largest (waited-for) child, in MB"""
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024  # ru_maxrss is bytes on macOS, KB on Linux
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    return round(max(own, children) * scale / (1024 * 1024), 1)
+
+
+def run_case_in_child(args):
+    """Entry point of the child process: run one case and write its result as JSON"""
+    fixtures = json.loads(args.fixtures)
+    fn, warm = CASES[args.run_case]
+    workdir = tempfile.mkdtemp(prefix="bench_")
+    # Caches the scripts keep under the working directory (.build_cache, .tts_cache)
+    # start empty and never touch the real ones
+    os.chdir(workdir)
+    try:
+        result = fn(args.size, workdir, fixtures, args.tts_latency, warm)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    result["peak_rss_mb"] = peak_rss_mb()
+    with open(args.result_file, "w", encoding="utf-8") as f:
+        json.dump(result, f)
+
+
+def run_case(case, size, fixtures, latency):
+    """Run one case in a fresh interpreter. Returns its result dict"""
+    fd, result_file = tempfile.mkstemp(suffix=".json")
+    os.close(fd)
+    try:
+        process = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--run-case", case, "--size", str(size),
+             "--fixtures", json.dumps(fixtures), "--tts-latency", str(latency),
+             "--result-file", result_file],
+            capture_output=True, text=True,
+        )
+        if process.returncode != 0:
+            error = (process.stderr.strip().splitlines() or ["unknown error"])[-1]
+            return {"case": case, "size": size, "error": error}
+        with open(result_file, encoding="utf-8") as f:
+            result = json.load(f)
+    finally:
+        os.remove(result_file)
+
+    result["files_per_s"] = round(result["files"] / result["wall_s"], 1) if result["wall_s"] else None
+    return {"case": case, "size": size, **result}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the asset pipeline with local stand-ins")
+    parser.add_argument("--cases", nargs="+", choices=sorted(CASES), default=list(CASES),
+                        help="Cases to run (default: all)")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                        help="Item counts to run each case at, e.g. 151 1000 10000 (default: 151)")
+    parser.add_argument("--tts-latency", type=float, default=TTS_LATENCY,
+                        help=f"Seconds the fake TTS backend takes per clip (default: {TTS_LATENCY})")
+    parser.add_argument("--output", default=OUTPUT_FILE, help=f"Results file (default: {OUTPUT_FILE})")
+    # Internal: used by the parent to run a single case in a child process
+    parser.add_argument("--run-case", choices=sorted(CASES), help=argparse.SUPPRESS)
+    parser.add_argument("--size", type=int, help=argparse.SUPPRESS)
+    parser.add_argument("--fixtures", default="{}", help=argparse.SUPPRESS)
+    parser.add_argument("--result-file", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_case:
+        run_case_in_child(args)
+        return
+
+    results = []
+    for size in args.sizes:
+        print(f"Preparing fixtures for {size} items...")
+        fixtures = prepare_fixtures(args.cases, size)
+        for case in args.cases:
+            result = run_case(case, size, fixtures, args.tts_latency)
+            results.append(result)
+            if "error" in result:
+                print(f"  ✗ {case:<14} {size:>6}  {result['error']}")
+            else:
+                print(f"  ✓ {case:<14} {size:>6}  {result['wall_s']:>8.2f}s  "
+                      f"{result['files_per_s']:>8} files/s  {result['peak_rss_mb']:>7} MB peak")
+
+    report = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "tts_latency": args.tts_latency,
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
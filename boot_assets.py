@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Static copy of the asset keys BootScene.preload requests
+
+Build scripts (atlas packer, bundlers, budget reports) use this to refer to
+assets by the same keys and paths the game uses. Keep in sync with
+src/scenes/BootScene.js.
+
+Paths are relative to public/ (the Vite static root).
+"""
+
+from pathlib import Path
+
+PUBLIC_DIR = Path("public")
+
+# Pokemon artwork is served from pokemon_images/ (project root in dev)
+POKEMON_IMAGE_DIRS = [PUBLIC_DIR / "pokemon_images", Path("pokemon_images")]
+
+# BootScene.loadPokeballSprites
+POKEBALL_SPRITES = {
+    # Optimized 128x128 sprites
+    "pokeball_poke-ball": "pokeball_sprites/poke-ball-small.png",
+    "pokeball_great-ball": "pokeball_sprites/great-ball-small.png",
+    "pokeball_ultra-ball": "pokeball_sprites/ultra-ball-small.png",
+    "pokeball_legendary-ball": "pokeball_sprites/legendary-ball.png",
+    # Tiny 64x64 sprites for the inventory
+    "pokeball_poke-ball-tiny": "pokeball_sprites/poke-ball-tiny.png",
+    "pokeball_great-ball-tiny": "pokeball_sprites/great-ball-tiny.png",
+    "pokeball_ultra-ball-tiny": "pokeball_sprites/ultra-ball-tiny.png",
+    "pokeball_legendary-ball-tiny": "pokeball_sprites/legendary-ball-tiny.png",
+}
+OTHER_POKEBALLS = [
+    "master-ball", "safari-ball", "net-ball", "dive-ball", "nest-ball", "repeat-ball",
+    "timer-ball", "luxury-ball", "premier-ball", "dusk-ball", "heal-ball", "quick-ball",
+    "cherish-ball",
+]
+
+# Single images loaded directly in BootScene.preload
+UI_IMAGES = {
+    "coin": "coin.png",
+    "coin-tiny": "coin-tiny.png",
+    "treasure-chest": "treasure-chest.png",
+    "dice-icon": "dice-icon-small.png",
+    "pokedex-icon": "pokedex-icon-small.png",
+    "store-icon": "store-icon-small.png",
+}
+
+MINIGAME_ICONS = {
+    "game-mode-letter": "minigame_icons/letter_listening.png",
+    "game-mode-word": "minigame_icons/word_emoji_match.png",
+    "game-mode-emojiword": "minigame_icons/emoji_word_match.png",
+    "game-mode-directions": "minigame_icons/left_right.png",
+    "game-mode-numbers": "minigame_icons/number_listening.png",
+    "game-mode-lettermatch": "minigame_icons/letter_drag_match.png",
+    "game-mode-speech": "minigame_icons/speech_recognition.png",
+    "game-mode-numberreading": "minigame_icons/number_listening.png",
+    "game-mode-spelling": "minigame_icons/word_spelling.png",
+    "game-mode-legendary": "minigame_icons/legendary_alphabet.png",
+    "game-mode-legendary-numbers": "minigame_icons/legendary_numbers.png",
+    "game-mode-dayofweek": "minigame_icons/day_of_week.png",
+    "game-mode-addition": "minigame_icons/addition.png",
+    "game-mode-shapedirections": "minigame_icons/shape_directions.png",
+}
+
+NUM_TYPES = 18
+
+# Audio tables from BootScene.load*Audio
+LETTERS = "abcdefghijklmnopqrstuvwxyzåäö"
+DIRECTIONS = ["hoger", "vanster"]
+DAYS = [(1, "mandag"), (2, "tisdag"), (3, "onsdag"), (4, "torsdag"), (5, "fredag"),
+        (6, "lordag"), (7, "sondag")]
+SHAPEDIR_COLORS = ["blue", "red", "yellow", "green", "orange", "purple"]
+SHAPEDIR_SHAPES = ["circle", "square", "triangle", "star"]
+BOOT_NUMBERS = list(range(100)) + [100, 200, 300]
+
+
+def resolve(relative_path):
+    """Path on disk for a public/-relative asset path"""
+    if relative_path.startswith("pokemon_images/"):
+        for directory in POKEMON_IMAGE_DIRS:
+            candidate = directory / relative_path.split("/", 1)[1]
+            if candidate.exists():
+                return candidate
+        return POKEMON_IMAGE_DIRS[0] / relative_path.split("/", 1)[1]
+    return PUBLIC_DIR / relative_path
+
+
+def pokemon_images():
+    """{pokemon_<id>: pokemon_images/<file>} from the artwork on disk (001_bulbasaur.png -> pokemon_1)"""
+    images = {}
+    for directory in POKEMON_IMAGE_DIRS:
+        for path in sorted(directory.glob("[0-9][0-9][0-9]_*.png")):
+            images.setdefault(f"pokemon_{int(path.name[:3])}", f"pokemon_images/{path.name}")
+    return images
+
+
+def pokeball_images():
+    images = dict(POKEBALL_SPRITES)
+    for name in OTHER_POKEBALLS:
+        images[f"pokeball_{name}"] = f"pokeball_sprites/{name}.png"
+    return images
+
+
+def type_icon_images():
+    return {f"type_{type_id}": f"type_icons_circular/{type_id}.png"
+            for type_id in range(1, NUM_TYPES + 1)}
+
+
+def boot_images():
+    """Every image BootScene loads, grouped: {group: {key: public/-relative path}}"""
+    return {
+        "pokemon": pokemon_images(),
+        "pokeballs": pokeball_images(),
+        "types": type_icon_images(),
+        "ui": dict(UI_IMAGES),
+        "minigame_icons": dict(MINIGAME_ICONS),
+    }
+
+
+def letter_audio():
+    return {f"letter_audio_{letter}": f"letter_audio/{letter}.mp3" for letter in LETTERS}
+
+
+def direction_audio():
+    return {f"direction_audio_{d}": f"direction_audio/{d}.mp3" for d in DIRECTIONS}
+
+
+def number_audio(numbers=BOOT_NUMBERS):
+    return {f"number_audio_{n}": f"number_audio/{n}.mp3" for n in numbers}
+
+
+def word_audio():
+    """{word_audio_<word>: word_audio/<word>.mp3} from the clips on disk (BootScene uses getAllWords())"""
+    return {f"word_audio_{path.stem}": f"word_audio/{path.name}"
+            for path in sorted((PUBLIC_DIR / "word_audio").glob("*.mp3"))}
+
+
+def day_audio():
+    return {f"day_{num}_{name}": f"day_audio/day_{num}_{name}.mp3" for num, name in DAYS}
+
+
+def shapedir_audio():
+    audio = {f"shapedir_prefix_{d}": f"shapedir_audio/shapedir_prefix_{d}.mp3" for d in DIRECTIONS}
+    for color in SHAPEDIR_COLORS:
+        for shape in SHAPEDIR_SHAPES:
+            audio[f"shapedir_{color}_{shape}"] = f"shapedir_audio/shapedir_{color}_{shape}.mp3"
+    return audio
+
+
+def pokemon_audio():
+    """{pokemon_audio_<id>: pokemon_audio/<file>} from the clips on disk (001_bulbasaur.mp3 -> 1)"""
+    return {f"pokemon_audio_{int(path.name[:3])}": f"pokemon_audio/{path.name}"
+            for path in sorted((PUBLIC_DIR / "pokemon_audio").glob("[0-9][0-9][0-9]_*.mp3"))}
+
+
+def boot_audio():
+    """Every audio clip BootScene loads, grouped: {group: {key: public/-relative path}}"""
+    return {
+        "pokemon": pokemon_audio(),
+        "letters": letter_audio(),
+        "directions": direction_audio(),
+        "numbers": number_audio(),
+        "words": word_audio(),
+        "days": day_audio(),
+        "shapedir": shapedir_audio(),
+    }
+
+
+def boot_requests():
+    """
+    Every asset BootScene.preload requests, by category: {category: {key: path}}.
+
+    Unlike boot_images()/boot_audio(), Pokemon and words are resolved the way
+    BootScene does it - from POKEMON_DATA and SPEECH_VOCABULARY (read with
+    js_sources) - so files missing on disk still show up as requests.
+    """
+    import js_sources
+
+    pokemon = js_sources.pokemon_data()
+    return {
+        "pokemon_images": {f"pokemon_{p['id']}": f"pokemon_images/{p['filename']}" for p in pokemon},
+        "pokeballs": pokeball_images(),
+        "ui": dict(UI_IMAGES),
+        "type_icons": type_icon_images(),
+        "pokemon_audio": {f"pokemon_audio_{p['id']}":
+                          f"pokemon_audio/{p['id']:03d}_{p['name'].lower().replace('-', '', 1)}.mp3"
+                          for p in pokemon},
+        "letter_audio": letter_audio(),
+        "direction_audio": direction_audio(),
+        "number_audio": number_audio(),
+        "word_audio": {f"word_audio_{word}": f"word_audio/{word}.mp3"
+                       for word in js_sources.speech_words()},
+        "day_audio": day_audio(),
+        "shapedir_audio": shapedir_audio(),
+        "minigame_icons": dict(MINIGAME_ICONS),
+    }
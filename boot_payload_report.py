@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Report what BootScene downloads before the first screen, against a budget
+Output: a per-category report; exit status 1 when boot_budget.json is exceeded
+
+The request list is resolved statically with the same keys and paths as
+src/scenes/BootScene.js (boot_assets.boot_requests), and sized from the
+files on disk. Files that are not on disk (pokemon_images/ is downloaded
+separately) are still counted as requests and sized with the per-file
+estimate from the budget's "estimated_bytes", marked "est.".
+
+Load time is projected per network profile as
+
+    transfer (bytes / bandwidth) + round trips (ceil(requests / parallel) x RTT)
+
+with `parallel_requests` concurrent downloads (browsers open 6 connections
+per host over HTTP/1.1). It is a rough lower bound, meant to show trends.
+
+boot_budget.json (checked in) holds the limits: total requests and bytes,
+bytes per category, and seconds per profile. Raise them deliberately, in
+the same commit that grows the boot payload.
+
+    python boot_payload_report.py
+    python boot_payload_report.py --profile 3g=1.6:300 --json
+"""
+
+import argparse
+import json
+import math
+import sys
+
+import boot_assets
+
+BUDGET_FILE = "boot_budget.json"
+
+
+def load_budget(path=BUDGET_FILE):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def parse_profile(value):
+    """'name=mbps:rtt_ms' -> (name, {"mbps": float, "rtt_ms": float})"""
+    try:
+        name, spec = value.split("=", 1)
+        mbps, rtt_ms = spec.split(":", 1)
+        return name, {"mbps": float(mbps), "rtt_ms": float(rtt_ms)}
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected name=mbps:rtt_ms, got {value!r}") from None
+
+
+def payload(requests, estimated_bytes):
+    """Per-category request count and bytes. Duplicate URLs are fetched once"""
+    categories = {}
+    for category, assets in requests.items():
+        urls = sorted(set(assets.values()))
+        stats = {"keys": len(assets), "requests": len(urls), "bytes": 0, "missing": 0, "estimated": False}
+        for url in urls:
+            path = boot_assets.resolve(url)
+            if path.exists():
+                stats["bytes"] += path.stat().st_size
+            else:
+                stats["missing"] += 1
+                if category in estimated_bytes:
+                    stats["bytes"] += estimated_bytes[category]
+                    stats["estimated"] = True
+        categories[category] = stats
+    return categories
+
+
+def project_seconds(total_requests, total_bytes, profile, parallel):
+    transfer = total_bytes * 8 / (profile["mbps"] * 1_000_000)
+    round_trips = math.ceil(total_requests / max(1, parallel)) * profile["rtt_ms"] / 1000
+    return round(transfer + round_trips, 2)
+
+
+def check_budget(report, budget):
+    """Budget violations as messages (empty when within budget)"""
+    violations = []
+    if report["requests"] > budget.get("max_requests", math.inf):
+        violations.append(f"{report['requests']} requests > {budget['max_requests']}")
+    if report["bytes"] > budget.get("max_bytes", math.inf):
+        violations.append(f"{report['bytes'] / 1024:.0f} KB > {budget['max_bytes'] / 1024:.0f} KB")
+    for category, limit in budget.get("categories", {}).items():
+        stats = report["categories"].get(category)
+        if stats and stats["bytes"] > limit:
+            violations.append(f"{category}: {stats['bytes'] / 1024:.0f} KB > {limit / 1024:.0f} KB")
+    for profile, limit in budget.get("max_seconds", {}).items():
+        seconds = report["projected_seconds"].get(profile)
+        if seconds is not None and seconds > limit:
+            violations.append(f"{profile}: {seconds:.1f}s > {limit}s")
+    return violations
+
+
+def build_report(budget, extra_profiles=()):
+    categories = payload(boot_assets.boot_requests(), budget.get("estimated_bytes", {}))
+    requests = sum(c["requests"] for c in categories.values())
+    total_bytes = sum(c["bytes"] for c in categories.values())
+    profiles = {**budget.get("profiles", {}), **dict(extra_profiles)}
+    parallel = budget.get("parallel_requests", 6)
+    report = {
+        "requests": requests,
+        "bytes": total_bytes,
+        "categories": categories,
+        "parallel_requests": parallel,
+        "profiles": profiles,
+        "projected_seconds": {name: project_seconds(requests, total_bytes, profile, parallel)
+                              for name, profile in profiles.items()},
+    }
+    report["violations"] = check_budget(report, budget)
+    return report
+
+
+def print_report(report, budget):
+    limits = budget.get("categories", {})
+    print(f"{'Category':<18} {'Requests':>9} {'Size':>10} {'Budget':>10}")
+    for category, s in sorted(report["categories"].items(), key=lambda item: -item[1]["bytes"]):
+        limit = f"{limits[category] / 1024:>8.0f}KB" if category in limits else f"{'-':>10}"
+        notes = []
+        if s["keys"] != s["requests"]:
+            notes.append(f"{s['keys'] - s['requests']} duplicate URLs")
+        if s["missing"]:
+            notes.append(f"{s['missing']} not on disk{', est.' if s['estimated'] else ''}")
+        print(f"{category:<18} {s['requests']:>9} {s['bytes'] / 1024:>8.0f}KB {limit}"
+              f"{'  (' + '; '.join(notes) + ')' if notes else ''}")
+    print(f"{'Total':<18} {report['requests']:>9} {report['bytes'] / 1024:>8.0f}KB")
+
+    print(f"\nProjected boot download ({report['parallel_requests']} parallel requests):")
+    max_seconds = budget.get("max_seconds", {})
+    for name, seconds in report["projected_seconds"].items():
+        profile = report["profiles"][name]
+        limit = f" (budget {max_seconds[name]}s)" if name in max_seconds else ""
+        print(f"  {name:<10} {profile['mbps']:>6g} Mbit/s {profile['rtt_ms']:>5g} ms RTT  "
+              f"{seconds:>7.1f}s{limit}")
+
+    print()
+    for violation in report["violations"]:
+        print(f"✗ Over budget: {violation}")
+    if not report["violations"]:
+        print("✓ Within budget")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Boot payload size and projected load time vs. budget")
+    parser.add_argument("--budget", default=BUDGET_FILE, help=f"Budget file (default: {BUDGET_FILE})")
+    parser.add_argument("--profile", type=parse_profile, action="append", default=[],
+                        help="Extra network profile name=mbps:rtt_ms (repeatable), e.g. 3g=1.6:300")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    budget = load_budget(args.budget)
+    report = build_report(budget, args.profile)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report, budget)
+    if report["violations"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
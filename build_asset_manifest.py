@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Content-hashed copies of public/ for immutable HTTP caching
+Output: dist/h/{hash}{ext} + dist/asset-manifest.json
+
+Every file under public/ is published a second time under a name derived
+from its content (dist/h/3f2a9c81d04e7b65.mp3), and asset-manifest.json
+maps the logical path the game uses to that URL:
+
+    {"assets": {"number_audio/12.mp3": "h/3f2a9c81d04e7b65.mp3", ...}}
+
+Hashed URLs never change content, so they can be served with
+Cache-Control: public, max-age=31536000, immutable.
+
+- Byte-identical files share one hashed file
+- Hashed files are copies of the source. --link hardlinks them instead to
+  save disk space; linked files share an inode with public/, so an
+  in-place rewrite there would change an "immutable" URL, and existing
+  linked files are re-hashed on every run and republished if they drifted
+- Hashes are cached in .build_cache/asset_hashes.json by size and mtime,
+  so only new or modified files are read on reruns
+- Hashed files no longer referenced by the manifest are removed
+
+Run after `npm run build` (Vite empties dist/ on every build).
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+PUBLIC_DIR = Path("public")
+OUTPUT_DIR = Path("dist")
+HASHED_SUBDIR = "h"
+MANIFEST_NAME = "asset-manifest.json"
+HASH_CACHE = Path(".build_cache") / "asset_hashes.json"
+HASH_LENGTH = 16
+
+
+def walk_assets(public_dir):
+    """Logical paths (relative to public_dir, '/'-separated) of every published file"""
+    for root, dirs, files in os.walk(public_dir):
+        # Hidden files and directories (temp files from other build steps) are not published
+        dirs[:] = sorted(d for d in dirs if not d.startswith("."))
+        for name in sorted(files):
+            if not name.startswith("."):
+                yield Path(root, name).relative_to(public_dir).as_posix()
+
+
+def hash_file(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def hash_assets(public_dir, paths, cache, workers=None):
+    """
+    {logical path: sha256} for `paths`, re-reading only files whose size or
+    mtime changed since they were cached. Updates `cache` in place.
+    """
+    hashes = {}
+    stale = []
+    for path in paths:
+        stat = (public_dir / path).stat()
+        signature = [stat.st_size, stat.st_mtime_ns]
+        entry = cache.get(path)
+        if entry and entry[:2] == signature:
+            hashes[path] = entry[2]
+        else:
+            stale.append((path, signature))
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        digests = pool.map(lambda item: hash_file(public_dir / item[0]), stale)
+        for (path, signature), digest in zip(stale, digests):
+            cache[path] = signature + [digest]
+            hashes[path] = digest
+
+    # Forget files that no longer exist
+    for path in set(cache) - set(paths):
+        del cache[path]
+
+    return hashes, len(stale)
+
+
+def hashed_name(path, digest):
+    # Keep the extension so servers still pick the right Content-Type
+    return f"{HASHED_SUBDIR}/{digest[:HASH_LENGTH]}{Path(path).suffix}"
+
+
+def publish(source, target, link=False):
+    """Copy (or hardlink) source to target, atomically"""
+    tmp_path = target.with_name(f".{target.name}.tmp")
+    if tmp_path.exists():
+        tmp_path.unlink()
+    if link:
+        try:
+            os.link(source, tmp_path)
+            os.replace(tmp_path, target)
+            return
+        except OSError:
+            pass  # Different filesystem, or links not supported - copy instead
+    shutil.copyfile(source, tmp_path)
+    os.replace(tmp_path, target)
+
+
+def is_current(target, digest, link=False):
+    """Whether an already published target can be kept as is"""
+    if not target.exists():
+        return False
+    if target.stat().st_nlink == 1:
+        return True  # A private copy - nothing else writes to it
+    if not link:
+        return False  # Hardlinked by an earlier --link run - replace with a copy
+    # Shares an inode with a file that may have been rewritten in place since
+    return hash_file(target) == digest
+
+
+def load_json(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_json(path, data, indent=None):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=indent, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def build_manifest(public_dir=PUBLIC_DIR, output_dir=OUTPUT_DIR, link=False, workers=None):
+    """Publish hashed files and write the manifest. Returns a stats dict"""
+    paths = list(walk_assets(public_dir))
+    cache = load_json(HASH_CACHE)
+    hashes, rehashed = hash_assets(public_dir, paths, cache, workers)
+
+    hashed_dir = output_dir / HASHED_SUBDIR
+    hashed_dir.mkdir(parents=True, exist_ok=True)
+
+    assets = {}
+    published = {}  # hashed name -> first logical path with that content
+    written = 0
+    duplicate_bytes = 0
+    for path in paths:
+        name = hashed_name(path, hashes[path])
+        assets[path] = name
+        if name in published:
+            duplicate_bytes += (public_dir / path).stat().st_size
+            continue
+        published[name] = path
+        target = output_dir / name
+        if not is_current(target, hashes[path], link):
+            publish(public_dir / path, target, link)
+            written += 1
+
+    # Remove hashed files from earlier builds that nothing references any more
+    removed = 0
+    for target in hashed_dir.iterdir():
+        if f"{HASHED_SUBDIR}/{target.name}" not in published:
+            target.unlink()
+            removed += 1
+
+    save_json(output_dir / MANIFEST_NAME, {"assets": assets}, indent=1)
+    save_json(HASH_CACHE, cache)
+
+    return {
+        "files": len(paths),
+        "unique": len(published),
+        "rehashed": rehashed,
+        "written": written,
+        "removed": removed,
+        "duplicate_bytes": duplicate_bytes,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Publish content-hashed copies of public/ with a manifest")
+    parser.add_argument("--public-dir", type=Path, default=PUBLIC_DIR,
+                        help=f"Static asset root (default: {PUBLIC_DIR})")
+    parser.add_argument("--output-dir", type=Path, default=OUTPUT_DIR,
+                        help=f"Where h/ and {MANIFEST_NAME} are written (default: {OUTPUT_DIR})")
+    parser.add_argument("--link", action="store_true",
+                        help="Hardlink files instead of copying (saves disk space, re-verified each run)")
+    parser.add_argument("--workers", type=int, default=None, help="Hashing threads (default: auto)")
+    args = parser.parse_args()
+
+    print(f"Hashing assets in {args.public_dir}/...")
+    stats = build_manifest(args.public_dir, args.output_dir, args.link, args.workers)
+
+    print(f"✓ {stats['files']} files ({stats['rehashed']} re-hashed), {stats['unique']} unique")
+    print(f"  {stats['written']} hashed files written, {stats['removed']} stale removed")
+    if stats["duplicate_bytes"]:
+        print(f"  Deduplicated {stats['files'] - stats['unique']} identical files "
+              f"({stats['duplicate_bytes'] / 1024:.0f} KB)")
+    print(f"Manifest: {args.output_dir / MANIFEST_NAME}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Index duration, onset, peak and loudness of every game audio clip
+Output: public/audio_index.json
+
+Every clip under public/*_audio (.mp3 and .ogg) is decoded once and
+measured:
+
+    {"clips": {"number_audio/12.mp3": {"duration": 0.912, "onset": 0.048, "end": 0.861,
+                                       "peak_db": -1.2, "loudness_lufs": -17.4,
+                                       "tail_db": -62.0, "sample_rate": 24000,
+                                       "sha256": "3f2a9c81d04e7b65"}, ...}}
+
+- duration       length of the decoded clip (s)
+- onset / end    first and last audible instant (s, same -50 dBFS threshold
+                 as trim_audio_silence.py); null for a silent clip
+- peak_db        sample peak (dBFS)
+- loudness_lufs  gated integrated loudness (ITU-R BS.1770); null if silent
+- tail_db        peak of the last 10 ms - a clip that is still loud there
+                 was probably cut off mid-word
+
+Keys are the paths the game loads (relative to public/), so playback can be
+chained on known durations instead of `complete` events, and later build
+stages can validate clips without decoding them again.
+
+Measurements are cached in .build_cache/audio_index.json by content hash:
+only new or changed clips are decoded on reruns.
+Requires: pip install numpy, and ffmpeg on the PATH.
+
+    python build_audio_index.py            # index public/*_audio
+    python build_audio_index.py --check    # also fail on silent, truncated or late-starting clips
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import audio_pcm
+import build_events
+
+PUBLIC_DIR = Path("public")
+OUTPUT_FILE = PUBLIC_DIR / "audio_index.json"
+CACHE_FILE = Path(".build_cache") / "audio_index.json"
+AUDIO_EXTENSIONS = (".mp3", ".ogg")
+OPUS_SAMPLE_RATE = 48000  # Opus always decodes at 48 kHz
+
+THRESHOLD_DB = audio_pcm.SILENCE_THRESHOLD_DB
+TRUNCATED_TAIL_DB = -30.0  # --check: a last 10 ms this loud means the clip ends mid-sound
+MAX_ONSET = 0.5            # --check: seconds of leading silence before a clip is flagged
+
+
+def default_directories():
+    return sorted(str(p) for p in PUBLIC_DIR.glob("*_audio") if p.is_dir())
+
+
+def audio_files(directories):
+    files = []
+    for directory in directories:
+        files += sorted(p for p in Path(directory).iterdir()
+                        if p.suffix in AUDIO_EXTENSIONS and not p.name.startswith("."))
+    return files
+
+
+def public_path(path):
+    """Path as the game loads it (relative to public/)"""
+    try:
+        return path.resolve().relative_to(PUBLIC_DIR.resolve()).as_posix()
+    except ValueError:
+        return path.as_posix()
+
+
+def hash_file(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def measure(path):
+    """Metadata dict for one clip"""
+    with build_events.asset(path) as event:
+        event.cache = "miss"
+        with event.stage("decode"):
+            sample_rate = OPUS_SAMPLE_RATE if path.suffix == ".ogg" else None
+            samples, sample_rate = audio_pcm.decode(path, sample_rate=sample_rate)
+
+        with event.stage("analyse"):
+            levels = audio_pcm.window_levels_db(samples, sample_rate)
+            bounds = audio_pcm.silence_bounds(samples, sample_rate, THRESHOLD_DB)
+            loudness = audio_pcm.integrated_loudness(samples, sample_rate)
+            peak = float(abs(samples).max()) if len(samples) else 0.0
+
+        return {
+            "duration": round(len(samples) / sample_rate, 3),
+            "onset": round(bounds[0], 3) if bounds else None,
+            "end": round(bounds[1], 3) if bounds else None,
+            "peak_db": round(audio_pcm.amplitude_db(peak), 1),
+            "loudness_lufs": round(loudness, 1) if loudness is not None else None,
+            "tail_db": round(float(levels[-1]), 1),
+            "sample_rate": sample_rate,
+        }
+
+
+def measure_worker(args):
+    """Process pool entry point: never raises, reports errors as a string"""
+    path, digest = args
+    try:
+        return path, digest, measure(path), None
+    except (subprocess.CalledProcessError, OSError) as e:
+        return path, digest, None, str(e)
+
+
+def problems(meta):
+    """Reasons a clip fails --check (empty list when it is fine)"""
+    if meta["onset"] is None:
+        return ["silent"]
+    found = []
+    if meta["tail_db"] > TRUNCATED_TAIL_DB:
+        found.append(f"ends at {meta['tail_db']} dBFS (truncated?)")
+    if meta["onset"] > MAX_ONSET:
+        found.append(f"starts after {meta['onset']}s of silence")
+    return found
+
+
+def load_json(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_json(path, data, indent=None):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=indent, sort_keys=True, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def build_index(directories, workers=None, force=False):
+    """
+    ({public path: metadata}, {public path: decode error}) for every clip,
+    decoding only clips not in the cache
+    """
+    files = audio_files(directories)
+    cache = {} if force else load_json(CACHE_FILE)
+    digests = {path: hash_file(path) for path in files}
+    pending = sorted({digest: path for path, digest in digests.items() if digest not in cache}.items())
+
+    print(f"Indexing {len(files)} clips in {len(directories)} directories "
+          f"({len(pending)} to decode, {len(files) - len(pending)} cached)...")
+
+    failed = {}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for path, digest, meta, error in pool.map(measure_worker, [(p, d) for d, p in pending]):
+            if error:
+                failed[digest] = error
+                print(f"✗ Failed to decode {path}: {error}")
+            else:
+                cache[digest] = meta
+
+    # Keep only measurements of clips that still exist
+    live = set(digests.values())
+    save_json(CACHE_FILE, {digest: meta for digest, meta in cache.items() if digest in live})
+
+    clips = {public_path(path): {**cache[digest], "sha256": digest[:16]}
+             for path, digest in digests.items() if digest not in failed}
+    # Every copy of an undecodable file fails, not just the one that was decoded
+    failures = {public_path(path): failed[digest] for path, digest in digests.items() if digest in failed}
+    return clips, failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Index duration, onset, peak and loudness of audio clips")
+    parser.add_argument("directories", nargs="*", default=None,
+                        help="Audio directories to index (default: public/*_audio)")
+    parser.add_argument("--output", type=Path, default=OUTPUT_FILE, help=f"Index file (default: {OUTPUT_FILE})")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: one per CPU)")
+    parser.add_argument("--force", action="store_true", help="Decode every clip, ignoring the cache")
+    parser.add_argument("--check", action="store_true",
+                        help="Exit non-zero if any clip is silent, truncated or starts late")
+    args = parser.parse_args()
+
+    clips, failures = build_index(args.directories or default_directories(), args.workers, args.force)
+    save_json(args.output, {"clips": clips}, indent=1)
+
+    total = sum(meta["duration"] for meta in clips.values())
+    print(f"✓ Indexed {len(clips)} clips ({total:.0f}s of audio) -> {args.output}")
+
+    flagged = {path: problems(meta) for path, meta in sorted(clips.items())}
+    flagged = {path: found for path, found in flagged.items() if found}
+    flagged.update((path, ["failed to decode"]) for path in sorted(failures))
+    for path, found in flagged.items():
+        print(f"✗ {path}: {', '.join(found)}")
+    if args.check and flagged:
+        print(f"\n✗ {len(flagged)} clips failed the check")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
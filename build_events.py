@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+Per-asset timing and event log shared by the build scripts
+
+Set BUILD_EVENTS to turn it on; every script then appends one JSON line
+per asset it handles:
+
+    BUILD_EVENTS=1 python generate_number_audio.py          # .build_cache/events.jsonl
+    BUILD_EVENTS=/tmp/run.jsonl python fetch_pokemon_data.py
+
+    {"ts": 1760000000.1, "script": "generate_number_audio", "key": "public/number_audio/12.mp3",
+     "stages": {"tts": 0.412}, "total_s": 0.413, "bytes": 9504, "retries": 0, "cache": "miss",
+     "status": "ok"}
+
+Scripts use it like this:
+
+    with build_events.asset(filename) as event:
+        with event.stage("ffmpeg"):
+            ...
+        event.bytes = os.path.getsize(filename)
+        event.cache = "miss"
+
+When BUILD_EVENTS is unset, asset() returns a shared no-op object, so the
+cost is one attribute lookup per call. Worker processes inherit the
+setting and append to the same file (one write per line).
+
+Summarize a log with per-stage percentiles and the slowest assets:
+
+    python build_events.py summary [.build_cache/events.jsonl] [--top 10] [--script NAME]
+"""
+
+import argparse
+import json
+import math
+import os
+import sys
+import threading
+import time
+from contextlib import nullcontext
+
+DEFAULT_LOG = os.path.join(".build_cache", "events.jsonl")
+
+
+def log_path():
+    """Event log path from BUILD_EVENTS, or None when logging is off"""
+    value = os.environ.get("BUILD_EVENTS", "")
+    if value in ("", "0"):
+        return None
+    return DEFAULT_LOG if value == "1" else value
+
+
+_path = log_path()
+_lock = threading.Lock()
+_file = None
+_script = os.path.splitext(os.path.basename(sys.argv[0] or "python"))[0]
+
+
+def enabled():
+    return _path is not None
+
+
+def _write(event):
+    global _file
+    line = json.dumps(event, ensure_ascii=False, separators=(",", ":")) + "\n"
+    with _lock:
+        if _file is None or _file.closed:
+            os.makedirs(os.path.dirname(_path) or ".", exist_ok=True)
+            _file = open(_path, "a", encoding="utf-8", buffering=1)
+        _file.write(line)
+
+
+class AssetEvent:
+    """Timings and counters for one asset; written when the `with` block exits"""
+
+    def __init__(self, key, **fields):
+        self.key = str(key)
+        self.stages = {}
+        self.bytes = None
+        self.retries = 0
+        self.cache = None
+        self.status = "ok"
+        self.fields = fields
+        self._start = None
+
+    def stage(self, name):
+        return _Stage(self, name)
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None and self.status == "ok":
+            self.status = "error"
+        event = {
+            "ts": round(time.time(), 3),
+            "script": _script,
+            "key": self.key,
+            "stages": {name: round(seconds, 4) for name, seconds in self.stages.items()},
+            "total_s": round(time.perf_counter() - self._start, 4),
+            "bytes": self.bytes,
+            "retries": self.retries,
+            "cache": self.cache,
+            "status": self.status,
+        }
+        event.update(self.fields)
+        _write(event)
+        return False
+
+
+class _Stage:
+    __slots__ = ("event", "name", "start")
+
+    def __init__(self, event, name):
+        self.event = event
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, exc_type, exc, tb):
+        elapsed = time.perf_counter() - self.start
+        self.event.stages[self.name] = self.event.stages.get(self.name, 0.0) + elapsed
+        return False
+
+
+class _NullEvent:
+    """Stand-in when logging is off: accepts everything, records nothing"""
+
+    bytes = retries = cache = status = None
+
+    def stage(self, name):
+        return nullcontext()
+
+    def __setattr__(self, name, value):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_EVENT = _NullEvent()
+
+
+def asset(key, **fields):
+    """Context manager timing one asset (extra fields are copied into the event)"""
+    if _path is None:
+        return _NULL_EVENT
+    return AssetEvent(key, **fields)
+
+
+def record(key, stages=None, bytes=None, retries=0, cache=None, status="ok", **fields):
+    """Write one event for an asset timed elsewhere"""
+    if _path is None:
+        return
+    stages = {name: round(seconds, 4) for name, seconds in (stages or {}).items()}
+    event = {
+        "ts": round(time.time(), 3),
+        "script": _script,
+        "key": str(key),
+        "stages": stages,
+        "total_s": round(sum(stages.values()), 4),
+        "bytes": bytes,
+        "retries": retries,
+        "cache": cache,
+        "status": status,
+    }
+    event.update(fields)
+    _write(event)
+
+
+# ---------------------------------------------------------------------------
+# Summary
+
+def read_events(path, script=None):
+    events = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                event = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # a line cut short by a crash
+            if script is None or event.get("script") == script:
+                events.append(event)
+    return events
+
+
+def percentile(sorted_values, p):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = math.ceil(p / 100 * len(sorted_values))
+    return sorted_values[min(len(sorted_values), max(1, rank)) - 1]
+
+
+def summarize(events, top=10):
+    """Per (script, stage) percentiles, cache/status counts and the slowest assets"""
+    by_stage = {}
+    counts = {}
+    for event in events:
+        script = event.get("script", "?")
+        stats = counts.setdefault(script, {"assets": 0, "bytes": 0, "retries": 0, "cache": {},
+                                           "status": {}})
+        stats["assets"] += 1
+        stats["bytes"] += event.get("bytes") or 0
+        stats["retries"] += event.get("retries") or 0
+        cache = event.get("cache") or "-"
+        stats["cache"][cache] = stats["cache"].get(cache, 0) + 1
+        status = event.get("status") or "ok"
+        stats["status"][status] = stats["status"].get(status, 0) + 1
+
+        by_stage.setdefault((script, "total"), []).append(event.get("total_s", 0.0))
+        for stage, seconds in (event.get("stages") or {}).items():
+            by_stage.setdefault((script, stage), []).append(seconds)
+
+    stages = {}
+    for (script, stage), values in sorted(by_stage.items()):
+        values.sort()
+        stages[f"{script}:{stage}"] = {
+            "count": len(values),
+            "sum_s": round(sum(values), 3),
+            "p50_s": percentile(values, 50),
+            "p90_s": percentile(values, 90),
+            "p99_s": percentile(values, 99),
+            "max_s": values[-1],
+        }
+
+    slowest = sorted(events, key=lambda e: e.get("total_s", 0.0), reverse=True)[:top]
+    return {"scripts": counts, "stages": stages, "slowest": slowest}
+
+
+def print_summary(summary):
+    for script, stats in sorted(summary["scripts"].items()):
+        cache = ", ".join(f"{k} {v}" for k, v in sorted(stats["cache"].items()))
+        status = ", ".join(f"{k} {v}" for k, v in sorted(stats["status"].items()))
+        print(f"{script}: {stats['assets']} assets, {stats['bytes'] / 1024:.0f} KB, "
+              f"{stats['retries']} retries | cache: {cache} | {status}")
+
+    print(f"\n{'Stage':<40} {'Count':>6} {'Sum':>9} {'p50':>8} {'p90':>8} {'p99':>8} {'Max':>8}")
+    for name, s in summary["stages"].items():
+        print(f"{name:<40} {s['count']:>6} {s['sum_s']:>8.2f}s {s['p50_s']:>7.3f}s "
+              f"{s['p90_s']:>7.3f}s {s['p99_s']:>7.3f}s {s['max_s']:>7.3f}s")
+
+    print("\nSlowest assets:")
+    for event in summary["slowest"]:
+        stages = ", ".join(f"{k} {v:.3f}s" for k, v in (event.get("stages") or {}).items())
+        print(f"  {event.get('total_s', 0):>7.3f}s  {event.get('script')}  {event.get('key')}"
+              f"{f'  ({stages})' if stages else ''}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build event log tools")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    summary = commands.add_parser("summary", help="Per-stage percentiles and slowest assets")
+    summary.add_argument("log", nargs="?", default=log_path() or DEFAULT_LOG)
+    summary.add_argument("--top", type=int, default=10, help="Slowest assets to list (default: 10)")
+    summary.add_argument("--script", default=None, help="Only events from this script")
+    summary.add_argument("--json", action="store_true", help="Print the summary as JSON")
+
+    clear = commands.add_parser("clear", help="Delete the event log")
+    clear.add_argument("log", nargs="?", default=log_path() or DEFAULT_LOG)
+
+    args = parser.parse_args()
+
+    if args.command == "clear":
+        if os.path.exists(args.log):
+            os.remove(args.log)
+        print(f"✓ Cleared {args.log}")
+        return
+
+    if not os.path.exists(args.log):
+        print(f"✗ No event log at {args.log} - run a build script with BUILD_EVENTS=1 first")
+        sys.exit(1)
+    result = summarize(read_events(args.log, args.script), args.top)
+    if args.json:
+        print(json.dumps(result, indent=2, ensure_ascii=False))
+    else:
+        print_summary(result)
+
+
+if __name__ == "__main__":
+    main()
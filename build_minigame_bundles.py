@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Split BootScene's assets into a core bundle and per-minigame lazy bundles
+Output: public/bundles/{core,<minigame>}.json + public/bundles/index.json
+
+BootScene preloads every clip for every minigame before the first screen.
+This stage maps each minigame to the assets it plays and writes one
+Phaser asset pack per bundle:
+
+    this.load.pack('core', 'bundles/core.json', 'core');                        // BootScene
+    this.load.pack('numberListening', 'bundles/numberListening.json', 'numberListening');
+
+- core: what the main scene, Pokedex, store and wheel need (Pokemon
+  artwork and names, letter clips, pokeballs, UI and type icons, minigame
+  icons)
+- one bundle per minigame with a weight > 0 in public/config/minigames.json,
+  holding only what that minigame needs beyond core (number clips follow
+  the configured number ranges)
+
+index.json lists the lazy bundles by descending weight (the order to
+prefetch them in after boot) and the disabled minigames, whose bundles are
+not written at all.
+"""
+
+import argparse
+import json
+import os
+
+import boot_assets
+from minigame_config import (CONFIG_PATH, EXTRA_NUMBER_CLIPS, configured_numbers, load_config,
+                             number_clips_for)
+
+OUTPUT_DIR = boot_assets.PUBLIC_DIR / "bundles"
+
+# Same defaults PokeballGameScene.selectRandomGameMode merges config.weights into
+DEFAULT_WEIGHTS = {
+    "letterListening": 10,
+    "wordEmoji": 10,
+    "emojiWord": 10,
+    "leftRight": 10,
+    "letterDragMatch": 10,
+    "speechRecognition": 10,
+    "numberListening": 10,
+    "numberReading": 10,
+    "wordSpelling": 40,
+    "legendary": 10,
+    "legendaryNumbers": 10,
+    "dayMatch": 10,
+    "addition": 10,
+    "shapeDirections": 10,
+}
+
+
+def number_clips(numbers):
+    clips = set()
+    for number in numbers:
+        clips.update(number_clips_for(number))
+    return boot_assets.number_audio(sorted(clips))
+
+
+def minigame_audio(config):
+    """{minigame: {key: path}} - the clips each minigame plays"""
+    numbers = configured_numbers(config)
+    return {
+        "letterListening": boot_assets.letter_audio(),
+        "wordEmoji": {},
+        "emojiWord": {},
+        "leftRight": boot_assets.direction_audio(),
+        "letterDragMatch": boot_assets.letter_audio(),
+        "speechRecognition": {},
+        "numberListening": number_clips(numbers["numbers"]),
+        "numberReading": {},
+        "wordSpelling": {**boot_assets.letter_audio(), **boot_assets.word_audio()},
+        "legendary": boot_assets.letter_audio(),
+        "legendaryNumbers": number_clips(numbers["legendaryNumbers"]),
+        "dayMatch": boot_assets.day_audio(),
+        "addition": {},
+        "shapeDirections": boot_assets.shapedir_audio(),
+    }
+
+
+def core_assets():
+    """{"image": {...}, "audio": {...}} loaded at boot regardless of minigame"""
+    images = {}
+    for group in boot_assets.boot_images().values():
+        images.update(group)
+    # The main game opens in LetterMatchMode, which plays letter clips on its first screen
+    audio = {**boot_assets.pokemon_audio(), **boot_assets.letter_audio(),
+             **boot_assets.number_audio(EXTRA_NUMBER_CLIPS)}
+    return {"image": images, "audio": audio}
+
+
+def asset_pack(name, assets):
+    """Phaser asset pack JSON for one bundle"""
+    files = []
+    for asset_type in ("image", "audio"):
+        for key, path in sorted(assets.get(asset_type, {}).items()):
+            files.append({"type": asset_type, "key": key, "url": path})
+    return {name: {"files": files}}
+
+
+def bundle_bytes(assets):
+    total = 0
+    for group in assets.values():
+        for path in group.values():
+            file_path = boot_assets.resolve(path)
+            if file_path.exists():
+                total += file_path.stat().st_size
+    return total
+
+
+def write_json(path, data):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=1, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def build_bundles(config, output_dir=OUTPUT_DIR):
+    """Write the asset packs and index. Returns the index dict"""
+    weights = {**DEFAULT_WEIGHTS, **config.get("weights", {})}
+    core = core_assets()
+    core_keys = set(core["audio"]) | set(core["image"])
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    write_json(output_dir / "core.json", asset_pack("core", core))
+    index = {
+        "boot": ["core"],
+        "lazy": [],
+        "disabled": sorted(mode for mode, weight in weights.items() if weight <= 0),
+        "bundles": {"core": {"file": f"{output_dir.name}/core.json", "files": len(core_keys),
+                             "bytes": bundle_bytes(core)}},
+    }
+
+    enabled = [mode for mode in weights if weights[mode] > 0]
+    # Highest weight first: the most likely minigame is prefetched first
+    enabled.sort(key=lambda mode: (-weights[mode], mode))
+    audio = minigame_audio(config)
+    for mode in enabled:
+        assets = {"audio": {k: v for k, v in audio.get(mode, {}).items() if k not in core_keys}}
+        write_json(output_dir / f"{mode}.json", asset_pack(mode, assets))
+        index["lazy"].append(mode)
+        index["bundles"][mode] = {"file": f"{output_dir.name}/{mode}.json", "weight": weights[mode],
+                                  "files": len(assets["audio"]), "bytes": bundle_bytes(assets)}
+
+    # Bundles of minigames that were disabled since the last build
+    for mode in index["disabled"]:
+        stale = output_dir / f"{mode}.json"
+        if stale.exists():
+            stale.unlink()
+
+    write_json(output_dir / "index.json", index)
+    return index
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write core and per-minigame asset bundles")
+    parser.add_argument("--config", default=CONFIG_PATH,
+                        help=f"Minigame config with weights and number ranges (default: {CONFIG_PATH})")
+    args = parser.parse_args()
+
+    index = build_bundles(load_config(args.config))
+
+    boot_all = sum(bundle_bytes({"audio": group}) for group in boot_assets.boot_audio().values())
+    boot_all += bundle_bytes(boot_assets.boot_images())
+    core = index["bundles"]["core"]
+    print(f"✓ core: {core['files']} files, {core['bytes'] / 1024:.0f} KB "
+          f"(BootScene currently preloads {boot_all / 1024:.0f} KB)")
+    for mode in index["lazy"]:
+        bundle = index["bundles"][mode]
+        print(f"  {mode:<18} weight {bundle['weight']:>3}  {bundle['files']:>4} files  "
+              f"{bundle['bytes'] / 1024:>6.0f} KB")
+    for mode in index["disabled"]:
+        print(f"✗ {mode} disabled (weight 0) - no bundle")
+    print(f"\nIndex: {OUTPUT_DIR / 'index.json'}")
+
+
+if __name__ == "__main__":
+    main()
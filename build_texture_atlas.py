@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Pack BootScene's individual images into Phaser multi-atlases
+Output: public/atlases/{atlas}.json + {atlas}-{page}.png/.webp
+
+Atlases:
+- pokemon: the 151 pokemon_<id> artworks (PokedexScene scrolls through these)
+- icons:   type_<id>, pokeball_<name>, coin/dice/store/pokedex icons and
+           the game-mode-* minigame icons
+
+Frames are named by the keys BootScene already uses (see boot_assets.py),
+so the game can switch to:
+
+    this.load.multiatlas('pokemon', 'atlases/pokemon.json', 'atlases');
+    this.add.image(x, y, 'pokemon', 'pokemon_25');
+
+Packing uses MaxRects (best short side fit) over pages of at most
+--max-size pixels, with --padding pixels between frames. Transparent
+borders are trimmed (Phaser restores the source size from the JSON).
+Requires: pip install pillow
+"""
+
+import argparse
+import json
+
+from PIL import Image
+
+import boot_assets
+
+OUTPUT_DIR = boot_assets.PUBLIC_DIR / "atlases"
+MAX_SIZE = 2048
+PADDING = 2
+
+ATLASES = {
+    "pokemon": ["pokemon"],
+    "icons": ["pokeballs", "types", "ui", "minigame_icons"],
+}
+
+
+class MaxRectsBin:
+    """One atlas page, packed with the MaxRects best-short-side-fit heuristic"""
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.free = [(0, 0, width, height)]
+        self.used_width = 0
+        self.used_height = 0
+
+    def find_position(self, w, h):
+        """Best (x, y) for a w x h rect, or None if it doesn't fit"""
+        best = None
+        best_score = None
+        for fx, fy, fw, fh in self.free:
+            if w <= fw and h <= fh:
+                score = (min(fw - w, fh - h), max(fw - w, fh - h))
+                if best_score is None or score < best_score:
+                    best, best_score = (fx, fy), score
+        return best
+
+    def insert(self, w, h):
+        position = self.find_position(w, h)
+        if position is None:
+            return None
+        x, y = position
+        self._split(x, y, w, h)
+        self.used_width = max(self.used_width, x + w)
+        self.used_height = max(self.used_height, y + h)
+        return position
+
+    def _split(self, x, y, w, h):
+        new_free = []
+        for fx, fy, fw, fh in self.free:
+            # Keep free rects that don't intersect the placed rect
+            if x >= fx + fw or x + w <= fx or y >= fy + fh or y + h <= fy:
+                new_free.append((fx, fy, fw, fh))
+                continue
+            # Split the intersected free rect into up to four maximal rects
+            if x > fx:
+                new_free.append((fx, fy, x - fx, fh))
+            if x + w < fx + fw:
+                new_free.append((x + w, fy, fx + fw - (x + w), fh))
+            if y > fy:
+                new_free.append((fx, fy, fw, y - fy))
+            if y + h < fy + fh:
+                new_free.append((fx, y + h, fw, fy + fh - (y + h)))
+
+        # Drop free rects fully contained in another one
+        self.free = [
+            r for i, r in enumerate(new_free)
+            if not any(
+                i != j and r[0] >= o[0] and r[1] >= o[1]
+                and r[0] + r[2] <= o[0] + o[2] and r[1] + r[3] <= o[1] + o[3]
+                and (r != o or i > j)
+                for j, o in enumerate(new_free)
+            )
+        ]
+
+
+def load_frames(images, trim, scale):
+    """Load {key: path} into (key, image, source size, trimmed offset) tuples"""
+    frames = []
+    for key, relative_path in sorted(images.items()):
+        path = boot_assets.resolve(relative_path)
+        if not path.exists():
+            print(f"  ✗ Missing {path} ({key})")
+            continue
+        image = Image.open(path).convert("RGBA")
+        if scale != 1:
+            size = (max(1, round(image.width * scale)), max(1, round(image.height * scale)))
+            image = image.resize(size, Image.LANCZOS)
+        source_size = image.size
+        offset = (0, 0)
+        if trim:
+            bbox = image.getchannel("A").getbbox()
+            if bbox and bbox != (0, 0, *image.size):
+                image = image.crop(bbox)
+                offset = bbox[:2]
+        frames.append((key, image, source_size, offset))
+    return frames
+
+
+def pack(frames, max_size, padding):
+    """Place frames on as few pages as needed. Returns [(bin, [(frame, x, y), ...]), ...]"""
+    pages = []
+    # Big frames first packs tighter
+    for frame in sorted(frames, key=lambda f: max(f[1].size), reverse=True):
+        w, h = frame[1].width + padding, frame[1].height + padding
+        if w > max_size or h > max_size:
+            raise ValueError(f"{frame[0]} ({frame[1].width}x{frame[1].height}) is larger than "
+                             f"--max-size {max_size}")
+        for page, placed in pages:
+            position = page.insert(w, h)
+            if position:
+                placed.append((frame, *position))
+                break
+        else:
+            page = MaxRectsBin(max_size, max_size)
+            placed = [(frame, *page.insert(w, h))]
+            pages.append((page, placed))
+    return pages
+
+
+def write_atlas(name, pages, formats, output_dir):
+    """Write page images and one Phaser multiatlas JSON per image format"""
+    for fmt in formats:
+        textures = []
+        for index, (page, placed) in enumerate(pages):
+            filename = f"{name}-{index}.{fmt}"
+            sheet = Image.new("RGBA", (page.used_width, page.used_height), (0, 0, 0, 0))
+            json_frames = []
+            for (key, image, source_size, offset), x, y in placed:
+                sheet.paste(image, (x, y))
+                json_frames.append({
+                    "filename": key,
+                    "rotated": False,
+                    "trimmed": image.size != source_size,
+                    "sourceSize": {"w": source_size[0], "h": source_size[1]},
+                    "spriteSourceSize": {"x": offset[0], "y": offset[1],
+                                         "w": image.width, "h": image.height},
+                    "frame": {"x": x, "y": y, "w": image.width, "h": image.height},
+                })
+            if fmt == "webp":
+                sheet.save(output_dir / filename, "WEBP", lossless=True, method=6)
+            else:
+                sheet.save(output_dir / filename, "PNG", optimize=True)
+            textures.append({
+                "image": filename,
+                "format": "RGBA8888",
+                "size": {"w": page.used_width, "h": page.used_height},
+                "scale": 1,
+                "frames": sorted(json_frames, key=lambda f: f["filename"]),
+            })
+
+        json_name = f"{name}.json" if fmt == formats[0] else f"{name}.{fmt}.json"
+        with open(output_dir / json_name, "w", encoding="utf-8") as f:
+            json.dump({"textures": textures}, f, indent=1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pack BootScene images into Phaser multi-atlases")
+    parser.add_argument("atlases", nargs="*", default=sorted(ATLASES),
+                        help="Atlases to build (default: all)")
+    parser.add_argument("--max-size", type=int, default=MAX_SIZE,
+                        help=f"Maximum page width/height in pixels (default: {MAX_SIZE})")
+    parser.add_argument("--padding", type=int, default=PADDING,
+                        help=f"Pixels between frames (default: {PADDING})")
+    parser.add_argument("--format", choices=["png", "webp", "both"], default="png",
+                        help="Page image format (default: png; 'both' also writes {atlas}.webp.json)")
+    parser.add_argument("--scale", type=float, default=1.0,
+                        help="Scale every frame before packing (default: 1.0)")
+    parser.add_argument("--no-trim", action="store_true",
+                        help="Keep transparent borders around frames")
+    args = parser.parse_args()
+
+    formats = ["png", "webp"] if args.format == "both" else [args.format]
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    groups = boot_assets.boot_images()
+
+    for name in args.atlases:
+        if name not in ATLASES:
+            parser.error(f"unknown atlas '{name}' (choose from {', '.join(sorted(ATLASES))})")
+
+        images = {}
+        for group in ATLASES[name]:
+            images.update(groups[group])
+
+        print(f"Packing atlas '{name}' ({len(images)} images)...")
+        frames = load_frames(images, trim=not args.no_trim, scale=args.scale)
+        if not frames:
+            print(f"  ✗ No images found for '{name}'")
+            continue
+
+        pages = pack(frames, args.max_size, args.padding)
+        write_atlas(name, pages, formats, OUTPUT_DIR)
+
+        used = sum(f[1].width * f[1].height for f in frames)
+        total = sum(page.used_width * page.used_height for page, _ in pages)
+        print(f"  ✓ {len(frames)} frames on {len(pages)} page(s), "
+              f"{used / total:.0%} fill -> {OUTPUT_DIR}/{name}.json")
+
+    print("\nDone! Load with this.load.multiatlas(name, 'atlases/<name>.json', 'atlases')")
+
+
+if __name__ == "__main__":
+    main()
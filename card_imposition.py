@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Imposition engine shared by create_pokemon_cards.py and create_pokemon_backs.py
+
+Computes the card grid once for a page size, grid, margin and bleed, and
+writes sheets of fronts, mirrored backs, or both interleaved for duplex
+printing (front, back, front, back, ...).
+
+Pages are rendered in chunks of CHUNK_PAGES by a process pool, each chunk
+into its own partial PDF, and the parts are merged at the end (pip install
+pypdf). Memory stays bounded by the chunk size however many cards are
+printed. Without pypdf everything is rendered into one canvas in-process.
+
+A side is drawn by a module-level function draw(c, layout, card, x, y)
+where (x, y) is the bottom-left corner of the card's trim box.
+"""
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from reportlab.lib.pagesizes import A3, A4, A5, letter
+from reportlab.lib.units import mm
+from reportlab.pdfgen import canvas
+
+import build_events
+
+PAGE_SIZES = {
+    "a3": A3,
+    "a4": A4,
+    "a5": A5,
+    "letter": letter,
+}
+
+CHUNK_PAGES = 20
+CROP_MARK_LENGTH = 5 * mm
+CROP_MARK_OFFSET = 1 * mm
+
+
+def list_cards(image_dir):
+    """
+    Cards for every image in `image_dir`, in Pokédex order.
+
+    Filenames are 001_bulbasaur.png; each card is a dict with the image
+    path, Pokédex number and display name.
+    """
+    cards = []
+    for image_path in sorted(Path(image_dir).glob("*.png")):
+        parts = image_path.stem.split('_', 1)
+        cards.append({
+            "path": str(image_path),
+            "number": int(parts[0]) if parts[0].isdigit() else None,
+            "name": parts[1].upper() if len(parts) > 1 else "",
+        })
+    return cards
+
+
+def card_layout(page_size="a4", cards_per_row=3, cards_per_col=3, margin=10 * mm, bleed=0):
+    """
+    Grid geometry (in points) for `cards_per_row` x `cards_per_col` cards.
+
+    The usable area inside `margin` is split evenly; each cell holds a card
+    with `bleed` on every side, so the trim box is the cell minus the bleed.
+    """
+    page_width, page_height = PAGE_SIZES[page_size] if isinstance(page_size, str) else page_size
+
+    cell_width = (page_width - 2 * margin) / cards_per_row
+    cell_height = (page_height - 2 * margin) / cards_per_col
+    card_width = cell_width - 2 * bleed
+    card_height = cell_height - 2 * bleed
+    if card_width <= 0 or card_height <= 0:
+        raise ValueError(f"{cards_per_row}x{cards_per_col} cards with {bleed / mm:g} mm bleed "
+                         f"do not fit on the page")
+
+    return {
+        "page_width": page_width,
+        "page_height": page_height,
+        "margin": margin,
+        "bleed": bleed,
+        "cards_per_row": cards_per_row,
+        "cards_per_col": cards_per_col,
+        "cards_per_page": cards_per_row * cards_per_col,
+        "cell_width": cell_width,
+        "cell_height": cell_height,
+        "card_width": card_width,
+        "card_height": card_height,
+    }
+
+
+def card_origin(layout, slot, mirrored=False):
+    """
+    Bottom-left corner of the trim box for the card in grid `slot`.
+
+    Backs are mirrored horizontally: when the paper is flipped like a book
+    page, left becomes right.
+    """
+    row = slot // layout["cards_per_row"]
+    col = slot % layout["cards_per_row"]
+    if mirrored:
+        col = (layout["cards_per_row"] - 1) - col
+
+    # reportlab uses a bottom-left origin
+    x = layout["margin"] + col * layout["cell_width"] + layout["bleed"]
+    y = layout["page_height"] - layout["margin"] - (row + 1) * layout["cell_height"] + layout["bleed"]
+    return x, y
+
+
+def draw_cut_guides(c, layout, card_count, mirrored=False, crop_marks=False):
+    """Light border around each card, or crop marks in the page margin"""
+    c.setLineWidth(0.5)
+    if not crop_marks:
+        c.setStrokeColorRGB(0.8, 0.8, 0.8)
+        for slot in range(card_count):
+            x, y = card_origin(layout, slot, mirrored)
+            c.rect(x, y, layout["card_width"], layout["card_height"], stroke=1, fill=0)
+        return
+
+    # Extend every trim line into the margin (marks stay clear of the cards)
+    c.setStrokeColorRGB(0, 0, 0)
+    rows = layout["cards_per_col"]
+    cols = layout["cards_per_row"]
+    left = layout["margin"]
+    right = layout["page_width"] - layout["margin"]
+    top = layout["page_height"] - layout["margin"]
+    bottom = top - rows * layout["cell_height"]
+    start, end = CROP_MARK_OFFSET, CROP_MARK_OFFSET + CROP_MARK_LENGTH
+
+    for col in range(cols):
+        cell_x = left + col * layout["cell_width"]
+        for x in (cell_x + layout["bleed"], cell_x + layout["cell_width"] - layout["bleed"]):
+            c.line(x, top + start, x, top + end)
+            c.line(x, bottom - start, x, bottom - end)
+    for row in range(rows):
+        cell_y = top - (row + 1) * layout["cell_height"]
+        for y in (cell_y + layout["bleed"], cell_y + layout["cell_height"] - layout["bleed"]):
+            c.line(left - start, y, left - end, y)
+            c.line(right + start, y, right + end, y)
+
+
+def sheet_pages(cards, layout, sides):
+    """
+    Page list for `cards`: (side index, first card index, card count) per page.
+
+    With several sides each sheet emits one page per side in order, e.g.
+    front, back, front, back... for duplex printing.
+    """
+    per_page = layout["cards_per_page"]
+    pages = []
+    for start in range(0, len(cards), per_page):
+        count = min(per_page, len(cards) - start)
+        for side_index in range(len(sides)):
+            pages.append((side_index, start, count))
+    return pages
+
+
+def render_pages(output_pdf, layout, cards, sides, pages, crop_marks=False):
+    """Render `pages` (from sheet_pages) to `output_pdf`. Returns the number of pages written"""
+    with build_events.asset(output_pdf, pages=len(pages)) as event:
+        with event.stage("render"):
+            c = canvas.Canvas(str(output_pdf), pagesize=(layout["page_width"], layout["page_height"]))
+            for side_index, start, count in pages:
+                draw, mirrored = sides[side_index]
+                for slot in range(count):
+                    card = cards[start + slot]
+                    x, y = card_origin(layout, slot, mirrored)
+                    try:
+                        draw(c, layout, card, x, y)
+                    except Exception as e:
+                        print(f"Error processing {Path(card['path']).name}: {e}")
+                draw_cut_guides(c, layout, count, mirrored, crop_marks)
+                c.showPage()
+        with event.stage("save"):
+            c.save()
+        event.bytes = os.path.getsize(output_pdf)
+    return len(pages)
+
+
+def chunk_cards(cards, pages):
+    """Cards a chunk of pages draws, with the pages renumbered to match"""
+    first = min(start for _, start, _ in pages)
+    last = max(start + count for _, start, count in pages)
+    shifted = [(side, start - first, count) for side, start, count in pages]
+    return cards[first:last], shifted
+
+
+def merge_pdfs(parts, output_pdf):
+    from pypdf import PdfWriter
+
+    writer = PdfWriter()
+    for part in parts:
+        writer.append(str(part))
+    tmp_path = f"{output_pdf}.tmp"
+    with open(tmp_path, "wb") as f:
+        writer.write(f)
+    os.replace(tmp_path, output_pdf)
+
+
+def impose(cards, layout, output_pdf, sides, crop_marks=False, workers=None, chunk_pages=CHUNK_PAGES):
+    """
+    Write `cards` onto sheets in `output_pdf`.
+
+    Args:
+        cards: Card dicts (from list_cards, plus anything the draw functions need)
+        layout: Geometry from card_layout
+        output_pdf: Output PDF filename
+        sides: [(draw function, mirrored)] - one page per side per sheet
+        crop_marks: Draw crop marks instead of card borders
+        workers: Worker processes (default: CPU count)
+        chunk_pages: Pages per partial PDF
+
+    Returns the number of pages written.
+    """
+    pages = sheet_pages(cards, layout, sides)
+    workers = workers or os.cpu_count() or 1
+
+    try:
+        import pypdf  # noqa: F401
+    except ImportError:
+        if len(pages) > chunk_pages:
+            print("  (pypdf not installed - rendering all pages in a single process)")
+        return render_pages(output_pdf, layout, cards, sides, pages, crop_marks)
+
+    if len(pages) <= chunk_pages:
+        return render_pages(output_pdf, layout, cards, sides, pages, crop_marks)
+
+    # Chunks never split a sheet, so a front and its back stay together
+    chunk_pages = max(len(sides), chunk_pages - chunk_pages % len(sides))
+    chunks = [pages[i:i + chunk_pages] for i in range(0, len(pages), chunk_pages)]
+    tmp_dir = tempfile.mkdtemp(prefix=".sheets_", dir=os.path.dirname(os.path.abspath(output_pdf)))
+    try:
+        parts = [Path(tmp_dir) / f"part_{i:05d}.pdf" for i in range(len(chunks))]
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+            # Only ship each worker the cards its chunk draws
+            futures = [pool.submit(render_pages, part, layout, *chunk_cards(cards, chunk), sides, crop_marks)
+                       for part, chunk in zip(parts, chunks)]
+            written = 0
+            for future in futures:
+                written += future.result()
+                print(f"  Rendered {written}/{len(pages)} pages")
+        merge_pdfs(parts, output_pdf)
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    return len(pages)
@@ -1,20 +1,135 @@
 #!/usr/bin/env python3
 """
-Create a PDF with Pokémon cards in a grid layout for printing on A4 paper.
+Create a PDF with Pokémon cards in a grid layout for printing (A4 by default).
+
+Artwork is downsampled once to the print DPI of the card's image box and
+cached in .build_cache/print_images/ (keyed by image content, DPI and box
+size), so the PDF embeds print-sized images instead of the full-resolution
+originals. Sheets are laid out by card_imposition.py, which renders page
+ranges in a process pool and merges them (merging needs: pip install pypdf).
+
+--sides both also writes the mirrored backs (pokemon_backs.pdf), and
+--sides duplex writes fronts and backs interleaved in a single PDF.
 """
-from reportlab.lib.pagesizes import A4
-from reportlab.pdfgen import canvas
-from reportlab.lib.units import mm
+from reportlab.lib.units import mm, inch
 from PIL import Image
+from concurrent.futures import ProcessPoolExecutor
+import argparse
+import hashlib
+import math
 import os
 from pathlib import Path
 
+import build_events
+import card_imposition
+from create_pokemon_backs import draw_back, print_instructions
+
+PRINT_CACHE_DIR = Path(".build_cache") / "print_images"
+DEFAULT_DPI = 300
+
+# Image sizing inside each card
+IMAGE_PADDING = 5 * mm
+
+
+def image_box(layout):
+    """Width and height (in points) the artwork is fitted into"""
+    return (layout["card_width"] - (2 * IMAGE_PADDING),
+            layout["card_height"] - (2 * IMAGE_PADDING))
+
+
+def print_image(image_path, box_width, box_height, dpi, cache_dir=PRINT_CACHE_DIR):
+    """
+    Path to a copy of `image_path` downsampled to fit the box at `dpi`.
+
+    Args:
+        image_path: Source artwork
+        box_width, box_height: Box the image is drawn into, in points
+        dpi: Target print resolution
+        cache_dir: Where downsampled copies are kept between runs
+    """
+    max_width = math.ceil(box_width / inch * dpi)
+    max_height = math.ceil(box_height / inch * dpi)
+
+    with build_events.asset(image_path) as event:
+        with event.stage("hash"):
+            with open(image_path, "rb") as f:
+                digest = hashlib.sha256(f.read()).hexdigest()
+        cached = Path(cache_dir) / f"{digest[:16]}_{dpi}dpi_{max_width}x{max_height}.png"
+        if cached.exists():
+            event.cache = "hit"
+            return str(cached)
+
+        event.cache = "miss"
+        cached.parent.mkdir(parents=True, exist_ok=True)
+        with event.stage("resize"), Image.open(image_path) as image:
+            image = image.convert("RGBA")
+            image.thumbnail((max_width, max_height), Image.LANCZOS)
+            tmp_path = cached.with_name(f".{cached.name}.{os.getpid()}")
+            image.save(tmp_path, "PNG", optimize=True)
+        os.replace(tmp_path, cached)
+        event.bytes = cached.stat().st_size
+        return str(cached)
+
+
+def print_image_worker(image_path, box_width, box_height, dpi):
+    """Process pool entry point: never raises, reports errors as a string"""
+    try:
+        return print_image(image_path, box_width, box_height, dpi), None
+    except (OSError, ValueError) as e:
+        return None, str(e)
+
+
+def prepare_print_images(cards, layout, dpi, workers=None):
+    """
+    Pre-pass: downsample every card's artwork to the print size of its box.
+
+    Returns the cards whose artwork could be read; unreadable ones are
+    reported and skipped.
+    """
+    box_width, box_height = image_box(layout)
+    paths = [card["path"] for card in cards]
+    prepared = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = pool.map(print_image_worker, paths, [box_width] * len(paths),
+                           [box_height] * len(paths), [dpi] * len(paths), chunksize=8)
+        for card, (print_path, error) in zip(cards, results):
+            if error:
+                print(f"✗ Skipping {card['path']}: {error}")
+                continue
+            card["print_path"] = print_path
+            prepared.append(card)
+    return prepared
+
+
+def draw_front(c, layout, card, x, y):
+    """Draw the card's artwork centered in the trim box at (x, y)"""
+    box_width, box_height = image_box(layout)
+
+    # Draw image maintaining aspect ratio with transparency support
+    c.drawImage(
+        card.get("print_path", card["path"]),
+        x + IMAGE_PADDING,
+        y + IMAGE_PADDING,
+        width=box_width,
+        height=box_height,
+        preserveAspectRatio=True,
+        anchor='c',
+        mask='auto'  # Enable transparency
+    )
+
 
 def create_pokemon_cards_pdf(
     image_dir="pokemon_images",
     output_pdf="pokemon_cards.pdf",
     cards_per_row=3,
-    cards_per_col=3
+    cards_per_col=3,
+    dpi=DEFAULT_DPI,
+    workers=None,
+    page_size="a4",
+    bleed=0,
+    crop_marks=False,
+    sides="front",
+    backs_pdf="pokemon_backs.pdf"
 ):
     """
     Create a PDF with Pokémon cards in a grid layout.
@@ -24,97 +139,81 @@ def create_pokemon_cards_pdf(
         output_pdf: Output PDF filename
         cards_per_row: Number of cards per row (default: 3)
         cards_per_col: Number of cards per column (default: 3)
+        dpi: Print resolution images are downsampled to (default: 300)
+        workers: Worker processes (default: CPU count)
+        page_size: Page size name from card_imposition.PAGE_SIZES (default: a4)
+        bleed: Space around each card's trim box, in points (default: 0)
+        crop_marks: Draw crop marks instead of card borders
+        sides: "front", "both" (fronts + backs_pdf) or "duplex" (interleaved in output_pdf)
+        backs_pdf: Backs PDF filename for sides="both"
     """
-    # Get all PNG files from the directory
-    image_files = sorted(Path(image_dir).glob("*.png"))
+    cards = card_imposition.list_cards(image_dir)
 
-    if not image_files:
+    if not cards:
         print(f"No images found in '{image_dir}' directory!")
         return
 
-    print(f"Found {len(image_files)} Pokémon images")
-
-    # A4 dimensions
-    page_width, page_height = A4
-
-    # Calculate card dimensions
-    margin = 10 * mm
-    usable_width = page_width - (2 * margin)
-    usable_height = page_height - (2 * margin)
-
-    card_width = usable_width / cards_per_row
-    card_height = usable_height / cards_per_col
-
-    # Image and text sizing
-    image_padding = 5 * mm
-    text_height = 8 * mm
-    image_height = card_height - text_height - (2 * image_padding)
-    image_width = card_width - (2 * image_padding)
-
-    # Create PDF
-    c = canvas.Canvas(output_pdf, pagesize=A4)
-
-    cards_per_page = cards_per_row * cards_per_col
-    total_pages = (len(image_files) + cards_per_page - 1) // cards_per_page
-
-    print(f"Creating PDF with {total_pages} pages...")
+    print(f"Found {len(cards)} Pokémon images")
 
-    for page_num in range(total_pages):
-        print(f"Generating page {page_num + 1}/{total_pages}...")
+    layout = card_imposition.card_layout(page_size, cards_per_row, cards_per_col, bleed=bleed)
 
-        start_idx = page_num * cards_per_page
-        end_idx = min(start_idx + cards_per_page, len(image_files))
-        page_images = image_files[start_idx:end_idx]
-
-        for idx, image_path in enumerate(page_images):
-            # Calculate position in grid
-            row = idx // cards_per_row
-            col = idx % cards_per_row
-
-            # Calculate x, y position (reportlab uses bottom-left origin)
-            x = margin + (col * card_width)
-            y = page_height - margin - ((row + 1) * card_height)
-
-            try:
-                # Draw the image centered in the card
-                img_x = x + image_padding
-                img_y = y + image_padding
-
-                # Draw image maintaining aspect ratio with transparency support
-                c.drawImage(
-                    str(image_path),
-                    img_x,
-                    img_y,
-                    width=image_width,
-                    height=card_height - (2 * image_padding),
-                    preserveAspectRatio=True,
-                    anchor='c',
-                    mask='auto'  # Enable transparency
-                )
-
-                # Optional: Draw border around each card for cutting guide
-                c.setStrokeColorRGB(0.8, 0.8, 0.8)
-                c.setLineWidth(0.5)
-                c.rect(x, y, card_width, card_height, stroke=1, fill=0)
+    print(f"Preparing print images at {dpi} DPI...")
+    cards = prepare_print_images(cards, layout, dpi, workers)
+    if not cards:
+        print("No readable images - nothing to print")
+        return
 
-            except Exception as e:
-                print(f"Error processing {image_path.name}: {e}")
+    front, back = (draw_front, False), (draw_back, True)
+    if sides == "duplex":
+        jobs = [(output_pdf, [front, back])]
+    elif sides == "both":
+        jobs = [(output_pdf, [front]), (backs_pdf, [back])]
+    else:
+        jobs = [(output_pdf, [front])]
 
-        # Finish the page
-        c.showPage()
+    for filename, job_sides in jobs:
+        print(f"Creating {filename}...")
+        pages = card_imposition.impose(cards, layout, filename, job_sides, crop_marks, workers)
+        print(f"\n✓ PDF created successfully: {filename}")
+        print(f"  Total cards: {len(cards)}")
+        print(f"  Pages: {pages}")
+        print(f"  Grid: {cards_per_row}x{cards_per_col} cards per page")
 
-    # Save the PDF
-    c.save()
-    print(f"\n✓ PDF created successfully: {output_pdf}")
-    print(f"  Total cards: {len(image_files)}")
-    print(f"  Pages: {total_pages}")
-    print(f"  Grid: {cards_per_row}x{cards_per_col} cards per page")
+    if sides == "both":
+        print_instructions(output_pdf, backs_pdf)
+    elif sides == "duplex":
+        print("\nPrint double-sided, flipping on the long edge.")
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Create a printable PDF of Pokémon cards")
+    parser.add_argument("--image-dir", default="pokemon_images")
+    parser.add_argument("--output", default="pokemon_cards.pdf")
+    parser.add_argument("--backs-output", default="pokemon_backs.pdf",
+                        help="Backs PDF for --sides both (default: pokemon_backs.pdf)")
+    parser.add_argument("--sides", choices=["front", "both", "duplex"], default="front",
+                        help="Fronts only, fronts + backs as two PDFs, or one interleaved duplex PDF")
+    parser.add_argument("--cols", type=int, default=3, help="Cards per row (default: 3)")
+    parser.add_argument("--rows", type=int, default=3, help="Cards per column (default: 3)")
+    parser.add_argument("--page-size", choices=sorted(card_imposition.PAGE_SIZES), default="a4")
+    parser.add_argument("--bleed", type=float, default=0, help="Bleed around each card in mm (default: 0)")
+    parser.add_argument("--crop-marks", action="store_true", help="Draw crop marks instead of card borders")
+    parser.add_argument("--dpi", type=int, default=DEFAULT_DPI,
+                        help=f"Print resolution for card images (default: {DEFAULT_DPI})")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Worker processes (default: CPU count)")
+    args = parser.parse_args()
+
     create_pokemon_cards_pdf(
-        image_dir="pokemon_images",
-        output_pdf="pokemon_cards.pdf",
-        cards_per_row=3,  # 3 columns
-        cards_per_col=3   # 3 rows = 9 cards per page
+        image_dir=args.image_dir,
+        output_pdf=args.output,
+        cards_per_row=args.cols,  # 3 columns
+        cards_per_col=args.rows,  # 3 rows = 9 cards per page
+        dpi=args.dpi,
+        workers=args.workers,
+        page_size=args.page_size,
+        bleed=args.bleed * mm,
+        crop_marks=args.crop_marks,
+        sides=args.sides,
+        backs_pdf=args.backs_output
     )
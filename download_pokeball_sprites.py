@@ -2,11 +2,13 @@
 """
 Download pokeball sprites from PokeAPI
 Fetches sprites for different pokeball types (Poke Ball, Great Ball, Ultra Ball, Master Ball, etc.)
+Responses are cached by pokeapi_http.py - reruns are served from disk.
 """
 
-import requests
 import os
 
+import pokeapi_http
+
 # Create directory for pokeball sprites
 os.makedirs('public/pokeball_sprites', exist_ok=True)
 
@@ -36,21 +38,17 @@ for item_id, filename in pokeballs.items():
     try:
         # Get item data from PokeAPI
         print(f"Fetching {filename}...")
-        response = requests.get(f'https://pokeapi.co/api/v2/item/{item_id}')
-        response.raise_for_status()
-
-        item_data = response.json()
+        item_data = pokeapi_http.get_json(f'https://pokeapi.co/api/v2/item/{item_id}')
         sprite_url = item_data['sprites']['default']
 
         if sprite_url:
             # Download sprite image
-            img_response = requests.get(sprite_url)
-            img_response.raise_for_status()
+            image = pokeapi_http.get(sprite_url)
 
             # Save to file
             filepath = f'public/pokeball_sprites/{filename}.png'
             with open(filepath, 'wb') as f:
-                f.write(img_response.content)
+                f.write(image)
 
             print(f"  ✓ Downloaded {filename}.png")
         else:
@@ -60,3 +58,4 @@ for item_id, filename in pokeballs.items():
         print(f"  ✗ Error downloading {filename}: {e}")
 
 print("\nDone! Pokeball sprites saved to public/pokeball_sprites/")
+print(f"HTTP: {pokeapi_http.session().summary()}")
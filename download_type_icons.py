@@ -2,11 +2,13 @@
 """
 Download Pokemon type icons from PokeAPI
 Fetches type icons for all 18 Pokemon types from Generation IX (Scarlet/Violet)
+Responses are cached by pokeapi_http.py - reruns are served from disk.
 """
 
-import requests
 import os
 
+import pokeapi_http
+
 # Create directory for type icons
 os.makedirs('public/type_icons', exist_ok=True)
 
@@ -45,13 +47,12 @@ for type_id, type_name in types.items():
         print(f"Fetching {type_name} ({type_id})...")
 
         # Download type icon
-        response = requests.get(sprite_url)
-        response.raise_for_status()
+        icon = pokeapi_http.get(sprite_url)
 
         # Save to file using type_id as filename
         filepath = f'public/type_icons/{type_id}.png'
         with open(filepath, 'wb') as f:
-            f.write(response.content)
+            f.write(icon)
 
         print(f"  ✓ Downloaded {type_name}.png (type_{type_id}.png)")
 
@@ -59,6 +60,7 @@ for type_id, type_name in types.items():
         print(f"  ✗ Error downloading {type_name}: {e}")
 
 print("\nDone! Type icons saved to public/type_icons/")
+print(f"HTTP: {pokeapi_http.session().summary()}")
 print("\nType ID mapping:")
 for type_id, type_name in types.items():
     print(f"  {type_id}.png = {type_name}")
@@ -2,11 +2,30 @@
 """
 Fetch comprehensive Pokemon data from PokeAPI and generate pokemonData.js
 Fetches types, stats, height, and weight for all 151 Gen 1 Pokemon
+
+Single pass: each /pokemon/{id} document is fetched once and feeds both
+src/pokemonData.js and the official artwork download (pokemon_images/),
+with bounded parallelism (--workers). Responses are cached by
+pokeapi_http.py - reruns are served from disk.
+
+src/pokemonData.js is written in a columnar layout by default: one array
+per field and stat, read through small POKEMON_DATA records with the
+usual fields plus precomputed baseStatTotal and rarity. --layout objects
+writes the old one-object-per-Pokemon module; --from-existing switches
+the current module between layouts without fetching.
 """
 
-import requests
+import argparse
 import json
-import re
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+import requests
+
+import js_sources
+import pokeapi_http
 
 # Existing filename mappings (read from current pokemonData.js)
 FILENAME_MAP = {
@@ -63,100 +82,303 @@ FILENAME_MAP = {
     149: "149_dragonite.png", 150: "150_mewtwo.png", 151: "151_mew.png"
 }
 
-print("Fetching comprehensive Pokemon data from PokeAPI...")
-print("This will fetch data for all 151 Gen 1 Pokemon (may take a few minutes)\n")
-
-pokemon_data = []
-
-for pokemon_id in range(1, 152):
-    try:
-        print(f"Fetching Pokemon #{pokemon_id}...", end=" ")
-
-        # Fetch Pokemon data from API
-        response = requests.get(f'https://pokeapi.co/api/v2/pokemon/{pokemon_id}')
-        response.raise_for_status()
-        data = response.json()
-
-        # Extract type IDs
-        types = []
-        for type_data in data['types']:
-            type_url = type_data['type']['url']
-            type_id = int(type_url.rstrip('/').split('/')[-1])
-            types.append(type_id)
-
-        # Extract stats
-        stats = {}
-        stat_name_map = {
-            'hp': 'hp',
-            'attack': 'attack',
-            'defense': 'defense',
-            'special-attack': 'specialAttack',
-            'special-defense': 'specialDefense',
-            'speed': 'speed'
-        }
-
-        for stat_data in data['stats']:
-            stat_name = stat_data['stat']['name']
-            if stat_name in stat_name_map:
-                stats[stat_name_map[stat_name]] = stat_data['base_stat']
+NUM_POKEMON = 151
+DEFAULT_WORKERS = 16
+
+STAT_NAME_MAP = {
+    'hp': 'hp',
+    'attack': 'attack',
+    'defense': 'defense',
+    'special-attack': 'specialAttack',
+    'special-defense': 'specialDefense',
+    'speed': 'speed'
+}
+STAT_KEYS = list(STAT_NAME_MAP.values())
+
+# Rarity tiers by base-stat total (getPokemonRarity in src/pokemonRarity.js);
+# LEGENDARY_IDS is read from that module
+RARITY_JS = "src/pokemonRarity.js"
+RARE_STAT_TOTAL = 500
+UNCOMMON_STAT_TOTAL = 400
+
+
+def parse_pokemon(pokemon_id, data):
+    """Build a pokemonData.js entry from a /pokemon/{id} document"""
+    # Extract type IDs
+    types = []
+    for type_data in data['types']:
+        type_url = type_data['type']['url']
+        type_id = int(type_url.rstrip('/').split('/')[-1])
+        types.append(type_id)
+
+    # Extract stats
+    stats = {}
+    for stat_data in data['stats']:
+        stat_name = stat_data['stat']['name']
+        if stat_name in STAT_NAME_MAP:
+            stats[STAT_NAME_MAP[stat_name]] = stat_data['base_stat']
+
+    return {
+        'id': pokemon_id,
+        'name': data['name'].capitalize(),
+        'filename': FILENAME_MAP[pokemon_id],
+        'types': types,
+        'height': data['height'],
+        'weight': data['weight'],
+        'stats': stats
+    }
+
+
+def download_artwork(pokemon_id, data, output_dir):
+    """Save the official artwork for a /pokemon/{id} document as 001_bulbasaur.png"""
+    image_url = data['sprites']['other']['official-artwork']['front_default']
+    if not image_url:
+        return None
+
+    filename = f"{pokemon_id:03d}_{data['name']}.png"
+    filepath = os.path.join(output_dir, filename)
+    image = pokeapi_http.get(image_url)
+    with open(filepath, 'wb') as f:
+        f.write(image)
+    return filename
+
+
+def fetch_pokemon(pokemon_id, images_dir=None):
+    """
+    Fetch one Pokemon document and fan it out to the data entry and artwork.
+
+    Returns (entry, artwork filename, artwork error). A failed artwork
+    download never drops the data entry.
+    """
+    data = pokeapi_http.get_json(f'https://pokeapi.co/api/v2/pokemon/{pokemon_id}')
+    entry = parse_pokemon(pokemon_id, data) if pokemon_id in FILENAME_MAP else None
+    artwork = artwork_error = None
+    if images_dir:
+        try:
+            artwork = download_artwork(pokemon_id, data, images_dir)
+        except (requests.exceptions.RequestException, KeyError, ValueError, OSError) as e:
+            artwork_error = e
+    return entry, artwork, artwork_error
+
+
+def fetch_all(pokemon_ids, images_dir=None, workers=DEFAULT_WORKERS):
+    """
+    Fetch every Pokemon in `pokemon_ids` concurrently.
+
+    Returns the data entries sorted by id. Progress is printed per item as
+    it completes.
+    """
+    if images_dir:
+        Path(images_dir).mkdir(parents=True, exist_ok=True)
+
+    pokemon_data = []
+    total = len(pokemon_ids)
+    done = 0
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(fetch_pokemon, pokemon_id, images_dir): pokemon_id
+                   for pokemon_id in pokemon_ids}
+        for future in as_completed(futures):
+            pokemon_id = futures[future]
+            done += 1
+            progress = f"[{done:3d}/{total}] #{pokemon_id:03d}"
+            try:
+                entry, artwork, artwork_error = future.result()
+            except (requests.exceptions.RequestException, KeyError, ValueError) as e:
+                print(f"{progress} ✗ Error: {e}")
+                continue
+
+            if entry:
+                pokemon_data.append(entry)
+            name = entry['name'] if entry else ''
+            if artwork_error:
+                image_note = f" (no artwork: {artwork_error})"
+            elif images_dir:
+                image_note = f" + {artwork}" if artwork else " (no artwork available)"
+            else:
+                image_note = ""
+            print(f"{progress} ✓ {name}{image_note}")
+
+    pokemon_data.sort(key=lambda p: p['id'])
+    return pokemon_data
+
+
+def base_stat_total(pokemon):
+    return sum(pokemon['stats'].get(key, 0) for key in STAT_KEYS)
+
+
+def rarity_tier(pokemon, legendary_ids):
+    """Same tiers as getPokemonRarity in src/pokemonRarity.js"""
+    if pokemon['id'] in legendary_ids:
+        return 'legendary'
+    total = base_stat_total(pokemon)
+    if total >= RARE_STAT_TOTAL:
+        return 'rare'
+    if total >= UNCOMMON_STAT_TOTAL:
+        return 'uncommon'
+    return 'common'
+
+
+def generate_js(pokemon_data, layout='columnar'):
+    """Render pokemonData.js source for the fetched entries in `layout` (see LAYOUTS)"""
+    return LAYOUTS[layout](pokemon_data)
+
+
+def generate_objects_js(pokemon_data):
+    """One pretty-printed object per Pokemon"""
+    js_content = "// All 151 Gen 1 Pokemon data\n// Generated by fetch_pokemon_data.py - DO NOT EDIT MANUALLY\n"
+    js_content += "export const POKEMON_DATA = [\n"
+
+    for i, pokemon in enumerate(pokemon_data):
+        # Format types array
+        types_str = json.dumps(pokemon['types'])
+
+        # Format stats object
+        stats_str = json.dumps(pokemon['stats'], indent=4)
+        stats_str = stats_str.replace('\n', '\n        ')  # Indent properly
 
         # Create Pokemon entry
-        pokemon_entry = {
-            'id': pokemon_id,
-            'name': data['name'].capitalize(),
-            'filename': FILENAME_MAP[pokemon_id],
-            'types': types,
-            'height': data['height'],
-            'weight': data['weight'],
-            'stats': stats
-        }
-
-        pokemon_data.append(pokemon_entry)
-        print(f"✓ {pokemon_entry['name']}")
-
-    except Exception as e:
-        print(f"✗ Error: {e}")
-        continue
-
-print(f"\n✓ Successfully fetched data for {len(pokemon_data)} Pokemon")
-
-# Generate JavaScript file
-print("\nGenerating src/pokemonData.js...")
-
-js_content = "// All 151 Gen 1 Pokemon data\n// Generated by fetch_pokemon_data.py - DO NOT EDIT MANUALLY\n"
-js_content += "export const POKEMON_DATA = [\n"
-
-for i, pokemon in enumerate(pokemon_data):
-    # Format types array
-    types_str = json.dumps(pokemon['types'])
-
-    # Format stats object
-    stats_str = json.dumps(pokemon['stats'], indent=4)
-    stats_str = stats_str.replace('\n', '\n        ')  # Indent properly
-
-    # Create Pokemon entry
-    entry = f"    {{\n"
-    entry += f"        id: {pokemon['id']},\n"
-    entry += f"        name: \"{pokemon['name']}\",\n"
-    entry += f"        filename: \"{pokemon['filename']}\",\n"
-    entry += f"        types: {types_str},\n"
-    entry += f"        height: {pokemon['height']},\n"
-    entry += f"        weight: {pokemon['weight']},\n"
-    entry += f"        stats: {stats_str}\n"
-    entry += f"    }}"
-
-    # Add comma if not last
-    if i < len(pokemon_data) - 1:
-        entry += ","
-
-    entry += "\n"
-    js_content += entry
-
-js_content += "];\n"
-
-# Write to file
-with open('src/pokemonData.js', 'w') as f:
-    f.write(js_content)
-
-print("✓ Successfully generated src/pokemonData.js")
-print(f"\nDone! Enhanced data for {len(pokemon_data)} Pokemon")
+        entry = f"    {{\n"
+        entry += f"        id: {pokemon['id']},\n"
+        entry += f"        name: \"{pokemon['name']}\",\n"
+        entry += f"        filename: \"{pokemon['filename']}\",\n"
+        entry += f"        types: {types_str},\n"
+        entry += f"        height: {pokemon['height']},\n"
+        entry += f"        weight: {pokemon['weight']},\n"
+        entry += f"        stats: {stats_str}\n"
+        entry += f"    }}"
+
+        # Add comma if not last
+        if i < len(pokemon_data) - 1:
+            entry += ","
+
+        entry += "\n"
+        js_content += entry
+
+    js_content += "];\n"
+    return js_content
+
+
+COLUMNAR_SHIM = """
+const STAT_KEYS = %(stat_keys)s;
+
+// Values are read from the columns on access: no per-Pokemon objects are
+// built at startup beyond these small records
+class PokemonRecord {
+    constructor(index) { this.index = index; }
+    get id() { return COLUMNS.id[this.index]; }
+    get name() { return COLUMNS.name[this.index]; }
+    get filename() {
+        return `${String(this.id).padStart(3, '0')}_${this.name.toLowerCase()}.png`;
+    }
+    get types() { return COLUMNS.types[this.index]; }
+    get height() { return COLUMNS.height[this.index]; }
+    get weight() { return COLUMNS.weight[this.index]; }
+    get stats() {
+        const stats = {};
+        for (const key of STAT_KEYS) stats[key] = COLUMNS[key][this.index];
+        return stats;
+    }
+    get baseStatTotal() { return COLUMNS.baseStatTotal[this.index]; }
+    get rarity() { return COLUMNS.rarity[this.index]; }
+}
+
+export const POKEMON_DATA = COLUMNS.id.map((_, index) => new PokemonRecord(index));
+"""
+
+
+def generate_columnar_js(pokemon_data):
+    """
+    Parallel arrays (one per field and stat) plus a shim exposing them as
+    POKEMON_DATA, with the same fields as the object layout and the
+    precomputed baseStatTotal and rarity tier
+    """
+    for pokemon in pokemon_data:
+        # The shim derives filenames; every FILENAME_MAP entry follows this rule
+        if pokemon['filename'] != f"{pokemon['id']:03d}_{pokemon['name'].lower()}.png":
+            raise ValueError(f"{pokemon['filename']} does not follow <id>_<name>.png")
+
+    legendary_ids = set(js_sources.read_constant(RARITY_JS, 'LEGENDARY_IDS'))
+    columns = {
+        'id': [p['id'] for p in pokemon_data],
+        'name': [p['name'] for p in pokemon_data],
+        'types': [p['types'] for p in pokemon_data],
+        'height': [p['height'] for p in pokemon_data],
+        'weight': [p['weight'] for p in pokemon_data],
+        **{key: [p['stats'].get(key, 0) for p in pokemon_data] for key in STAT_KEYS},
+        'baseStatTotal': [base_stat_total(p) for p in pokemon_data],
+        'rarity': [rarity_tier(p, legendary_ids) for p in pokemon_data],
+    }
+
+    js_content = (f"// All {len(pokemon_data)} Gen 1 Pokemon data (columnar layout)\n"
+                  "// Generated by fetch_pokemon_data.py - DO NOT EDIT MANUALLY\n")
+    js_content += "const COLUMNS = {\n"
+    js_content += ",\n".join(f"    {field}: {json.dumps(values, separators=(',', ':'), ensure_ascii=False)}"
+                              for field, values in columns.items())
+    js_content += "\n};\n"
+    js_content += COLUMNAR_SHIM % {'stat_keys': json.dumps(STAT_KEYS)}
+    return js_content
+
+
+LAYOUTS = {
+    'objects': generate_objects_js,
+    'columnar': generate_columnar_js,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fetch Pokemon data and artwork from PokeAPI")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                        help=f"Concurrent requests (default: {DEFAULT_WORKERS})")
+    parser.add_argument("--images-dir", default="pokemon_images",
+                        help="Where to save official artwork (default: pokemon_images)")
+    parser.add_argument("--no-images", action="store_true",
+                        help="Only generate src/pokemonData.js, skip the artwork")
+    parser.add_argument("--output", default="src/pokemonData.js",
+                        help="Generated data module (default: src/pokemonData.js)")
+    parser.add_argument("--layout", choices=sorted(LAYOUTS), default="columnar",
+                        help="columnar: parallel arrays behind a POKEMON_DATA shim, smaller and "
+                             "faster to parse (default); objects: one object per Pokemon")
+    parser.add_argument("--from-existing", action="store_true",
+                        help="Don't fetch: re-emit the current --output module in --layout")
+    args = parser.parse_args()
+
+    if args.from_existing:
+        pokemon_data = js_sources.pokemon_data(args.output)
+        before = os.path.getsize(args.output)
+        with open(args.output, 'w') as f:
+            f.write(generate_js(pokemon_data, args.layout))
+        print(f"✓ Rewrote {args.output} ({len(pokemon_data)} Pokemon, {args.layout} layout): "
+              f"{before / 1024:.1f} KB -> {os.path.getsize(args.output) / 1024:.1f} KB")
+        return
+
+    images_dir = None if args.no_images else args.images_dir
+
+    print("Fetching comprehensive Pokemon data from PokeAPI...")
+    print(f"All {NUM_POKEMON} Gen 1 Pokemon, {args.workers} at a time"
+          f"{'' if images_dir is None else f', artwork to {images_dir}/'}\n")
+
+    pokemon_ids = list(range(1, NUM_POKEMON + 1))
+    pokemon_data = fetch_all(pokemon_ids, images_dir, args.workers)
+
+    expected = sum(1 for pokemon_id in pokemon_ids if pokemon_id in FILENAME_MAP)
+    if len(pokemon_data) != expected:
+        # Never write a module with Pokemon silently missing
+        print(f"\n✗ Fetched data for {len(pokemon_data)} of {expected} Pokemon - "
+              f"{args.output} not written")
+        sys.exit(1)
+
+    print(f"\n✓ Successfully fetched data for {len(pokemon_data)} Pokemon ({pokeapi_http.session().summary()})")
+
+    # Generate JavaScript file
+    print(f"\nGenerating {args.output}...")
+
+    with open(args.output, 'w') as f:
+        f.write(generate_js(pokemon_data, args.layout))
+
+    print(f"✓ Successfully generated {args.output}")
+    print(f"\nDone! Enhanced data for {len(pokemon_data)} Pokemon")
+
+
+if __name__ == "__main__":
+    main()
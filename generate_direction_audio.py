@@ -2,54 +2,74 @@
 """
 Generate Swedish TTS audio for left/right directions using edge-tts
 Output: public/direction_audio/hoger.mp3 and public/direction_audio/vanster.mp3
+
+Clips are cached in .tts_cache/ - unchanged words are skipped.
+Use --force to re-render everything, --prune to delete stale clips.
+Use --backend to pick the TTS engine (edge-tts, gtts, espeak-ng, piper).
+Clips are rendered concurrently (--concurrency) with retries (--retries).
 """
 
+import argparse
 import asyncio
-import edge_tts
 import os
 
+from tts_backends import add_backend_arguments, backend_job, get_backend
+from tts_cache import SynthesisCache, add_cache_arguments
+from tts_scheduler import add_scheduler_arguments, run_jobs
+
 # Swedish directions
 DIRECTIONS = {
     'hoger': 'Höger',      # Right
     'vanster': 'Vänster'   # Left
 }
 
-# Swedish voice for clear pronunciation
-VOICE = "sv-SE-MattiasNeural"  # Male Swedish voice
-
-async def generate_direction_audio(key, word):
-    """Generate TTS audio for a single direction word"""
-    filename = f"public/direction_audio/{key}.mp3"
+# Swedish voice for clear pronunciation (see tts_backends.DEFAULT_VOICES)
+LANG = "sv"
 
-    try:
-        print(f"Generating '{word}'...", end=" ")
+OUTPUT_DIR = "public/direction_audio"
 
-        # Create TTS with direction word
-        tts = edge_tts.Communicate(word, VOICE)
-        await tts.save(filename)
+def direction_filename(key):
+    return f"{OUTPUT_DIR}/{key}.mp3"
 
-        print(f"✓ Saved {filename}")
-        return True
-    except Exception as e:
-        print(f"✗ Error: {e}")
-        return False
+def direction_job(backend, key, word):
+    """Scheduler job generating TTS audio for a single direction word"""
+    return backend_job(backend, word, direction_filename(key))
 
 async def main():
+    parser = argparse.ArgumentParser(description="Generate Swedish direction audio")
+    add_backend_arguments(parser)
+    add_cache_arguments(parser)
+    add_scheduler_arguments(parser)
+    args = parser.parse_args()
+    backend = get_backend(args.backend, LANG, args.voice)
+
     # Create output directory if it doesn't exist
-    os.makedirs("public/direction_audio", exist_ok=True)
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
 
     print(f"Generating Swedish TTS audio for directions...")
-    print(f"Voice: {VOICE}")
-    print(f"Output: public/direction_audio/\n")
+    print(f"Voice: {backend.voice} ({backend.name})")
+    print(f"Output: {OUTPUT_DIR}/\n")
+
+    cache = SynthesisCache(OUTPUT_DIR, engine=backend.name, voice=backend.voice,
+                           options=backend.options, force=args.force)
+    pending = [
+        (key, word) for key, word in DIRECTIONS.items()
+        if not cache.restore(direction_filename(key), word)
+    ]
+
+    # Generate missing audio files
+    results = await run_jobs([direction_job(backend, key, word) for key, word in pending],
+                             concurrency=args.concurrency, retries=args.retries)
+    for (key, word), result in zip(pending, results):
+        if result:
+            cache.store(direction_filename(key), word)
 
-    # Generate all audio files
-    results = []
-    for key, word in DIRECTIONS.items():
-        result = await generate_direction_audio(key, word)
-        results.append(result)
+    if args.prune:
+        cache.prune([direction_filename(key) for key in DIRECTIONS])
+    cache.save()
 
     successful = sum(results)
-    print(f"\n✓ Successfully generated {successful}/{len(DIRECTIONS)} audio files")
+    print(f"\n✓ Successfully generated {successful}/{len(pending)} audio files ({cache.summary()})")
     print("Done! Audio files are ready to use in the game.")
 
 if __name__ == "__main__":
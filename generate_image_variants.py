@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Generate downscaled image variants per display context from master artwork
+Output: public/<variant files> + public/image_variants.json
+
+The size table below says which masters are shown where and at what size:
+
+- small (128px) / tiny (64px): pokeball and UI icons (replaces the
+  hand-made -small/-tiny files, written to the paths BootScene loads)
+- icon (256px): minigame icons, rendered from the 1024px masters
+- pokedex (192px): thumbnails of the official artwork for PokedexScene,
+  which draws all 151 at 0.35x scale
+
+Masters that are not shipped (the *_original minigame icons, the source
+pokeball renders and the full-size legendary ball) live in art/, outside
+the Vite public/ root, so they no longer end up in dist/.
+
+Images are resampled with Lanczos, optionally quantized to a palette
+(--colors) and written as PNG or WebP (--format). BootScene loads the .png
+paths, so --format webp only pays off once it loads the .webp files (or
+the paths from image_variants.json) instead. Work runs in a process pool
+and a variant is only re-rendered when its master or the settings changed
+(sha256, cached in .build_cache/image_variants.json).
+
+image_variants.json maps each texture key to its variant file and size.
+Requires: pip install pillow
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from PIL import Image
+
+import boot_assets
+import build_events
+
+PUBLIC_DIR = boot_assets.PUBLIC_DIR
+ART_DIR = Path("art")
+MANIFEST_PATH = PUBLIC_DIR / "image_variants.json"
+STATE_FILE = Path(".build_cache") / "image_variants.json"
+
+# Display context -> longest side in pixels
+SIZES = {
+    "tiny": 64,
+    "small": 128,
+    "pokedex": 192,
+    "icon": 256,
+}
+
+# Pokeball renders: name -> master
+POKEBALL_MASTERS = {
+    "poke-ball": ART_DIR / "pokeball_sprites" / "poke ball.webp",
+    "great-ball": ART_DIR / "pokeball_sprites" / "Great_Ball.webp",
+    "ultra-ball": ART_DIR / "pokeball_sprites" / "Ultra_Ball.webp",
+    "legendary-ball": ART_DIR / "pokeball_sprites" / "legendary-ball.png",
+}
+
+# UI images: (key, master, output stem relative to public/, variant)
+UI_VARIANTS = [
+    ("coin-tiny", PUBLIC_DIR / "coin.png", "coin-tiny", "tiny"),
+    ("dice-icon", PUBLIC_DIR / "dice-icon.png", "dice-icon-small", "small"),
+    ("pokedex-icon", PUBLIC_DIR / "pokedex-icon.png", "pokedex-icon-small", "small"),
+    ("store-icon", PUBLIC_DIR / "store-icon.png", "store-icon-small", "small"),
+]
+
+POKEDEX_THUMB_DIR = "pokedex_thumbs"
+
+
+def minigame_icon_master(stem):
+    """Highest-resolution master for a minigame icon (art/*_original.* if there is one)"""
+    for ext in ("png", "jpeg", "jpg"):
+        candidate = ART_DIR / "minigame_icons" / f"{stem}_original.{ext}"
+        if candidate.exists():
+            return candidate
+    return PUBLIC_DIR / "minigame_icons" / f"{stem}.png"
+
+
+def variant_specs():
+    """[(key, master path, output stem relative to public/, variant name)]"""
+    specs = []
+
+    # Written to the files BootScene loads (legendary-ball.png has no -small suffix)
+    for name, master in POKEBALL_MASTERS.items():
+        for key, variant in ((f"pokeball_{name}", "small"), (f"pokeball_{name}-tiny", "tiny")):
+            stem = Path(boot_assets.POKEBALL_SPRITES[key]).with_suffix("").as_posix()
+            specs.append((key, master, stem, variant))
+
+    specs.extend(UI_VARIANTS)
+
+    for key, path in boot_assets.MINIGAME_ICONS.items():
+        stem = Path(path).stem
+        specs.append((key, minigame_icon_master(stem), f"minigame_icons/{stem}", "icon"))
+
+    for key, path in boot_assets.pokemon_images().items():
+        stem = Path(path).stem
+        specs.append((key.replace("pokemon_", "pokedex_"), boot_assets.resolve(path),
+                      f"{POKEDEX_THUMB_DIR}/{stem}", "pokedex"))
+
+    return specs
+
+
+def file_hash(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def render_variant(master, output_path, size, fmt, colors):
+    """Downscale `master` to fit size x size and save it. Returns the variant's (width, height)"""
+    with build_events.asset(output_path) as event, Image.open(master) as image:
+        event.cache = "miss"
+        with event.stage("resize"):
+            image = image.convert("RGBA")
+            if max(image.size) > size:
+                scale = size / max(image.size)
+                image = image.resize((max(1, round(image.width * scale)), max(1, round(image.height * scale))),
+                                     Image.LANCZOS)
+
+        fd, tmp_path = tempfile.mkstemp(dir=output_path.parent, prefix=".", suffix=output_path.suffix)
+        os.close(fd)
+        try:
+            with event.stage("encode"):
+                if fmt == "webp":
+                    image.save(tmp_path, "WEBP", quality=90, method=6)
+                elif colors:
+                    image.quantize(colors, method=Image.FASTOCTREE).save(tmp_path, "PNG", optimize=True)
+                else:
+                    image.save(tmp_path, "PNG", optimize=True)
+            os.replace(tmp_path, output_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        event.bytes = os.path.getsize(output_path)
+        return image.size
+
+
+def load_json(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_json(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate downscaled image variants from master artwork")
+    parser.add_argument("--format", choices=["png", "webp"], default="png",
+                        help="Output format (default: png). BootScene loads the .png paths: "
+                             "switch it to the .webp files before using webp, or the game keeps "
+                             "loading stale PNGs")
+    parser.add_argument("--colors", type=int, default=0,
+                        help="Quantize PNG variants to this many palette colors (default: off)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Worker processes (default: CPU count)")
+    parser.add_argument("--force", action="store_true", help="Re-render every variant")
+    args = parser.parse_args()
+
+    settings = f"{args.format}:{args.colors}"
+    state = {} if args.force else load_json(STATE_FILE)
+    manifest = load_json(MANIFEST_PATH)
+
+    pending = {}
+    outputs = {}
+    skipped = 0
+    for key, master, stem, variant in variant_specs():
+        output = f"{stem}.{args.format}"
+        outputs[key] = (output, variant)
+        if not master.exists():
+            print(f"✗ Missing master {master} ({key})")
+            continue
+        if master.resolve() == (PUBLIC_DIR / output).resolve():
+            # Already the deployed file (no higher-resolution master to render from)
+            with Image.open(master) as image:
+                manifest[key] = {"file": output, "variant": variant,
+                                 "width": image.width, "height": image.height}
+            continue
+
+        digest = hashlib.sha256(f"{file_hash(master)}:{SIZES[variant]}:{settings}".encode()).hexdigest()
+        if state.get(output) == digest and (PUBLIC_DIR / output).exists() and key in manifest:
+            skipped += 1
+            continue
+        # Several keys can share an output (e.g. two modes using the number_listening icon)
+        pending.setdefault(output, (master, variant, digest, []))[3].append(key)
+
+    print(f"Rendering {len(pending)} image variants ({skipped} up to date)...")
+
+    rendered = 0
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        futures = {}
+        for output, (master, variant, _, _) in pending.items():
+            (PUBLIC_DIR / output).parent.mkdir(parents=True, exist_ok=True)
+            future = pool.submit(render_variant, master, PUBLIC_DIR / output, SIZES[variant],
+                                 args.format, args.colors)
+            futures[future] = output
+
+        for future in as_completed(futures):
+            output = futures[future]
+            master, variant, digest, keys = pending[output]
+            try:
+                width, height = future.result()
+            except OSError as e:
+                print(f"✗ Failed to render {output}: {e}")
+                continue
+            for key in keys:
+                manifest[key] = {"file": output, "variant": variant, "width": width, "height": height}
+            state[output] = digest
+            rendered += 1
+            print(f"  ✓ {output} ({width}x{height}, {(PUBLIC_DIR / output).stat().st_size // 1024} KB)")
+
+    # Keys that are no longer in the size table
+    for key in sorted(set(manifest) - set(outputs)):
+        del manifest[key]
+
+    save_json(MANIFEST_PATH, manifest)
+    save_json(STATE_FILE, state)
+
+    print(f"\n✓ Rendered {rendered} variants, {skipped} up to date")
+    print(f"Manifest: {MANIFEST_PATH}")
+
+
+if __name__ == "__main__":
+    main()
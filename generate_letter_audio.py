@@ -2,55 +2,77 @@
 """
 Generate Swedish TTS audio for all Swedish alphabet letters using edge-tts
 Output: public/letter_audio/{letter}.mp3
+
+Clips are cached in .tts_cache/ - unchanged letters are skipped.
+Use --force to re-render everything, --prune to delete stale clips.
+Use --backend to pick the TTS engine (edge-tts, gtts, espeak-ng, piper).
+Clips are rendered concurrently (--concurrency) with retries (--retries).
+Use --batch to synthesize many clips per edge-tts request.
 """
 
+import argparse
 import asyncio
-import edge_tts
 import os
 
-# Swedish alphabet (29 letters)
-SWEDISH_LETTERS = [
-    'A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'J', 'K', 'L', 'M',
-    'N', 'O', 'P', 'Q', 'R', 'S', 'T', 'U', 'V', 'W', 'X', 'Y', 'Z',
-    'Å', 'Ä', 'Ö'
-]
+import js_sources
+from tts_backends import add_backend_arguments, backend_job, get_backend
+from tts_cache import SynthesisCache, add_cache_arguments
+from tts_batch import add_batch_arguments, run_batched
+from tts_scheduler import add_scheduler_arguments, run_jobs
 
-# Swedish voice for clear pronunciation
-VOICE = "sv-SE-MattiasNeural"  # Male Swedish voice
+# Swedish alphabet (29 letters), read from src/letterData.js
+SWEDISH_LETTERS = js_sources.swedish_letters()
 
-async def generate_letter_audio(letter):
-    """Generate TTS audio for a single letter (using letter name)"""
-    filename = f"public/letter_audio/{letter.lower()}.mp3"
+# Swedish voice for clear pronunciation (see tts_backends.DEFAULT_VOICES)
+LANG = "sv"
 
-    try:
-        print(f"Generating letter '{letter}'...", end=" ")
+OUTPUT_DIR = "public/letter_audio"
 
-        # Create TTS with letter name
-        tts = edge_tts.Communicate(letter, VOICE)
-        await tts.save(filename)
+def letter_filename(letter):
+    return f"{OUTPUT_DIR}/{letter.lower()}.mp3"
 
-        print(f"✓ Saved {filename}")
-        return True
-    except Exception as e:
-        print(f"✗ Error: {e}")
-        return False
+def letter_job(backend, letter):
+    """Scheduler job generating TTS audio for a single letter (using letter name)"""
+    return backend_job(backend, letter, letter_filename(letter))
 
 async def main():
+    parser = argparse.ArgumentParser(description="Generate Swedish letter audio")
+    add_backend_arguments(parser)
+    add_cache_arguments(parser)
+    add_scheduler_arguments(parser)
+    add_batch_arguments(parser)
+    args = parser.parse_args()
+    backend = get_backend(args.backend, LANG, args.voice)
+
     # Create output directory if it doesn't exist
-    os.makedirs("public/letter_audio", exist_ok=True)
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
 
     print(f"Generating Swedish TTS audio for all {len(SWEDISH_LETTERS)} letters...")
-    print(f"Voice: {VOICE}")
-    print(f"Output: public/letter_audio/\n")
+    print(f"Voice: {backend.voice} ({backend.name})")
+    print(f"Output: {OUTPUT_DIR}/\n")
+
+    cache = SynthesisCache(OUTPUT_DIR, engine=backend.name, voice=backend.voice,
+                           options=backend.options, force=args.force)
+    pending = [l for l in SWEDISH_LETTERS if not cache.restore(letter_filename(l), l)]
+
+    # Files are written atomically, so concurrent rendering is safe
+    jobs = [letter_job(backend, l) for l in pending]
+    if args.batch and backend.supports_batch:
+        items = [(letter_filename(l), l) for l in pending]
+        results = await run_batched(items, jobs, backend.voice, batch_size=args.batch_size,
+                                    concurrency=args.concurrency, retries=args.retries)
+    else:
+        results = await run_jobs(jobs, concurrency=args.concurrency, retries=args.retries)
+    for letter, result in zip(pending, results):
+        if result:
+            cache.store(letter_filename(letter), letter)
 
-    # Generate all audio files sequentially (to avoid corruption)
-    results = []
-    for letter in SWEDISH_LETTERS:
-        result = await generate_letter_audio(letter)
-        results.append(result)
+    if args.prune:
+        cache.prune([letter_filename(l) for l in SWEDISH_LETTERS])
+    cache.save()
 
     successful = sum(results)
-    print(f"\n✓ Successfully generated {successful}/{len(SWEDISH_LETTERS)} audio files")
+    print(f"\n✓ Successfully generated {successful}/{len(pending)} audio files ({cache.summary()})")
     print("Done! Audio files are ready to use in the game.")
 
 if __name__ == "__main__":
@@ -1,52 +1,85 @@
 #!/usr/bin/env python3
 """
-Generate Swedish TTS audio for numbers 10-200 using edge-tts
+Generate Swedish TTS audio for the numbers the minigames need using edge-tts
 Output: public/number_audio/{number}.mp3
+
+The clip set is derived from the "numbers" and "legendaryNumbers" range
+specs in public/config/minigames.json, decomposed the way
+NumberListeningMode plays them (100-399 = hundreds clip + remainder clip).
+
+Clips are cached in .tts_cache/ - unchanged numbers are skipped.
+Use --force to re-render everything, --prune to delete stale clips.
+Use --backend to pick the TTS engine (edge-tts, gtts, espeak-ng, piper).
+Clips are rendered concurrently (--concurrency) with retries (--retries).
+Use --batch to synthesize many clips per edge-tts request.
 """
 
+import argparse
 import asyncio
-import edge_tts
 import os
 
-# Swedish voice for clear pronunciation
-VOICE = "sv-SE-MattiasNeural"  # Male Swedish voice
+from minigame_config import CONFIG_PATH, load_config, required_number_clips
+from tts_backends import add_backend_arguments, backend_job, get_backend
+from tts_cache import SynthesisCache, add_cache_arguments
+from tts_batch import add_batch_arguments, run_batched
+from tts_scheduler import add_scheduler_arguments, run_jobs
 
-async def generate_number_audio(number):
-    """Generate TTS audio for a single number"""
-    filename = f"public/number_audio/{number}.mp3"
+# Swedish voice for clear pronunciation (see tts_backends.DEFAULT_VOICES)
+LANG = "sv"
 
-    try:
-        print(f"Generating number '{number}'...", end=" ")
+OUTPUT_DIR = "public/number_audio"
 
-        # Create TTS with the number
-        tts = edge_tts.Communicate(str(number), VOICE)
-        await tts.save(filename)
+def number_filename(number):
+    return f"{OUTPUT_DIR}/{number}.mp3"
 
-        print(f"✓ Saved {filename}")
-        return True
-    except Exception as e:
-        print(f"✗ Error: {e}")
-        return False
+def number_job(backend, number):
+    """Scheduler job generating TTS audio for a single number"""
+    return backend_job(backend, str(number), number_filename(number))
 
 async def main():
+    parser = argparse.ArgumentParser(description="Generate Swedish number audio")
+    add_backend_arguments(parser)
+    add_cache_arguments(parser)
+    add_scheduler_arguments(parser)
+    add_batch_arguments(parser)
+    parser.add_argument("--config", default=CONFIG_PATH,
+                        help=f"Minigame config to read number ranges from (default: {CONFIG_PATH})")
+    args = parser.parse_args()
+    backend = get_backend(args.backend, LANG, args.voice)
+
     # Create output directory if it doesn't exist
-    os.makedirs("public/number_audio", exist_ok=True)
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+
+    # Only the clips the configured number ranges need
+    numbers = required_number_clips(load_config(args.config))
+
+    print(f"Generating Swedish TTS audio for {len(numbers)} number clips "
+          f"({numbers[0]}-{numbers[-1]}, from {args.config})...")
+    print(f"Voice: {backend.voice} ({backend.name})")
+    print(f"Output: {OUTPUT_DIR}/\n")
 
-    # Generate numbers 10-200 (191 numbers total)
-    numbers = list(range(10, 201))
+    cache = SynthesisCache(OUTPUT_DIR, engine=backend.name, voice=backend.voice,
+                           options=backend.options, force=args.force)
+    pending = [n for n in numbers if not cache.restore(number_filename(n), str(n))]
 
-    print(f"Generating Swedish TTS audio for numbers 10-200 ({len(numbers)} numbers)...")
-    print(f"Voice: {VOICE}")
-    print(f"Output: public/number_audio/\n")
+    # Files are written atomically, so concurrent rendering is safe
+    jobs = [number_job(backend, n) for n in pending]
+    if args.batch and backend.supports_batch:
+        items = [(number_filename(n), str(n)) for n in pending]
+        results = await run_batched(items, jobs, backend.voice, batch_size=args.batch_size,
+                                    concurrency=args.concurrency, retries=args.retries)
+    else:
+        results = await run_jobs(jobs, concurrency=args.concurrency, retries=args.retries)
+    for number, result in zip(pending, results):
+        if result:
+            cache.store(number_filename(number), str(number))
 
-    # Generate all audio files sequentially (to avoid corruption)
-    results = []
-    for number in numbers:
-        result = await generate_number_audio(number)
-        results.append(result)
+    if args.prune:
+        cache.prune([number_filename(n) for n in numbers])
+    cache.save()
 
     successful = sum(results)
-    print(f"\n✓ Successfully generated {successful}/{len(numbers)} audio files")
+    print(f"\n✓ Successfully generated {successful}/{len(pending)} audio files ({cache.summary()})")
     print("Done! Audio files are ready to use in the game.")
 
 if __name__ == "__main__":
@@ -2,80 +2,88 @@
 """
 Generate English TTS audio for all 151 Gen 1 Pokemon names using edge-tts
 Output: public/pokemon_audio/{id:03d}_{name}.mp3
+
+Clips are cached in .tts_cache/ - unchanged names are skipped.
+Use --force to re-render everything, --prune to delete stale clips.
+Use --backend to pick the TTS engine (edge-tts, gtts, espeak-ng, piper).
+Clips are rendered concurrently (--concurrency) with retries (--retries).
+Use --batch to synthesize many clips per edge-tts request.
 """
 
+import argparse
 import asyncio
-import edge_tts
 import os
 
-# Pokemon names (extracted from pokemonData.js)
-POKEMON_NAMES = [
-    "Bulbasaur", "Ivysaur", "Venusaur", "Charmander", "Charmeleon", "Charizard",
-    "Squirtle", "Wartortle", "Blastoise", "Caterpie", "Metapod", "Butterfree",
-    "Weedle", "Kakuna", "Beedrill", "Pidgey", "Pidgeotto", "Pidgeot",
-    "Rattata", "Raticate", "Spearow", "Fearow", "Ekans", "Arbok",
-    "Pikachu", "Raichu", "Sandshrew", "Sandslash", "Nidoran-f", "Nidorina",
-    "Nidoqueen", "Nidoran-m", "Nidorino", "Nidoking", "Clefairy", "Clefable",
-    "Vulpix", "Ninetales", "Jigglypuff", "Wigglytuff", "Zubat", "Golbat",
-    "Oddish", "Gloom", "Vileplume", "Paras", "Parasect", "Venonat",
-    "Venomoth", "Diglett", "Dugtrio", "Meowth", "Persian", "Psyduck",
-    "Golduck", "Mankey", "Primeape", "Growlithe", "Arcanine", "Poliwag",
-    "Poliwhirl", "Poliwrath", "Abra", "Kadabra", "Alakazam", "Machop",
-    "Machoke", "Machamp", "Bellsprout", "Weepinbell", "Victreebel", "Tentacool",
-    "Tentacruel", "Geodude", "Graveler", "Golem", "Ponyta", "Rapidash",
-    "Slowpoke", "Slowbro", "Magnemite", "Magneton", "Farfetchd", "Doduo",
-    "Dodrio", "Seel", "Dewgong", "Grimer", "Muk", "Shellder",
-    "Cloyster", "Gastly", "Haunter", "Gengar", "Onix", "Drowzee",
-    "Hypno", "Krabby", "Kingler", "Voltorb",
-    "Electrode", "Exeggcute", "Exeggutor", "Cubone", "Marowak", "Hitmonlee",
-    "Hitmonchan", "Lickitung", "Koffing", "Weezing", "Rhyhorn", "Rhydon",
-    "Chansey", "Tangela", "Kangaskhan", "Horsea", "Seadra", "Goldeen",
-    "Seaking", "Staryu", "Starmie", "Mr. Mime", "Scyther", "Jynx",
-    "Electabuzz", "Magmar", "Pinsir", "Tauros", "Magikarp", "Gyarados",
-    "Lapras", "Ditto", "Eevee", "Vaporeon", "Jolteon", "Flareon",
-    "Porygon", "Omanyte", "Omastar", "Kabuto", "Kabutops", "Aerodactyl",
-    "Snorlax", "Articuno", "Zapdos", "Moltres", "Dratini", "Dragonair",
-    "Dragonite", "Mewtwo", "Mew"
-]
-
-# English voice for pronunciation
-VOICE = "en-US-GuyNeural"  # Clear, neutral American English
-
-async def generate_pokemon_audio(pokemon_id, name):
-    """Generate TTS audio for a single Pokemon"""
-    filename = f"public/pokemon_audio/{pokemon_id:03d}_{name.lower().replace('-', '')}.mp3"
-
-    try:
-        print(f"Generating #{pokemon_id:03d}: {name}...", end=" ")
-
-        # Create TTS
-        tts = edge_tts.Communicate(name, VOICE)
-        await tts.save(filename)
-
-        print(f"✓ Saved {filename}")
-        return True
-    except Exception as e:
-        print(f"✗ Error: {e}")
-        return False
+import js_sources
+from tts_backends import add_backend_arguments, backend_job, get_backend
+from tts_cache import SynthesisCache, add_cache_arguments
+from tts_batch import add_batch_arguments, run_batched
+from tts_scheduler import add_scheduler_arguments, run_jobs
+
+# (id, name) for every Pokemon, read from src/pokemonData.js
+POKEMON = js_sources.pokemon_names()
+
+# Names that are spelled for filenames in pokemonData.js, not for speech
+SPOKEN_NAMES = {"Mr-mime": "Mr. Mime"}
+
+# English voice for pronunciation (see tts_backends.DEFAULT_VOICES)
+LANG = "en"
+
+OUTPUT_DIR = "public/pokemon_audio"
+
+def pokemon_filename(pokemon_id, name):
+    return f"{OUTPUT_DIR}/{pokemon_id:03d}_{name.lower().replace('-', '')}.mp3"
+
+def spoken_name(name):
+    return SPOKEN_NAMES.get(name, name)
+
+def pokemon_job(backend, pokemon_id, name):
+    """Scheduler job generating TTS audio for a single Pokemon"""
+    return backend_job(backend, spoken_name(name), pokemon_filename(pokemon_id, name))
 
 async def main():
+    parser = argparse.ArgumentParser(description="Generate Pokemon name audio")
+    add_backend_arguments(parser)
+    add_cache_arguments(parser)
+    add_scheduler_arguments(parser)
+    add_batch_arguments(parser)
+    args = parser.parse_args()
+    backend = get_backend(args.backend, LANG, args.voice)
+
     # Create output directory if it doesn't exist
-    os.makedirs("public/pokemon_audio", exist_ok=True)
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
 
-    print(f"Generating English TTS audio for all {len(POKEMON_NAMES)} Pokemon...")
-    print(f"Voice: {VOICE}")
-    print(f"Output: public/pokemon_audio/\n")
+    print(f"Generating English TTS audio for all {len(POKEMON)} Pokemon...")
+    print(f"Voice: {backend.voice} ({backend.name})")
+    print(f"Output: {OUTPUT_DIR}/\n")
 
-    # Generate all audio files in parallel
-    tasks = [
-        generate_pokemon_audio(i + 1, name)
-        for i, name in enumerate(POKEMON_NAMES)
+    cache = SynthesisCache(OUTPUT_DIR, engine=backend.name, voice=backend.voice,
+                           options=backend.options, force=args.force)
+    pokemon = POKEMON
+    pending = [
+        (pokemon_id, name) for pokemon_id, name in pokemon
+        if not cache.restore(pokemon_filename(pokemon_id, name), spoken_name(name))
     ]
 
-    results = await asyncio.gather(*tasks)
+    # Generate missing audio files in parallel (bounded, to avoid throttling)
+    jobs = [pokemon_job(backend, pokemon_id, name) for pokemon_id, name in pending]
+    if args.batch and backend.supports_batch:
+        items = [(pokemon_filename(pokemon_id, name), spoken_name(name)) for pokemon_id, name in pending]
+        results = await run_batched(items, jobs, backend.voice, batch_size=args.batch_size,
+                                    concurrency=args.concurrency, retries=args.retries)
+    else:
+        results = await run_jobs(jobs, concurrency=args.concurrency, retries=args.retries)
+
+    for (pokemon_id, name), result in zip(pending, results):
+        if result:
+            cache.store(pokemon_filename(pokemon_id, name), spoken_name(name))
+
+    if args.prune:
+        cache.prune([pokemon_filename(pokemon_id, name) for pokemon_id, name in pokemon])
+    cache.save()
 
     successful = sum(results)
-    print(f"\n✓ Successfully generated {successful}/{len(POKEMON_NAMES)} audio files")
+    print(f"\n✓ Successfully generated {successful}/{len(pending)} audio files ({cache.summary()})")
     print("Done! Audio files are ready to use in the game.")
 
 if __name__ == "__main__":
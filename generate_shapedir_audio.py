@@ -7,14 +7,25 @@ Components:
 - 2 prefix files (höger/vänster)
 - 24 color-shape combinations
 Total: 26 files
+
+Clips are cached in .tts_cache/ - unchanged phrases are skipped.
+Use --force to re-render everything, --prune to delete stale clips.
+Use --backend to pick the TTS engine (edge-tts, gtts, espeak-ng, piper).
+Clips are rendered concurrently (--concurrency) with retries (--retries).
 """
 
+import argparse
 import asyncio
-import edge_tts
 import os
 
-# Swedish voice for clear pronunciation
-VOICE = "sv-SE-MattiasNeural"  # Male Swedish voice
+from tts_backends import add_backend_arguments, backend_job, get_backend
+from tts_cache import SynthesisCache, add_cache_arguments
+from tts_scheduler import add_scheduler_arguments, run_jobs
+
+# Swedish voice for clear pronunciation (see tts_backends.DEFAULT_VOICES)
+LANG = "sv"
+
+OUTPUT_DIR = "public/shapedir_audio"
 
 # Prefix phrases
 PREFIXES = {
@@ -61,49 +72,51 @@ COLOR_SHAPES = [
     ('purple', 'star', 'lila stjärnan'),
 ]
 
-async def generate_audio(key, text, filename):
-    """Generate TTS audio for a single phrase"""
-    try:
-        print(f"Generating '{key}': '{text}'...", end=" ")
-
-        tts = edge_tts.Communicate(text, VOICE)
-        await tts.save(filename)
-
-        print(f"✓ Saved {filename}")
-        return True
-    except Exception as e:
-        print(f"✗ Error: {e}")
-        return False
+def build_jobs():
+    """All (key, text, filename) components, prefixes first"""
+    jobs = []
+    for direction, text in PREFIXES.items():
+        filename = f"{OUTPUT_DIR}/shapedir_prefix_{direction}.mp3"
+        jobs.append((f"prefix_{direction}", text, filename))
+    for color, shape, text in COLOR_SHAPES:
+        filename = f"{OUTPUT_DIR}/shapedir_{color}_{shape}.mp3"
+        jobs.append((f"{color}_{shape}", text, filename))
+    return jobs
 
 async def main():
+    parser = argparse.ArgumentParser(description="Generate Shape Directions audio")
+    add_backend_arguments(parser)
+    add_cache_arguments(parser)
+    add_scheduler_arguments(parser)
+    args = parser.parse_args()
+    backend = get_backend(args.backend, LANG, args.voice)
+
     # Create output directory
-    os.makedirs("public/shapedir_audio", exist_ok=True)
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
 
     print(f"Generating Swedish TTS audio for Shape Directions game...")
-    print(f"Voice: {VOICE}")
-    print(f"Output: public/shapedir_audio/\n")
+    print(f"Voice: {backend.voice} ({backend.name})")
+    print(f"Output: {OUTPUT_DIR}/\n")
 
-    results = []
+    cache = SynthesisCache(OUTPUT_DIR, engine=backend.name, voice=backend.voice,
+                           options=backend.options, force=args.force)
+    jobs = build_jobs()
+    pending = [job for job in jobs if not cache.restore(job[2], job[1])]
 
-    # Generate prefix files
-    print("=== Generating Prefixes ===")
-    for direction, text in PREFIXES.items():
-        filename = f"public/shapedir_audio/shapedir_prefix_{direction}.mp3"
-        result = await generate_audio(f"prefix_{direction}", text, filename)
-        results.append(result)
+    results = await run_jobs([backend_job(backend, text, filename) for _, text, filename in pending],
+                             concurrency=args.concurrency, retries=args.retries)
+    for (_, text, filename), result in zip(pending, results):
+        if result:
+            cache.store(filename, text)
 
-    print("\n=== Generating Color-Shape Combinations ===")
-    # Generate color-shape combinations
-    for color, shape, text in COLOR_SHAPES:
-        filename = f"public/shapedir_audio/shapedir_{color}_{shape}.mp3"
-        key = f"{color}_{shape}"
-        result = await generate_audio(key, text, filename)
-        results.append(result)
+    if args.prune:
+        cache.prune([filename for _, _, filename in jobs])
+    cache.save()
 
     successful = sum(results)
-    total = len(results)
-    print(f"\n✓ Successfully generated {successful}/{total} audio files")
-    print(f"Saved to: public/shapedir_audio/")
+    total = len(pending)
+    print(f"\n✓ Successfully generated {successful}/{total} audio files ({cache.summary()})")
+    print(f"Saved to: {OUTPUT_DIR}/")
     print("Done! Audio components ready for runtime stitching.")
 
 if __name__ == "__main__":
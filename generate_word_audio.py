@@ -1,46 +1,68 @@
 #!/usr/bin/env python3
 """
 Generate Swedish word audio files for the word spelling minigame
-Requires: pip install gtts
+Requires: pip install gtts (default backend)
+
+Clips are cached in .tts_cache/ - unchanged words are skipped.
+Use --force to re-render everything, --prune to delete stale clips.
+Use --backend to pick the TTS engine (edge-tts, gtts, espeak-ng, piper).
+Clips are rendered concurrently (--concurrency) with retries (--retries).
 """
 
-from gtts import gTTS
+import argparse
+import asyncio
 import os
 
-# All words from speechVocabulary.js
-WORDS = [
-    # Easy
-    'sol', 'katt', 'hund', 'bok', 'boll', 'hus', 'bil', 'båt',
-    'öga', 'arm', 'ben', 'bi', 'ost', 'ko', 'mus',
-    # Medium
-    'äpple', 'blomma', 'träd', 'fågel', 'vatten', 'penna',
-    'lejon', 'bröd', 'glass', 'måne',
-    # Hard
-    'elefant', 'giraff', 'present', 'drake', 'regnbåge',
-    'kanin', 'tiger', 'tomat'
-]
-
-def generate_word_audio():
+import js_sources
+from tts_backends import add_backend_arguments, backend_job, get_backend
+from tts_cache import SynthesisCache, add_cache_arguments
+from tts_scheduler import add_scheduler_arguments, run_jobs
+
+# Read from src/speechVocabulary.js (the game's word list)
+WORDS = js_sources.speech_words()
+
+LANG = 'sv'
+
+# gTTS options (part of the cache key)
+GTTS_OPTIONS = {'slow': False}
+
+OUTPUT_DIR = 'public/word_audio'
+
+def word_filename(word):
+    return os.path.join(OUTPUT_DIR, f'{word}.mp3')
+
+async def generate_word_audio(backend, force=False, prune=False, concurrency=4, retries=4):
     """Generate MP3 audio files for all Swedish words"""
 
     # Create output directory if it doesn't exist
-    output_dir = 'public/word_audio'
-    os.makedirs(output_dir, exist_ok=True)
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
 
     print(f"Generating {len(WORDS)} Swedish word audio files...")
+    print(f"Voice: {backend.voice} ({backend.name})")
+
+    cache = SynthesisCache(OUTPUT_DIR, engine=backend.name, voice=backend.voice,
+                           options=backend.options, force=force)
+    pending = [word for word in WORDS if not cache.restore(word_filename(word), word)]
 
-    for word in WORDS:
-        output_path = os.path.join(output_dir, f'{word}.mp3')
+    jobs = [backend_job(backend, word, word_filename(word)) for word in pending]
+    results = await run_jobs(jobs, concurrency=concurrency, retries=retries)
+    for word, result in zip(pending, results):
+        if result:
+            cache.store(word_filename(word), word)
 
-        try:
-            # Generate Swedish TTS audio
-            tts = gTTS(text=word, lang='sv', slow=False)
-            tts.save(output_path)
-            print(f"✓ Generated: {word}.mp3")
-        except Exception as e:
-            print(f"✗ Failed to generate {word}.mp3: {e}")
+    if prune:
+        cache.prune([word_filename(word) for word in WORDS])
+    cache.save()
 
-    print(f"\nDone! Generated audio files in {output_dir}/")
+    print(f"\nDone! Generated audio files in {OUTPUT_DIR}/ ({cache.summary()})")
 
 if __name__ == '__main__':
-    generate_word_audio()
+    parser = argparse.ArgumentParser(description='Generate Swedish word audio')
+    add_backend_arguments(parser, default='gtts')
+    add_cache_arguments(parser)
+    add_scheduler_arguments(parser, concurrency=4)
+    args = parser.parse_args()
+    options = GTTS_OPTIONS if args.backend == 'gtts' else None
+    backend = get_backend(args.backend, LANG, args.voice, options)
+    asyncio.run(generate_word_audio(backend, force=args.force, prune=args.prune,
+                                    concurrency=args.concurrency, retries=args.retries))
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Read the game's data tables straight from the JS modules in src/
+
+The generators used to keep their own copies of these lists. They now
+parse the JS source of truth instead:
+
+    js_sources.speech_words()     # src/speechVocabulary.js SPEECH_VOCABULARY
+    js_sources.swedish_letters()  # src/letterData.js DEFAULT_SWEDISH_LETTERS
+    js_sources.pokemon_names()    # src/pokemonData.js POKEMON_DATA (either layout)
+
+Only plain literals are supported (arrays, objects, strings, numbers,
+true/false/null, comments, trailing commas, unquoted keys) - which is
+what these modules hold. Anything else raises JSSyntaxError.
+
+    python js_sources.py          # print what each module yields
+"""
+
+import json
+import re
+
+SPEECH_VOCABULARY_JS = "src/speechVocabulary.js"
+LETTER_DATA_JS = "src/letterData.js"
+POKEMON_DATA_JS = "src/pokemonData.js"
+
+TOKEN_RE = re.compile(r"""
+    (?P<space>\s+|//[^\n]*|/\*.*?\*/)
+  | (?P<string>"(?:[^"\\\n]|\\.)*"|'(?:[^'\\\n]|\\.)*')
+  | (?P<number>-?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)
+  | (?P<name>[A-Za-z_$][\w$]*)
+  | (?P<punct>[\[\]{}:,])
+""", re.VERBOSE | re.DOTALL)
+
+CONSTANTS = {"true": True, "false": False, "null": None}
+
+
+class JSSyntaxError(ValueError):
+    pass
+
+
+def tokenize(text, pos=0):
+    """(kind, value, offset) tokens of a JS literal starting at `pos`, comments skipped"""
+    while pos < len(text):
+        match = TOKEN_RE.match(text, pos)
+        if not match:
+            raise JSSyntaxError(f"unexpected {text[pos:pos + 20]!r} at offset {pos}")
+        pos = match.end()
+        if match.lastgroup != "space":
+            yield match.lastgroup, match.group(), match.start()
+
+
+def parse_string(token):
+    body = token[1:-1]
+    if token[0] == "'":
+        # Same escapes as JSON, except \' and an unescaped "
+        body = body.replace("\\'", "'").replace('"', '\\"')
+    return json.loads(f'"{body}"')
+
+
+def parse_value(tokens, token=None):
+    """Python value of the literal whose first token is `token` (or the next one)"""
+    kind, value, offset = token or next(tokens)
+    if kind == "string":
+        return parse_string(value)
+    if kind == "number":
+        return json.loads(value if not value.endswith(".") else value + "0")
+    if kind == "name" and value in CONSTANTS:
+        return CONSTANTS[value]
+    if value == "[":
+        items = []
+        while True:
+            token = next(tokens)
+            if token[1] == "]":
+                return items
+            items.append(parse_value(tokens, token))
+            kind, value, offset = next(tokens)
+            if value == "]":
+                return items
+            if value != ",":
+                raise JSSyntaxError(f"expected ',' or ']' at offset {offset}")
+    if value == "{":
+        obj = {}
+        while True:
+            kind, value, offset = next(tokens)
+            if value == "}":
+                return obj
+            if kind == "string":
+                key = parse_string(value)
+            elif kind in ("name", "number"):
+                key = value
+            else:
+                raise JSSyntaxError(f"expected a key at offset {offset}")
+            if next(tokens)[1] != ":":
+                raise JSSyntaxError(f"expected ':' after {key!r}")
+            obj[key] = parse_value(tokens)
+            kind, value, offset = next(tokens)
+            if value == "}":
+                return obj
+            if value != ",":
+                raise JSSyntaxError(f"expected ',' or '}}' at offset {offset}")
+    raise JSSyntaxError(f"unsupported value {value!r} at offset {offset}")
+
+
+def read_constant(path, name):
+    """Value of `const NAME = <literal>` (exported or not) in the JS module at `path`"""
+    with open(path, encoding="utf-8") as f:
+        text = f.read()
+    match = re.search(rf"\bconst\s+{re.escape(name)}\s*=\s*", text)
+    if not match:
+        raise JSSyntaxError(f"{path}: no 'const {name} = ...'")
+    try:
+        return parse_value(tokenize(text, match.end()))
+    except StopIteration:
+        raise JSSyntaxError(f"{path}: {name} is cut short") from None
+    except JSSyntaxError as e:
+        raise JSSyntaxError(f"{path}: {name}: {e}") from None
+
+
+def speech_words(path=SPEECH_VOCABULARY_JS):
+    """Every vocabulary word, in getAllWords() order (easy, medium, hard)"""
+    vocabulary = read_constant(path, "SPEECH_VOCABULARY")
+    return [entry["word"] for level in ("easy", "medium", "hard") for entry in vocabulary.get(level, [])]
+
+
+def swedish_letters(path=LETTER_DATA_JS):
+    """The default letter set (uppercase, as in the game)"""
+    return read_constant(path, "DEFAULT_SWEDISH_LETTERS")
+
+
+def pokemon_data(path=POKEMON_DATA_JS):
+    """
+    POKEMON_DATA entries ({id, name, filename, types, height, weight, stats})
+    from either layout fetch_pokemon_data.py writes
+    """
+    with open(path, encoding="utf-8") as f:
+        columnar = re.search(r"\bconst\s+COLUMNS\s*=", f.read()) is not None
+    if not columnar:
+        return read_constant(path, "POKEMON_DATA")
+
+    columns = read_constant(path, "COLUMNS")
+    stat_keys = read_constant(path, "STAT_KEYS")
+    return [
+        {
+            "id": pokemon_id,
+            "name": columns["name"][i],
+            "filename": f"{pokemon_id:03d}_{columns['name'][i].lower()}.png",
+            "types": columns["types"][i],
+            "height": columns["height"][i],
+            "weight": columns["weight"][i],
+            "stats": {key: columns[key][i] for key in stat_keys},
+        }
+        for i, pokemon_id in enumerate(columns["id"])
+    ]
+
+
+def pokemon_names(path=POKEMON_DATA_JS):
+    """[(id, name)] for every Pokemon in POKEMON_DATA"""
+    return [(pokemon["id"], pokemon["name"]) for pokemon in pokemon_data(path)]
+
+
+if __name__ == "__main__":
+    print(f"{SPEECH_VOCABULARY_JS}: {' '.join(speech_words())}")
+    print(f"{LETTER_DATA_JS}: {' '.join(swedish_letters())}")
+    names = pokemon_names()
+    print(f"{POKEMON_DATA_JS}: {len(names)} Pokemon ({names[0][1]} ... {names[-1][1]})")
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Read public/config/minigames.json from Python build scripts
+
+Mirrors the parsing the game does at runtime so build steps agree with
+what the minigames will actually ask for.
+"""
+
+import json
+
+CONFIG_PATH = "public/config/minigames.json"
+
+# Same fallback as NumberListeningMode.parseNumberRange
+FALLBACK_NUMBERS = list(range(10, 21))
+
+# Number clips played outside the number minigames
+EXTRA_NUMBER_CLIPS = [1]  # SettingsScene volume test sound
+
+
+def load_config(path=CONFIG_PATH):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def parse_number_range(spec):
+    """
+    Parse a range spec like "10-20,30,40-49" into a sorted list of ints.
+
+    Invalid parts are skipped, like NumberListeningMode.parseNumberRange.
+    """
+    numbers = set()
+    for part in (spec or "").split(","):
+        part = part.strip()
+        try:
+            if "-" in part:
+                start, end = (int(n.strip()) for n in part.split("-", 1))
+                if start < 0 or start > end:
+                    continue
+                numbers.update(range(start, end + 1))
+            elif part:
+                number = int(part)
+                if number >= 0:
+                    numbers.add(number)
+        except ValueError:
+            continue
+    return sorted(numbers) or list(FALLBACK_NUMBERS)
+
+
+def number_clips_for(number):
+    """
+    Clips needed to speak `number`.
+
+    NumberListeningMode stitches 100-399 at runtime as hundreds + remainder
+    (245 = "200" + "45", 300 = "300"); everything else is a single clip.
+    """
+    if 100 <= number < 400:
+        hundreds, remainder = number // 100 * 100, number % 100
+        return [hundreds, remainder] if remainder else [hundreds]
+    return [number]
+
+
+def configured_numbers(config):
+    """Numbers the number minigames can ask for, per config section"""
+    return {
+        "numbers": parse_number_range(config.get("numbers", {}).get("numbers", "10-99")),
+        "legendaryNumbers": parse_number_range(config.get("legendaryNumbers", {}).get("numbers", "0-99")),
+    }
+
+
+def required_number_clips(config):
+    """Minimal sorted set of number clips the configured minigames need"""
+    clips = set(EXTRA_NUMBER_CLIPS)
+    for numbers in configured_numbers(config).values():
+        for number in numbers:
+            clips.update(number_clips_for(number))
+    return sorted(clips)
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Minimal MP3 frame parser (pure Python, no decoding)
+
+Used to cut and join MP3 audio on frame boundaries without re-encoding,
+e.g. splitting a batched edge-tts response into one clip per phrase.
+Only MPEG audio Layer III is supported, which is what edge-tts and gTTS emit.
+"""
+
+# Bitrates in kbps, indexed by the 4-bit bitrate field
+BITRATES_V1_L3 = [0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 0]
+BITRATES_V2_L3 = [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160, 0]
+
+# Sample rates in Hz, indexed by [version][2-bit sample rate field]
+SAMPLE_RATES = {
+    "1": [44100, 48000, 32000],
+    "2": [22050, 24000, 16000],
+    "2.5": [11025, 12000, 8000],
+}
+
+VERSIONS = {0b00: "2.5", 0b10: "2", 0b11: "1"}
+
+
+def skip_id3(data):
+    """Offset of the first byte after a leading ID3v2 tag (0 if there is none)"""
+    if len(data) >= 10 and data[:3] == b"ID3":
+        size = 0
+        for b in data[6:10]:
+            size = (size << 7) | (b & 0x7F)
+        footer = 10 if data[5] & 0x10 else 0
+        return 10 + size + footer
+    return 0
+
+
+def parse_header(data, pos):
+    """
+    Parse the 4-byte frame header at `pos`.
+
+    Returns (frame_length, samples_per_frame, sample_rate) or None if the
+    bytes at `pos` are not a valid Layer III header.
+    """
+    if pos + 4 > len(data):
+        return None
+    b1, b2, b3 = data[pos + 1], data[pos + 2], data[pos + 3]
+    if data[pos] != 0xFF or (b1 & 0xE0) != 0xE0:
+        return None
+
+    version = VERSIONS.get((b1 >> 3) & 0x03)
+    layer = (b1 >> 1) & 0x03
+    if version is None or layer != 0b01:  # 0b01 == Layer III
+        return None
+
+    bitrate_index = (b2 >> 4) & 0x0F
+    rate_index = (b2 >> 2) & 0x03
+    padding = (b2 >> 1) & 0x01
+    if rate_index == 3:
+        return None
+
+    table = BITRATES_V1_L3 if version == "1" else BITRATES_V2_L3
+    bitrate = table[bitrate_index] * 1000
+    if bitrate == 0:
+        return None
+
+    sample_rate = SAMPLE_RATES[version][rate_index]
+    samples = 1152 if version == "1" else 576
+    length = (samples // 8) * bitrate // sample_rate + padding
+    return length, samples, sample_rate
+
+
+def parse_frames(data):
+    """
+    List every audio frame in `data` as (offset, length, start_seconds).
+
+    Garbage between frames (e.g. a trailing ID3v1 tag) is skipped.
+    """
+    frames = []
+    pos = skip_id3(data)
+    t = 0.0
+    while pos + 4 <= len(data):
+        header = parse_header(data, pos)
+        if header is None:
+            pos += 1
+            continue
+        length, samples, sample_rate = header
+        if pos + length > len(data):
+            break
+        frames.append((pos, length, t))
+        t += samples / sample_rate
+        pos += length
+    return frames
+
+
+def duration(data):
+    """Duration of an MP3 byte string in seconds"""
+    frames = parse_frames(data)
+    if not frames:
+        return 0.0
+    offset, _, start = frames[-1]
+    _, samples, sample_rate = parse_header(data, offset)
+    return start + samples / sample_rate
+
+
+def slice_seconds(data, frames, start, end):
+    """Bytes of every frame whose start time lies in [start, end)"""
+    return b"".join(
+        data[offset:offset + length]
+        for offset, length, t in frames
+        if start <= t < end
+    )
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Pack each audio category into a single Phaser audio sprite
+Output: public/audio_sprites/{category}.mp3 + {category}.json
+
+BootScene queues one this.load.audio per clip (~450 requests). This build
+step concatenates every clip of a category (the directories the
+generate_*_audio.py scripts write to) into one mp3 with a short silence
+between clips, and writes Phaser audioSprite JSON whose marker names are
+the same keys BootScene uses today (letter_audio_a, number_audio_12,
+pokemon_audio_25, day_1_mandag, shapedir_blue_circle, ...):
+
+    this.load.audioSprite('letter_audio', 'audio_sprites/letter_audio.json',
+                          'audio_sprites/letter_audio.mp3');
+    this.sound.playAudioSprite('letter_audio', 'letter_audio_a');
+
+Packing is incremental: a category is only re-encoded when its input files
+(names, sizes, mtimes) or the packing settings change.
+Requires ffmpeg.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import build_events
+import mp3_frames
+
+AUDIO_ROOT = Path("public")
+OUTPUT_DIR = AUDIO_ROOT / "audio_sprites"
+STATE_FILE = Path(".build_cache") / "audio_sprites.json"
+
+GAP = 0.3            # seconds of silence between clips
+SAMPLE_RATE = 24000  # matches edge-tts output
+BITRATE = "64k"
+
+
+def pokemon_key(stem):
+    # 025_pikachu -> pokemon_audio_25
+    return f"pokemon_audio_{int(stem.split('_')[0])}"
+
+
+# Category directory -> function mapping a file stem to its BootScene key
+CATEGORIES = {
+    "letter_audio": lambda stem: f"letter_audio_{stem}",
+    "number_audio": lambda stem: f"number_audio_{stem}",
+    "word_audio": lambda stem: f"word_audio_{stem}",
+    "direction_audio": lambda stem: f"direction_audio_{stem}",
+    "day_audio": lambda stem: stem,
+    "shapedir_audio": lambda stem: stem,
+    "pokemon_audio": pokemon_key,
+}
+
+
+def category_inputs(category):
+    """All clips of a category, sorted by name (skips stray files like '.mp3')"""
+    directory = AUDIO_ROOT / category
+    return sorted(p for p in directory.glob("*.mp3") if p.stem and not p.name.startswith("."))
+
+
+def fingerprint(files, gap, bitrate):
+    """Cheap change detector for a category: names, sizes and mtimes plus settings"""
+    h = hashlib.sha256(f"{gap}|{bitrate}|{SAMPLE_RATE}".encode())
+    for path in files:
+        stat = path.stat()
+        h.update(f"{path.name}|{stat.st_size}|{stat.st_mtime_ns}\n".encode())
+    return h.hexdigest()
+
+
+def build_spritemap(category, files, gap):
+    """Marker start/end offsets (seconds) for clips laid out back to back with `gap` between"""
+    to_key = CATEGORIES[category]
+    spritemap = {}
+    position = 0.0
+    for path in files:
+        length = mp3_frames.duration(path.read_bytes())
+        spritemap[to_key(path.stem)] = {
+            "start": round(position, 3),
+            "end": round(position + length, 3),
+            "loop": False,
+        }
+        position += length + gap
+    return spritemap
+
+
+def encode_sprite(files, output_path, gap, bitrate):
+    """Concatenate clips with ffmpeg (resampled to mono, padded by `gap`) into one mp3"""
+    cmd = ["ffmpeg", "-hide_banner", "-loglevel", "error"]
+    for path in files:
+        cmd += ["-i", str(path)]
+
+    filters = [
+        f"[{i}:a]aresample={SAMPLE_RATE},aformat=sample_fmts=s16:channel_layouts=mono,"
+        f"apad=pad_dur={gap}[a{i}]"
+        for i in range(len(files))
+    ]
+    inputs = "".join(f"[a{i}]" for i in range(len(files)))
+    filters.append(f"{inputs}concat=n={len(files)}:v=0:a=1[out]")
+
+    fd, tmp_path = tempfile.mkstemp(dir=output_path.parent, prefix=".", suffix=".mp3")
+    os.close(fd)
+    try:
+        cmd += ["-filter_complex", ";".join(filters), "-map", "[out]",
+                "-ac", "1", "-ar", str(SAMPLE_RATE), "-b:a", bitrate, "-y", tmp_path]
+        with build_events.asset(output_path, clips=len(files)) as event:
+            event.cache = "miss"
+            with event.stage("ffmpeg"):
+                subprocess.run(cmd, capture_output=True, check=True)
+            os.replace(tmp_path, output_path)
+            event.bytes = output_path.stat().st_size
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def pack_category(category, state, gap, bitrate, force):
+    """Pack one category. Returns (category, status message, new fingerprint or None)"""
+    files = category_inputs(category)
+    if not files:
+        return category, "✗ no clips found", None
+
+    mp3_path = OUTPUT_DIR / f"{category}.mp3"
+    json_path = OUTPUT_DIR / f"{category}.json"
+    current = fingerprint(files, gap, bitrate)
+
+    if not force and state.get(category) == current and mp3_path.exists() and json_path.exists():
+        return category, f"✓ up to date ({len(files)} clips)", current
+
+    try:
+        encode_sprite(files, mp3_path, gap, bitrate)
+    except subprocess.CalledProcessError as e:
+        return category, f"✗ ffmpeg failed: {e.stderr.decode(errors='replace').strip()}", None
+    except FileNotFoundError:
+        return category, "✗ ffmpeg not found (install ffmpeg to pack sprites)", None
+
+    sprite = {
+        "resources": [f"{category}.mp3"],
+        "spritemap": build_spritemap(category, files, gap),
+    }
+    with open(json_path, "w", encoding="utf-8") as f:
+        json.dump(sprite, f, indent=2, ensure_ascii=False)
+
+    size_kb = mp3_path.stat().st_size / 1024
+    return category, f"✓ packed {len(files)} clips ({size_kb:.0f} KB)", current
+
+
+def load_state():
+    try:
+        with open(STATE_FILE, encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_state(state):
+    STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    with open(STATE_FILE, "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=2, sort_keys=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pack audio categories into Phaser audio sprites")
+    parser.add_argument("categories", nargs="*", default=sorted(CATEGORIES),
+                        help="Categories to pack (default: all)")
+    parser.add_argument("--gap", type=float, default=GAP,
+                        help=f"Seconds of silence between clips (default: {GAP})")
+    parser.add_argument("--bitrate", default=BITRATE,
+                        help=f"Sprite mp3 bitrate (default: {BITRATE})")
+    parser.add_argument("--force", action="store_true",
+                        help="Re-pack every category even if its inputs are unchanged")
+    args = parser.parse_args()
+
+    unknown = set(args.categories) - set(CATEGORIES)
+    if unknown:
+        parser.error(f"unknown categories: {', '.join(sorted(unknown))}")
+
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    state = load_state()
+
+    print(f"Packing {len(args.categories)} audio categories into {OUTPUT_DIR}/...\n")
+
+    # Each category is one ffmpeg process - run them side by side
+    with ThreadPoolExecutor() as pool:
+        results = list(pool.map(
+            lambda c: pack_category(c, state, args.gap, args.bitrate, args.force),
+            args.categories))
+
+    for category, message, current in results:
+        print(f"{category}: {message}")
+        if current:
+            state[category] = current
+    save_state(state)
+
+    packed = sum(1 for _, _, current in results if current)
+    print(f"\n✓ {packed}/{len(results)} audio sprites ready in {OUTPUT_DIR}/")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+Shared HTTP layer for the PokeAPI download scripts
+
+- One pooled requests.Session (keep-alive, retries on 429/5xx)
+- On-disk response cache keyed by URL (.build_cache/http/). Responses
+  younger than POKEAPI_MAX_AGE seconds (default: 1 day) are served from
+  disk; older ones are revalidated with If-None-Match/If-Modified-Since, so
+  an unchanged document costs one 304 instead of a full download
+- Offline mode (POKEAPI_OFFLINE=1): serve only from the cache
+- Snapshot export and a tiny local mirror server, so builds and tests can
+  run fully offline at disk speed:
+
+    python pokeapi_http.py export pokeapi_snapshot
+    python pokeapi_http.py serve pokeapi_snapshot --port 8765
+    POKEAPI_MIRROR=http://localhost:8765 python fetch_pokemon_data.py
+
+With POKEAPI_MIRROR set, https://host/path is requested as
+$POKEAPI_MIRROR/host/path, which covers pokeapi.co as well as the
+raw.githubusercontent.com sprite URLs.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+import build_events
+
+CACHE_DIR = os.path.join(".build_cache", "http")
+SNAPSHOT_DIR = "pokeapi_snapshot"
+DEFAULT_MAX_AGE = 24 * 60 * 60
+POOL_SIZE = 32
+TIMEOUT = 10
+
+
+class OfflineCacheMiss(requests.exceptions.RequestException):
+    """Raised in offline mode for a URL that is not in the cache"""
+
+
+class CachedSession:
+    """requests.Session with connection pooling and a revalidating disk cache"""
+
+    def __init__(self, cache_dir=CACHE_DIR, max_age=None, offline=None, mirror=None,
+                 pool_size=POOL_SIZE):
+        self.cache_dir = cache_dir
+        self.max_age = float(os.environ.get("POKEAPI_MAX_AGE", DEFAULT_MAX_AGE)) if max_age is None else max_age
+        self.offline = os.environ.get("POKEAPI_OFFLINE") == "1" if offline is None else offline
+        self.mirror = (os.environ.get("POKEAPI_MIRROR") if mirror is None else mirror) or None
+
+        retry = Retry(total=4, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504],
+                      allowed_methods=["GET"])
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self.session = requests.Session()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        self._lock = threading.Lock()
+        self.stats = {"fresh": 0, "revalidated": 0, "downloaded": 0}
+
+    def _paths(self, url):
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        base = os.path.join(self.cache_dir, key[:2], key)
+        return base + ".body", base + ".json"
+
+    def _load(self, url):
+        body_path, meta_path = self._paths(url)
+        try:
+            with open(meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+            with open(body_path, "rb") as f:
+                return f.read(), meta
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None, None
+
+    def _store(self, url, body, meta):
+        body_path, meta_path = self._paths(url)
+        os.makedirs(os.path.dirname(body_path), exist_ok=True)
+        for path, data, mode in ((body_path, body, "wb"),
+                                 (meta_path, json.dumps(meta, indent=2).encode("utf-8"), "wb")):
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, mode) as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+
+    def _count(self, stat):
+        with self._lock:
+            self.stats[stat] += 1
+
+    def request_url(self, url):
+        """URL actually requested (rewritten to the local mirror if one is set)"""
+        if not self.mirror:
+            return url
+        parts = urlsplit(url)
+        query = f"?{parts.query}" if parts.query else ""
+        return f"{self.mirror.rstrip('/')}/{parts.netloc}{parts.path}{query}"
+
+    def get(self, url, timeout=TIMEOUT):
+        """Response body for `url` as bytes (raises requests exceptions on failure)"""
+        with build_events.asset(url) as event:
+            body = self._get(url, timeout, event)
+            event.bytes = len(body)
+            return body
+
+    def _get(self, url, timeout, event):
+        body, meta = self._load(url)
+
+        if body is not None and (self.offline or time.time() - meta["fetched_at"] < self.max_age):
+            self._count("fresh")
+            event.cache = "fresh"
+            return body
+        if self.offline:
+            raise OfflineCacheMiss(f"{url} is not cached (offline mode)")
+
+        headers = {}
+        if meta:
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+
+        with event.stage("http"):
+            response = self.session.get(self.request_url(url), headers=headers, timeout=timeout)
+        if response.status_code == 304 and body is not None:
+            meta["fetched_at"] = time.time()
+            self._store(url, body, meta)
+            self._count("revalidated")
+            event.cache = "revalidated"
+            return body
+
+        response.raise_for_status()
+        self._store(url, response.content, {
+            "url": url,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "content_type": response.headers.get("Content-Type"),
+            "fetched_at": time.time(),
+        })
+        self._count("downloaded")
+        event.cache = "downloaded"
+        return response.content
+
+    def get_json(self, url, timeout=TIMEOUT):
+        return json.loads(self.get(url, timeout=timeout))
+
+    def summary(self):
+        return (f"{self.stats['fresh']} from cache, {self.stats['revalidated']} revalidated (304), "
+                f"{self.stats['downloaded']} downloaded")
+
+    def cached_entries(self):
+        """(url, body_path, meta) for every cached response"""
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if name.endswith(".json"):
+                    with open(os.path.join(root, name), encoding="utf-8") as f:
+                        meta = json.load(f)
+                    yield meta["url"], os.path.join(root, name[:-5] + ".body"), meta
+
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def session():
+    """Process-wide shared CachedSession"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = CachedSession()
+        return _session
+
+
+def get(url, timeout=TIMEOUT):
+    return session().get(url, timeout=timeout)
+
+
+def get_json(url, timeout=TIMEOUT):
+    return session().get_json(url, timeout=timeout)
+
+
+def export_snapshot(snapshot_dir=SNAPSHOT_DIR, cache_dir=CACHE_DIR):
+    """Copy every cached response into a self-contained snapshot directory"""
+    cache = CachedSession(cache_dir=cache_dir, offline=True)
+    os.makedirs(snapshot_dir, exist_ok=True)
+    index = {}
+    for url, body_path, meta in cache.cached_entries():
+        filename = os.path.basename(body_path)
+        shutil.copyfile(body_path, os.path.join(snapshot_dir, filename))
+        index[url] = {
+            "file": filename,
+            "etag": meta.get("etag"),
+            "last_modified": meta.get("last_modified"),
+            "content_type": meta.get("content_type"),
+        }
+    with open(os.path.join(snapshot_dir, "index.json"), "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=2, sort_keys=True)
+    return len(index)
+
+
+def make_mirror_handler(snapshot_dir):
+    """Request handler serving /<host>/<path> from a snapshot made by export_snapshot"""
+    with open(os.path.join(snapshot_dir, "index.json"), encoding="utf-8") as f:
+        index = json.load(f)
+
+    class MirrorHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = f"https://{self.path.lstrip('/')}"
+            entry = index.get(url)
+            if entry is None:
+                self.send_error(404, f"{url} is not in the snapshot")
+                return
+
+            etag = entry.get("etag") or f"\"{entry['file'][:16]}\""
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.end_headers()
+                return
+
+            with open(os.path.join(snapshot_dir, entry["file"]), "rb") as f:
+                body = f.read()
+            self.send_response(200)
+            self.send_header("Content-Type", entry.get("content_type") or "application/octet-stream")
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("ETag", etag)
+            self.send_header("Last-Modified", entry.get("last_modified") or formatdate(usegmt=True))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass  # Keep build output quiet
+
+    return MirrorHandler
+
+
+def serve_snapshot(snapshot_dir=SNAPSHOT_DIR, host="127.0.0.1", port=8765):
+    """Create (but don't start) a mirror server for `snapshot_dir`"""
+    return ThreadingHTTPServer((host, port), make_mirror_handler(snapshot_dir))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PokeAPI response cache tools")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    export = commands.add_parser("export", help="Export the response cache as a snapshot")
+    export.add_argument("snapshot_dir", nargs="?", default=SNAPSHOT_DIR)
+
+    serve = commands.add_parser("serve", help="Serve a snapshot as a local PokeAPI mirror")
+    serve.add_argument("snapshot_dir", nargs="?", default=SNAPSHOT_DIR)
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8765)
+
+    args = parser.parse_args()
+
+    if args.command == "export":
+        count = export_snapshot(args.snapshot_dir)
+        print(f"✓ Exported {count} cached responses to {args.snapshot_dir}/")
+    else:
+        server = serve_snapshot(args.snapshot_dir, args.host, args.port)
+        print(f"Serving {args.snapshot_dir}/ at http://{args.host}:{args.port}")
+        print(f"Use: POKEAPI_MIRROR=http://{args.host}:{args.port} python fetch_pokemon_data.py")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            print("\nStopped")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Process type icons to create circular icon-only versions
+Output: public/type_icons_circular/{type_id}.png (+ @{n}x/ variants)
+
+Crops the left part of each type badge (the symbol, before the type
+name) and cuts it out with an anti-aliased circle. All icons of a set
+are loaded once and masked together as one NumPy array, so there is no
+ImageMagick dependency and no process per icon.
+
+Icon sets describe where the symbol sits in the downloaded badges; add an
+entry to ICON_SETS if download_type_icons.py switches generation.
+
+Extra scales (--scales 2 4) are rendered from a Lanczos upscale of the
+crop with the circle mask computed at the target resolution, so edges
+stay smooth when MainGameScene draws the icons at 3.5x.
+Requires: pip install pillow numpy
+"""
+
+import argparse
+import os
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+NUM_TYPES = 18
+
+ICON_SETS = {
+    # generation-ix/scarlet-violet badges: symbol in a 60x40 box at the left edge
+    "scarlet-violet": {
+        "input_dir": "public/type_icons",
+        "output_dir": "public/type_icons_circular",
+        "crop": (0, 0, 60, 40),  # left, top, width, height
+        "center": (30, 20),
+        "radius": 20,
+    },
+}
+
+
+def circle_mask(width, height, center, radius, scale=1):
+    """Anti-aliased circle coverage (0..1) for a width x height crop rendered at `scale`"""
+    ys, xs = np.mgrid[0:height * scale, 0:width * scale].astype(np.float32)
+    # Distance from each pixel center to the circle center, in output pixels
+    distance = np.hypot(xs + 0.5 - center[0] * scale, ys + 0.5 - center[1] * scale)
+    return np.clip(radius * scale + 0.5 - distance, 0.0, 1.0)
+
+
+def load_crops(paths, crop, scale=1):
+    """Stack the cropped (and optionally upscaled) icons into an (N, H, W, 4) uint8 array"""
+    left, top, width, height = crop
+    crops = []
+    for path in paths:
+        with Image.open(path) as image:
+            region = image.convert("RGBA").crop((left, top, left + width, top + height))
+            if scale != 1:
+                region = region.resize((width * scale, height * scale), Image.LANCZOS)
+            crops.append(np.asarray(region))
+    return np.stack(crops)
+
+
+def apply_mask(icons, mask):
+    """Multiply every icon's alpha by the circle mask"""
+    masked = icons.copy()
+    masked[..., 3] = np.round(icons[..., 3].astype(np.float32) * mask).astype(np.uint8)
+    return masked
+
+
+def save_icons(icons, type_ids, output_dir):
+    os.makedirs(output_dir, exist_ok=True)
+    for type_id, pixels in zip(type_ids, icons):
+        path = Path(output_dir) / f"{type_id}.png"
+        tmp_path = path.with_name(f".{path.name}")
+        Image.fromarray(pixels, "RGBA").save(tmp_path, "PNG", optimize=True)
+        os.replace(tmp_path, path)
+
+
+def process_icon_set(icon_set, scales=(1,)):
+    """Crop and mask every icon in `icon_set`. Returns the type ids processed"""
+    type_ids = []
+    paths = []
+    for type_id in range(1, NUM_TYPES + 1):
+        path = Path(icon_set["input_dir"]) / f"{type_id}.png"
+        if path.exists():
+            type_ids.append(type_id)
+            paths.append(path)
+        else:
+            print(f"  ✗ File not found: {path}")
+    if not paths:
+        return []
+
+    _, _, width, height = icon_set["crop"]
+    for scale in scales:
+        icons = load_crops(paths, icon_set["crop"], scale)
+        mask = circle_mask(width, height, icon_set["center"], icon_set["radius"], scale)
+        output_dir = icon_set["output_dir"] if scale == 1 else os.path.join(icon_set["output_dir"], f"@{scale}x")
+        save_icons(apply_mask(icons, mask), type_ids, output_dir)
+        print(f"  ✓ {len(type_ids)} icons at {width * scale}x{height * scale} -> {output_dir}/")
+
+    return type_ids
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Create circular type icons from the type badges")
+    parser.add_argument("--set", dest="icon_set", choices=sorted(ICON_SETS), default="scarlet-violet",
+                        help="Icon set geometry (default: scarlet-violet)")
+    parser.add_argument("--scales", type=int, nargs="+", default=[1],
+                        help="Output scales; 1 writes type_icons_circular/, n writes @{n}x/ (default: 1)")
+    args = parser.parse_args()
+
+    print("Processing type icons...")
+    type_ids = process_icon_set(ICON_SETS[args.icon_set], sorted(set(args.scales)))
+
+    print(f"\n✓ Processing complete! Created {len(type_ids)} circular icons in "
+          f"{ICON_SETS[args.icon_set]['output_dir']}")
+
+
+if __name__ == "__main__":
+    main()
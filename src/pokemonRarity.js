@@ -37,6 +37,11 @@ const LEGENDARY_IDS = [144, 145, 146, 150, 151]; // Articuno, Zapdos, Moltres, M
  * @returns {string} Rarity tier ('common', 'uncommon', 'rare', 'legendary')
  */
 export function getPokemonRarity(pokemon) {
+  // Precomputed by fetch_pokemon_data.py (columnar layout)
+  if (pokemon.rarity) {
+    return pokemon.rarity;
+  }
+
   // Check if legendary
   if (LEGENDARY_IDS.includes(pokemon.id)) {
     return 'legendary';
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Pre-stitch composite phrases into single gapless clips
+Output: public/composite_audio/*.mp3 + public/composite_audio/manifest.json
+
+At runtime NumberListeningMode plays 245 as "200" then "45", and
+ShapeDirectionsMode plays "shapedir_prefix_hoger" then
+"shapedir_blue_circle", waiting on durations/'complete' events in between.
+This stage builds each composite offline from the existing clips: the
+inner silence of every part is trimmed (same NumPy analysis as
+trim_audio_silence.py), the parts are joined with a short pause and
+crossfade, and the result is encoded once.
+
+Composites:
+- number_audio_{n} for every configured number 100-399 with a remainder
+  (from public/config/minigames.json)
+- shapedir_{direction}_{color}_{shape} for every prefix x color-shape pair
+
+manifest.json maps each composite key to its file, duration and parts so
+the game can play a single buffer. Nothing is re-synthesized, and only
+composites whose parts (or the stitch settings) changed are rebuilt.
+Requires: pip install numpy, and ffmpeg on the PATH.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+import audio_pcm
+import build_events
+from generate_shapedir_audio import COLOR_SHAPES, PREFIXES
+from minigame_config import CONFIG_PATH, configured_numbers, load_config, number_clips_for
+
+PUBLIC_DIR = Path("public")
+OUTPUT_DIR = PUBLIC_DIR / "composite_audio"
+STATE_FILE = Path(".build_cache") / "composite_audio.json"
+
+SAMPLE_RATE = 24000
+THRESHOLD_DB = -50.0
+PAUSE = 0.05       # seconds between parts (NumberListeningMode used a 50 ms gap)
+CROSSFADE = 0.015  # seconds of equal-power crossfade at each join
+EDGE_PADDING = 0.02  # silence kept around each trimmed part
+
+
+def composite_definitions(config):
+    """{key: (output filename, [part paths relative to public/])}"""
+    composites = {}
+
+    numbers = set()
+    for section in configured_numbers(config).values():
+        numbers.update(n for n in section if 100 <= n < 400 and n % 100)
+    for number in sorted(numbers):
+        parts = [f"number_audio/{clip}.mp3" for clip in number_clips_for(number)]
+        composites[f"number_audio_{number}"] = (f"number_{number}.mp3", parts)
+
+    for direction in PREFIXES:
+        for color, shape, _ in COLOR_SHAPES:
+            key = f"shapedir_{direction}_{color}_{shape}"
+            parts = [f"shapedir_audio/shapedir_prefix_{direction}.mp3",
+                     f"shapedir_audio/shapedir_{color}_{shape}.mp3"]
+            composites[key] = (f"{key}.mp3", parts)
+
+    return composites
+
+
+def trim_part(samples, sample_rate, threshold_db=THRESHOLD_DB, padding=EDGE_PADDING):
+    bounds = audio_pcm.silence_bounds(samples, sample_rate, threshold_db)
+    if bounds is None:
+        return samples
+    start = max(0, int((bounds[0] - padding) * sample_rate))
+    end = min(len(samples), int((bounds[1] + padding) * sample_rate))
+    return samples[start:end]
+
+
+def join_parts(parts, sample_rate, pause=PAUSE, crossfade=CROSSFADE):
+    """Concatenate parts with `pause` seconds of silence and an equal-power crossfade per join"""
+    result = parts[0]
+    fade = int(crossfade * sample_rate)
+    silence = np.zeros(int(pause * sample_rate), dtype=np.float32)
+
+    for part in parts[1:]:
+        part = np.concatenate([silence, part])
+        n = min(fade, len(result), len(part))
+        if n == 0:
+            result = np.concatenate([result, part])
+            continue
+        t = np.linspace(0.0, np.pi / 2, n, dtype=np.float32)
+        overlap = result[-n:] * np.cos(t) + part[:n] * np.sin(t)
+        result = np.concatenate([result[:-n], overlap, part[n:]])
+
+    return result
+
+
+def part_signature(path):
+    stat = path.stat()
+    return f"{path}:{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def fingerprint(parts, settings):
+    h = hashlib.sha256(settings.encode())
+    for part in parts:
+        h.update(part_signature(PUBLIC_DIR / part).encode())
+    return h.hexdigest()
+
+
+def write_composite(samples, output_path, bitrate):
+    fd, tmp_path = tempfile.mkstemp(dir=output_path.parent, prefix=".", suffix=".mp3")
+    os.close(fd)
+    try:
+        audio_pcm.encode(samples, SAMPLE_RATE, tmp_path, bitrate=bitrate)
+        os.replace(tmp_path, output_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def load_json(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_json(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, sort_keys=True, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pre-stitch composite audio phrases")
+    parser.add_argument("--config", default=CONFIG_PATH,
+                        help=f"Minigame config to read number ranges from (default: {CONFIG_PATH})")
+    parser.add_argument("--pause", type=float, default=PAUSE,
+                        help=f"Seconds of silence between parts (default: {PAUSE})")
+    parser.add_argument("--crossfade", type=float, default=CROSSFADE,
+                        help=f"Crossfade length in seconds (default: {CROSSFADE})")
+    parser.add_argument("--bitrate", default="64k", help="Bitrate for composite clips (default: 64k)")
+    parser.add_argument("--force", action="store_true", help="Rebuild every composite")
+    args = parser.parse_args()
+
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    manifest_path = OUTPUT_DIR / "manifest.json"
+    composites = composite_definitions(load_config(args.config))
+    state = {} if args.force else load_json(STATE_FILE)
+    manifest = load_json(manifest_path)
+    settings = f"{args.pause}:{args.crossfade}:{args.bitrate}:{THRESHOLD_DB}:{EDGE_PADDING}"
+
+    print(f"Stitching {len(composites)} composite clips into {OUTPUT_DIR}/...")
+
+    pending = {}
+    missing = set()
+    up_to_date = 0
+    for key, (filename, parts) in composites.items():
+        absent = [p for p in parts if not (PUBLIC_DIR / p).exists()]
+        if absent:
+            missing.update(absent)
+            continue
+        current = fingerprint(parts, settings)
+        if state.get(key) == current and (OUTPUT_DIR / filename).exists() and key in manifest:
+            up_to_date += 1
+            continue
+        pending[key] = current
+
+    for part in sorted(missing):
+        print(f"✗ Missing part public/{part} - run the generator scripts first")
+
+    # Decode each distinct part once, trimmed, at a common sample rate
+    needed = sorted({p for key in pending for p in composites[key][1]})
+
+    def decode_part(part):
+        """Never raises: a part that fails to decode is returned with its error"""
+        with build_events.asset(PUBLIC_DIR / part) as event:
+            try:
+                with event.stage("decode"):
+                    samples, _ = audio_pcm.decode(PUBLIC_DIR / part, sample_rate=SAMPLE_RATE)
+            except (subprocess.CalledProcessError, OSError) as e:
+                event.status = "error"
+                return part, None, str(e)
+            return part, trim_part(samples, SAMPLE_RATE), None
+
+    def build(key):
+        filename, parts = composites[key]
+        with build_events.asset(OUTPUT_DIR / filename) as event:
+            event.cache = "miss"
+            with event.stage("join"):
+                samples = join_parts([decoded[p] for p in parts], SAMPLE_RATE, args.pause, args.crossfade)
+            try:
+                with event.stage("encode"):
+                    write_composite(samples, OUTPUT_DIR / filename, args.bitrate)
+            except (subprocess.CalledProcessError, OSError) as e:
+                event.status = "error"
+                return key, None, str(e)
+            event.bytes = (OUTPUT_DIR / filename).stat().st_size
+            return key, round(len(samples) / SAMPLE_RATE, 3), None
+
+    with ThreadPoolExecutor() as pool:
+        decoded = {}
+        undecodable = {}
+        for part, samples, error in pool.map(decode_part, needed):
+            if error:
+                undecodable[part] = error
+                print(f"✗ Failed to decode public/{part}: {error}")
+            else:
+                decoded[part] = samples
+
+        # Composites built from a part that failed to decode are skipped
+        skipped = [key for key in pending if any(p in undecodable for p in composites[key][1])]
+        for key in skipped:
+            bad = ", ".join(p for p in composites[key][1] if p in undecodable)
+            print(f"✗ Skipping {key}: {bad} failed to decode")
+        results = list(pool.map(build, [key for key in pending if key not in skipped]))
+
+    built = 0
+    failed = len(skipped)
+    for key, duration, error in results:
+        if error:
+            print(f"✗ Failed to stitch {key}: {error}")
+            failed += 1
+            continue
+        filename, parts = composites[key]
+        manifest[key] = {
+            "file": f"{OUTPUT_DIR.name}/{filename}",
+            "duration": duration,
+            "parts": parts,
+        }
+        state[key] = pending[key]
+        built += 1
+
+    # Drop composites that are no longer configured
+    for key in sorted(set(manifest) - set(composites)):
+        stale = OUTPUT_DIR / Path(manifest.pop(key)["file"]).name
+        if stale.exists():
+            stale.unlink()
+        state.pop(key, None)
+        print(f"✗ Removed stale composite {key}")
+
+    save_json(manifest_path, manifest)
+    save_json(STATE_FILE, state)
+
+    print(f"\n✓ Stitched {built} clips, {up_to_date} up to date")
+    print(f"Manifest: {manifest_path}")
+    if failed:
+        print(f"✗ {failed} composites failed")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Transcode game audio clips to mono low-bitrate Opus
+Output: public/<dir>/<name>.ogg next to every public/<dir>/<name>.mp3
+
+The .ogg keeps the clip's name, so BootScene can offer both formats and
+let Phaser pick the first one the browser plays, with the MP3 as fallback:
+
+    this.load.audio(key, [`letter_audio/${letter}.ogg`, `letter_audio/${letter}.mp3`]);
+
+Speech clips need far less than the TTS engines' default MP3 bitrates:
+Opus at 24 kbit/s mono (VoIP tuning) is transparent for a single voice.
+
+Clips are encoded in parallel (one ffmpeg per clip, on a thread pool).
+Source signatures are cached in .build_cache/transcode_audio.json, so only
+new or changed clips (or a change of settings) are re-encoded. A before/
+after size report per directory is printed at the end.
+Requires: ffmpeg with libopus on the PATH.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+import build_events
+
+CACHE_FILE = Path(".build_cache") / "transcode_audio.json"
+BITRATE = "24k"
+
+
+def default_directories():
+    return sorted(str(p) for p in Path("public").glob("*_audio") if p.is_dir())
+
+
+def audio_files(directories):
+    files = []
+    for directory in directories:
+        files += sorted(p for p in Path(directory).glob("*.mp3") if not p.name.startswith("."))
+    return files
+
+
+def file_signature(path):
+    stat = path.stat()
+    return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def transcode_file(path, bitrate=BITRATE):
+    """Encode one clip to <name>.ogg (Opus, mono) next to it, atomically"""
+    output_path = path.with_suffix(".ogg")
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".", suffix=".ogg")
+    os.close(fd)
+    with build_events.asset(output_path, source=str(path)) as event:
+        event.cache = "miss"
+        try:
+            with event.stage("ffmpeg"):
+                subprocess.run(
+                    ["ffmpeg", "-hide_banner", "-loglevel", "error", "-y", "-i", str(path),
+                     "-ac", "1", "-c:a", "libopus", "-b:a", bitrate, "-vbr", "on",
+                     "-application", "voip", "-map_metadata", "-1", tmp_path],
+                    capture_output=True, check=True,
+                )
+            os.replace(tmp_path, output_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        event.bytes = output_path.stat().st_size
+    return output_path
+
+
+def size_report(directories):
+    """[(directory, clips, mp3 bytes, ogg bytes)] for clips that have both formats"""
+    report = []
+    for directory in directories:
+        clips = mp3_bytes = ogg_bytes = 0
+        for path in audio_files([directory]):
+            ogg = path.with_suffix(".ogg")
+            if ogg.exists():
+                clips += 1
+                mp3_bytes += path.stat().st_size
+                ogg_bytes += ogg.stat().st_size
+        report.append((directory, clips, mp3_bytes, ogg_bytes))
+    return report
+
+
+def load_cache():
+    try:
+        with open(CACHE_FILE, encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_cache(cache):
+    CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    with open(CACHE_FILE, "w", encoding="utf-8") as f:
+        json.dump(cache, f, indent=2, sort_keys=True, ensure_ascii=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Transcode audio clips to Opus (.ogg) with MP3 fallback")
+    parser.add_argument("directories", nargs="*", default=None,
+                        help="Audio directories to transcode (default: public/*_audio)")
+    parser.add_argument("--bitrate", default=BITRATE, help=f"Opus bitrate (default: {BITRATE})")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(),
+                        help="Parallel ffmpeg processes (default: one per CPU)")
+    parser.add_argument("--force", action="store_true", help="Re-encode every clip")
+    args = parser.parse_args()
+
+    directories = args.directories or default_directories()
+    files = audio_files(directories)
+    cache = {} if args.force else load_cache()
+
+    pending = [
+        path for path in files
+        if cache.get(str(path)) != f"{file_signature(path)}:{args.bitrate}"
+        or not path.with_suffix(".ogg").exists()
+    ]
+
+    print(f"Transcoding {len(pending)} of {len(files)} clips to Opus {args.bitrate} "
+          f"({len(files) - len(pending)} up to date)...")
+
+    failed = 0
+    with ThreadPoolExecutor(max_workers=args.workers) as pool:
+        futures = {pool.submit(transcode_file, path, args.bitrate): path for path in pending}
+        for future in as_completed(futures):
+            path = futures[future]
+            try:
+                future.result()
+                cache[str(path)] = f"{file_signature(path)}:{args.bitrate}"
+            except FileNotFoundError:
+                print("✗ ffmpeg not found - install ffmpeg (with libopus) first")
+                pool.shutdown(cancel_futures=True)
+                break
+            except subprocess.CalledProcessError as e:
+                failed += 1
+                print(f"✗ {path}: {e.stderr.decode(errors='replace').strip()}")
+
+    save_cache(cache)
+
+    print(f"\n{'Directory':<24} {'Clips':>6} {'MP3':>10} {'Opus':>10} {'Saved':>7}")
+    total_mp3 = total_ogg = 0
+    for directory, clips, mp3_bytes, ogg_bytes in size_report(directories):
+        total_mp3 += mp3_bytes
+        total_ogg += ogg_bytes
+        saved = f"{1 - ogg_bytes / mp3_bytes:.0%}" if mp3_bytes else "-"
+        print(f"{Path(directory).name:<24} {clips:>6} {mp3_bytes / 1024:>8.0f}KB "
+              f"{ogg_bytes / 1024:>8.0f}KB {saved:>7}")
+    if total_mp3:
+        print(f"{'Total':<24} {'':>6} {total_mp3 / 1024:>8.0f}KB {total_ogg / 1024:>8.0f}KB "
+              f"{1 - total_ogg / total_mp3:>7.0%}")
+
+    print(f"\n✓ Done ({failed} failed)" if failed else "\n✓ Done")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,56 +1,181 @@
 #!/usr/bin/env python3
 """
-Trim silence from all number audio files using ffmpeg
+Trim leading/trailing silence from game audio clips
+
+Runs over any set of audio directories (default: every public/*_audio
+directory) in a process pool. Each clip is decoded once, its silence
+boundaries are found with NumPy, and the trimmed audio is encoded once
+straight from memory.
+
+Boundaries are cached in .build_cache/trim_audio.json by file size and
+mtime, so clips that are already trimmed are skipped without decoding.
+Trimmed clips are copied back into the TTS synthesis cache (tts_cache.py),
+so restoring one from the cache does not bring its silence back.
+Requires: pip install numpy, and ffmpeg on the PATH.
+
+Usage:
+    python trim_audio_silence.py                       # all audio directories
+    python trim_audio_silence.py public/number_audio   # one directory
 """
 
-import subprocess
+import argparse
+import json
 import os
+import subprocess
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-def trim_audio_file(filepath):
-    """Trim silence from start and end of audio file"""
-    temp_file = str(filepath) + ".trimmed.mp3"
-
-    # Use ffmpeg to remove silence
-    cmd = [
-        'ffmpeg',
-        '-i', str(filepath),
-        '-af', 'silenceremove=start_periods=1:start_threshold=-50dB:start_silence=0.05:stop_periods=-1:stop_threshold=-50dB:stop_silence=0.05',
-        '-y',
-        temp_file
-    ]
+import audio_pcm
+import build_events
+import tts_cache
+
+CACHE_FILE = Path(".build_cache") / "trim_audio.json"
+
+THRESHOLD_DB = -50.0  # same threshold as the old ffmpeg silenceremove filter
+PADDING = 0.05        # seconds of silence kept on each side
+MIN_TRIM = 0.02       # don't re-encode a clip to save less than this
+
+
+def default_directories():
+    return sorted(str(p) for p in Path("public").glob("*_audio") if p.is_dir())
+
+
+def audio_files(directories):
+    files = []
+    for directory in directories:
+        files += sorted(p for p in Path(directory).glob("*.mp3") if not p.name.startswith("."))
+    return files
+
+
+def file_signature(path):
+    stat = path.stat()
+    return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def trim_audio_file(path, threshold_db=THRESHOLD_DB, padding=PADDING, bitrate="64k"):
+    """
+    Trim silence from start and end of one clip.
 
+    Returns (status, bounds) where status is 'trimmed', 'unchanged' or
+    'silent' and bounds are the (start_s, end_s) of the audible part in
+    the file as it is on disk afterwards.
+    """
+    with build_events.asset(path) as event:
+        with event.stage("decode"):
+            samples, sample_rate = audio_pcm.decode(path)
+        duration = len(samples) / sample_rate
+        bounds = audio_pcm.silence_bounds(samples, sample_rate, threshold_db)
+        if bounds is None:
+            event.status = "silent"
+            return "silent", None
+
+        start = max(0.0, bounds[0] - padding)
+        end = min(duration, bounds[1] + padding)
+        if start < MIN_TRIM and duration - end < MIN_TRIM:
+            event.cache = "hit"
+            return "unchanged", bounds
+
+        trimmed = samples[int(start * sample_rate):int(end * sample_rate)]
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".", suffix=".mp3")
+        os.close(fd)
+        try:
+            with event.stage("encode"):
+                audio_pcm.encode(trimmed, sample_rate, tmp_path, bitrate=bitrate)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        event.cache = "miss"
+        event.bytes = path.stat().st_size
+
+        return "trimmed", (bounds[0] - start, bounds[1] - start)
+
+
+def trim_worker(args):
+    """Process pool entry point: never raises, reports errors as a status"""
+    path, threshold_db, padding, bitrate = args
+    try:
+        status, bounds = trim_audio_file(path, threshold_db, padding, bitrate)
+        return path, status, bounds, None
+    except (subprocess.CalledProcessError, OSError) as e:
+        return path, "error", None, str(e)
+
+
+def load_cache():
     try:
-        # Run ffmpeg, suppress output
-        subprocess.run(cmd, capture_output=True, check=True)
-
-        # Replace original with trimmed version
-        os.replace(temp_file, filepath)
-        print(f"✓ Trimmed {filepath.name}")
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"✗ Failed to trim {filepath.name}: {e}")
-        # Clean up temp file if it exists
-        if os.path.exists(temp_file):
-            os.remove(temp_file)
-        return False
+        with open(CACHE_FILE, encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_cache(cache):
+    CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    with open(CACHE_FILE, "w", encoding="utf-8") as f:
+        json.dump(cache, f, indent=2, sort_keys=True, ensure_ascii=False)
+
 
 def main():
-    audio_dir = Path('public/number_audio')
+    parser = argparse.ArgumentParser(description="Trim silence from audio clips")
+    parser.add_argument("directories", nargs="*", default=None,
+                        help="Audio directories to trim (default: public/*_audio)")
+    parser.add_argument("--threshold-db", type=float, default=THRESHOLD_DB,
+                        help=f"Silence threshold in dBFS (default: {THRESHOLD_DB})")
+    parser.add_argument("--padding", type=float, default=PADDING,
+                        help=f"Seconds of silence kept at each end (default: {PADDING})")
+    parser.add_argument("--bitrate", default="64k", help="Bitrate for re-encoded clips (default: 64k)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Worker processes (default: one per CPU)")
+    parser.add_argument("--force", action="store_true",
+                        help="Re-analyse every clip, ignoring cached boundaries")
+    args = parser.parse_args()
 
-    # Only trim files 0-9
-    audio_files = [audio_dir / f"{i}.mp3" for i in range(10)]
+    directories = args.directories or default_directories()
+    files = audio_files(directories)
+    cache = {} if args.force else load_cache()
+    settings = f"{args.threshold_db}:{args.padding}"
 
-    print(f"Trimming silence from numbers 0-9...")
+    # Skip clips whose cached boundaries say they are already trimmed
+    pending = [
+        path for path in files
+        if cache.get(str(path), {}).get("signature") != file_signature(path)
+        or cache[str(path)].get("settings") != settings
+    ]
+
+    print(f"Trimming silence in {len(directories)} directories "
+          f"({len(files)} clips, {len(files) - len(pending)} already trimmed)...")
     print()
 
-    success_count = 0
-    for audio_file in audio_files:
-        if trim_audio_file(audio_file):
-            success_count += 1
+    counts = {"trimmed": 0, "unchanged": 0, "silent": 0, "error": 0}
+    trimmed = []
+    jobs = [(path, args.threshold_db, args.padding, args.bitrate) for path in pending]
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        for path, status, bounds, error in pool.map(trim_worker, jobs):
+            counts[status] += 1
+            if status == "error":
+                print(f"✗ Failed to trim {path}: {error}")
+                continue
+            if status == "silent":
+                print(f"✗ {path} is silent - regenerate it")
+            elif status == "trimmed":
+                print(f"✓ Trimmed {path}")
+                trimmed.append(path)
+            cache[str(path)] = {
+                "signature": file_signature(path),
+                "settings": settings,
+                "bounds": [round(b, 3) for b in bounds] if bounds else None,
+            }
+
+    save_cache(cache)
+    refreshed = tts_cache.refresh_blobs(trimmed)
 
     print()
-    print(f"✓ Successfully trimmed {success_count}/{len(audio_files)} files")
+    print(f"✓ Trimmed {counts['trimmed']} files, {counts['unchanged']} already tight, "
+          f"{counts['silent']} silent, {counts['error']} failed")
+    if refreshed:
+        print(f"✓ Updated {refreshed} cached TTS clips with the trimmed audio")
+
 
 if __name__ == "__main__":
     main()
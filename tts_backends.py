@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Pluggable TTS backends for the generate_*_audio.py scripts
+
+Backends:
+- edge-tts   Microsoft Edge neural voices (network, used for release renders)
+- gtts       Google Translate TTS (network)
+- espeak-ng  Local offline engine, run as a subprocess
+- piper      Local offline neural engine, run as a subprocess
+- fake       Canned silent clip after TTS_FAKE_LATENCY seconds (benchmarks)
+
+The offline engines write WAV which is encoded to mono MP3 with ffmpeg, so
+every backend produces the .mp3 files the game loads. Python dependencies
+are imported lazily: an offline runner only needs espeak-ng/piper + ffmpeg.
+
+Pick a backend per run with --backend (or the TTS_BACKEND environment
+variable) and optionally override the voice with --voice:
+
+    python generate_letter_audio.py --backend espeak-ng
+    TTS_BACKEND=piper PIPER_MODEL_DIR=~/piper python generate_number_audio.py
+"""
+
+import asyncio
+import os
+
+# Default voice per backend and language
+DEFAULT_VOICES = {
+    "edge-tts": {"sv": "sv-SE-MattiasNeural", "en": "en-US-GuyNeural"},
+    "gtts": {"sv": "sv", "en": "en"},
+    "espeak-ng": {"sv": "sv", "en": "en-us"},
+    "piper": {"sv": "sv_SE-nst-medium", "en": "en_US-lessac-medium"},
+    "fake": {"sv": "sv", "en": "en"},
+}
+
+
+class TTSBackend:
+    """Base class: render `text` with `voice` into an mp3 at `path`"""
+
+    name = None
+    supports_batch = False  # Whether tts_batch can split this backend's output
+
+    def __init__(self, voice, options=None):
+        self.voice = voice
+        self.options = options or {}
+
+    async def save(self, text, path):
+        raise NotImplementedError
+
+
+class EdgeTTSBackend(TTSBackend):
+    name = "edge-tts"
+    supports_batch = True
+
+    async def save(self, text, path):
+        import edge_tts
+        tts = edge_tts.Communicate(text, self.voice, **self.options)
+        await tts.save(path)
+
+
+class GTTSBackend(TTSBackend):
+    name = "gtts"
+
+    async def save(self, text, path):
+        from gtts import gTTS
+        tts = gTTS(text=text, lang=self.voice, **self.options)
+        # gTTS is blocking - run it in a worker thread
+        await asyncio.to_thread(tts.save, path)
+
+
+async def run_command(*cmd, input=None):
+    """Run a subprocess, raising RuntimeError with its stderr on failure"""
+    process = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdin=asyncio.subprocess.PIPE if input is not None else asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    _, stderr = await process.communicate(input)
+    if process.returncode != 0:
+        raise RuntimeError(f"{cmd[0]} failed: {stderr.decode(errors='replace').strip()}")
+
+
+async def encode_mp3(wav_path, path):
+    """Encode a WAV file to mono 24 kHz / 48 kbps MP3 (matches edge-tts output)"""
+    await run_command(
+        "ffmpeg", "-hide_banner", "-loglevel", "error",
+        "-i", wav_path, "-ac", "1", "-ar", "24000", "-b:a", "48k",
+        "-f", "mp3", "-y", path,
+    )
+
+
+class LocalBackend(TTSBackend):
+    """Offline engine that renders WAV via a subprocess, then encodes to mp3"""
+
+    async def render_wav(self, text, wav_path):
+        raise NotImplementedError
+
+    async def save(self, text, path):
+        wav_path = path + ".wav"
+        try:
+            await self.render_wav(text, wav_path)
+            await encode_mp3(wav_path, path)
+        finally:
+            if os.path.exists(wav_path):
+                os.remove(wav_path)
+
+
+class EspeakBackend(LocalBackend):
+    name = "espeak-ng"
+
+    async def render_wav(self, text, wav_path):
+        speed = str(self.options.get("speed", 150))
+        await run_command("espeak-ng", "-v", self.voice, "-s", speed, "-w", wav_path, text)
+
+
+class PiperBackend(LocalBackend):
+    name = "piper"
+
+    def model_path(self):
+        # Voices can be given as a model file or as a name in PIPER_MODEL_DIR
+        if self.voice.endswith(".onnx"):
+            return self.voice
+        model_dir = os.path.expanduser(os.environ.get("PIPER_MODEL_DIR", "."))
+        return os.path.join(model_dir, f"{self.voice}.onnx")
+
+    async def render_wav(self, text, wav_path):
+        await run_command("piper", "--model", self.model_path(), "--output_file", wav_path,
+                          input=text.encode("utf-8"))
+
+
+class FakeBackend(TTSBackend):
+    """Writes a canned clip after a fixed delay - stands in for a network engine in benchmarks"""
+
+    name = "fake"
+
+    # One MPEG-2 Layer III frame: 24 kHz mono 32 kbps, all-zero payload (silence)
+    FRAME = b"\xff\xf3\x44\xc0" + bytes(92)
+
+    async def save(self, text, path):
+        latency = float(self.options.get("latency", os.environ.get("TTS_FAKE_LATENCY", 0.05)))
+        await asyncio.sleep(latency)
+        # ~24 ms per frame; longer text gives a longer clip, like a real engine
+        frames = 10 + 2 * len(text)
+        with open(path, "wb") as f:
+            f.write(self.FRAME * frames)
+
+
+BACKENDS = {
+    backend.name: backend
+    for backend in (EdgeTTSBackend, GTTSBackend, EspeakBackend, PiperBackend, FakeBackend)
+}
+
+
+def add_backend_arguments(parser, default="edge-tts"):
+    """Add the shared --backend/--voice flags to a generator's argument parser"""
+    default = os.environ.get("TTS_BACKEND", default)
+    parser.add_argument(
+        "--backend", choices=sorted(BACKENDS), default=default,
+        help=f"TTS engine to render with (default: {default}, or $TTS_BACKEND)")
+    parser.add_argument(
+        "--voice", default=None,
+        help="Voice/model for the selected backend (default: the backend's voice for this language)")
+
+
+def get_backend(name, lang, voice=None, options=None):
+    """Instantiate backend `name` for language 'sv' or 'en'"""
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown TTS backend '{name}' (choose from {', '.join(sorted(BACKENDS))})")
+    return BACKENDS[name](voice or DEFAULT_VOICES[name][lang], options)
+
+
+def backend_job(backend, text, filename):
+    """Scheduler job rendering `text` into `filename` with `backend`"""
+    async def render(path):
+        await backend.save(text, path)
+    return filename, render
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Batch multi-phrase synthesis for edge-tts
+
+Every edge_tts.Communicate session costs a websocket handshake, which
+dominates the runtime for one-word clips (letters, numbers, Pokemon names).
+In batch mode many short phrases are sent in one request, separated by a
+pause, and the returned MP3 is cut into one clip per phrase using the
+WordBoundary events edge-tts streams alongside the audio.
+
+Splitting is done on MP3 frame boundaries (see mp3_frames.py), so nothing
+is re-encoded. A phrase is only split out when its boundary words match
+the phrase text and are separated from the neighbours by a real pause;
+anything with low split confidence falls back to per-phrase synthesis.
+"""
+
+import asyncio
+import re
+import time
+
+import mp3_frames
+from tts_scheduler import (DEFAULT_CONCURRENCY, DEFAULT_RETRIES, backoff_delay,
+                           report_throughput, run_jobs, write_atomic)
+
+DEFAULT_BATCH_SIZE = 25
+SEPARATOR = ", "     # Read as a short pause between phrases
+MIN_GAP = 0.05       # seconds of silence required between two phrases
+LEAD_IN = 0.05       # seconds kept before the first word of a phrase
+TAIL = 0.10          # seconds kept after the last word of a phrase
+
+TICKS_PER_SECOND = 10_000_000  # edge-tts offsets are in 100 ns units
+
+
+def add_batch_arguments(parser):
+    """Add the shared --batch/--batch-size flags to a generator's argument parser"""
+    parser.add_argument(
+        "--batch", action="store_true",
+        help="Synthesize many phrases per edge-tts request and split them on word boundaries")
+    parser.add_argument(
+        "--batch-size", type=int, default=DEFAULT_BATCH_SIZE,
+        help=f"Phrases per batched request (default: {DEFAULT_BATCH_SIZE})")
+
+
+def normalize(text):
+    """Lowercase alphanumerics only, so 'Mr. Mime' and 'mr mime' compare equal"""
+    return re.sub(r"[\W_]", "", text.lower())
+
+
+async def synthesize_with_boundaries(text, voice):
+    """Return (mp3 bytes, [(start_s, end_s, word), ...]) for one request"""
+    import edge_tts
+
+    try:
+        communicate = edge_tts.Communicate(text, voice, boundary="WordBoundary")
+    except TypeError:
+        # edge-tts < 7 has no boundary argument and always sends WordBoundary
+        communicate = edge_tts.Communicate(text, voice)
+
+    audio = bytearray()
+    words = []
+    async for chunk in communicate.stream():
+        if chunk["type"] == "audio":
+            audio.extend(chunk["data"])
+        elif chunk["type"] == "WordBoundary":
+            start = chunk["offset"] / TICKS_PER_SECOND
+            end = (chunk["offset"] + chunk["duration"]) / TICKS_PER_SECOND
+            words.append((start, end, chunk["text"]))
+    return bytes(audio), words
+
+
+def align_phrases(phrases, words):
+    """
+    Assign boundary words to phrases.
+
+    Returns one (start_s, end_s) span per phrase, or None for phrases whose
+    words could not be matched. Alignment stops at the first mismatch since
+    every later phrase would be shifted.
+    """
+    spans = []
+    i = 0
+    for phrase in phrases:
+        target = normalize(phrase)
+        spoken = ""
+        first = i
+        while i < len(words) and len(spoken) < len(target):
+            spoken += normalize(words[i][2])
+            i += 1
+        if spoken != target or first == i:
+            return spans + [None] * (len(phrases) - len(spans))
+        spans.append((words[first][0], words[i - 1][1]))
+    return spans
+
+
+def split_batch(audio, phrases, words):
+    """
+    Cut batched audio into per-phrase clips.
+
+    Returns a list aligned with `phrases` holding MP3 bytes, or None where
+    the split confidence is too low.
+    """
+    frames = mp3_frames.parse_frames(audio)
+    spans = align_phrases(phrases, words)
+    total = mp3_frames.duration(audio)
+    clips = []
+
+    for index, span in enumerate(spans):
+        if span is None or not frames:
+            clips.append(None)
+            continue
+
+        start, end = span
+        prev_end = spans[index - 1][1] if index > 0 and spans[index - 1] else 0.0
+        next_start = spans[index + 1][0] if index + 1 < len(spans) and spans[index + 1] else total
+
+        # Not enough pause on either side to cut cleanly
+        if (index > 0 and start - prev_end < MIN_GAP) or \
+                (index + 1 < len(spans) and next_start - end < MIN_GAP):
+            clips.append(None)
+            continue
+
+        cut_start = max((prev_end + start) / 2, start - LEAD_IN)
+        cut_end = min((end + next_start) / 2, end + TAIL)
+        clip = mp3_frames.slice_seconds(audio, frames, cut_start, cut_end)
+        clips.append(clip or None)
+
+    return clips
+
+
+async def run_batched(items, fallback_jobs, voice, batch_size=DEFAULT_BATCH_SIZE,
+                      concurrency=DEFAULT_CONCURRENCY, retries=DEFAULT_RETRIES):
+    """
+    Render (filename, text) items in batched requests.
+
+    `fallback_jobs` is the matching list of per-phrase scheduler jobs, used
+    for any phrase the batch could not split confidently. Returns a list of
+    booleans in the same order as `items`.
+    """
+    if not items:
+        return []
+
+    start = time.perf_counter()
+    results = [False] * len(items)
+    fallback = []
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    batches = [list(range(i, min(i + batch_size, len(items))))
+               for i in range(0, len(items), batch_size)]
+
+    async def run_batch(indices):
+        phrases = [items[i][1] for i in indices]
+        async with semaphore:
+            for attempt in range(retries + 1):
+                try:
+                    audio, words = await synthesize_with_boundaries(SEPARATOR.join(phrases), voice)
+                    break
+                except Exception as e:
+                    if attempt == retries:
+                        print(f"✗ Batch of {len(indices)} failed ({e}), falling back")
+                        fallback.extend(indices)
+                        return
+                    await asyncio.sleep(backoff_delay(attempt))
+
+        for i, clip in zip(indices, split_batch(audio, phrases, words)):
+            if clip is None:
+                fallback.append(i)
+                continue
+
+            async def render(path, clip=clip):
+                with open(path, "wb") as f:
+                    f.write(clip)
+
+            await write_atomic(items[i][0], render)
+            print(f"✓ Saved {items[i][0]} (batched)")
+            results[i] = True
+
+    await asyncio.gather(*(run_batch(indices) for indices in batches))
+    print(f"\n{len(items) - len(fallback)}/{len(items)} clips split from "
+          f"{len(batches)} batched requests, {len(fallback)} falling back to per-phrase")
+    report_throughput(len(items) - len(fallback), time.perf_counter() - start)
+
+    fallback.sort()
+    fallback_results = await run_jobs([fallback_jobs[i] for i in fallback],
+                                      concurrency=concurrency, retries=retries)
+    for i, result in zip(fallback, fallback_results):
+        results[i] = result
+    return results
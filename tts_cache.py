@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Shared on-disk synthesis cache for the generate_*_audio.py scripts
+
+Every clip is keyed by a hash of (text, voice, engine, engine options).
+Rendered audio is stored once under .tts_cache/blobs/ and a manifest per
+output directory (.tts_cache/manifests/<dir>.json) records which key produced
+each file, so a rebuild with no changes only has to stat the outputs.
+
+Usage from a generator script:
+
+    cache = SynthesisCache('public/letter_audio', engine='edge-tts', voice=VOICE)
+    pending = [l for l in letters if not cache.restore(path(l), l)]
+    ... synthesize pending clips, then cache.store(path(l), l) for each ...
+    cache.save()
+
+Stages that rewrite generated clips in place (trim_audio_silence.py) call
+refresh_blobs() afterwards, so a clip restored from the cache is the
+processed file rather than the raw engine output.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+
+import build_events
+
+CACHE_DIR = ".tts_cache"
+
+
+def add_cache_arguments(parser):
+    """Add the shared --force/--prune flags to a generator's argument parser"""
+    parser.add_argument(
+        "--force", action="store_true",
+        help="Re-synthesize every clip, ignoring the cache and manifest")
+    parser.add_argument(
+        "--prune", action="store_true",
+        help="Delete previously generated clips that this script no longer produces")
+
+
+def cache_key(text, voice, engine, options=None):
+    """Content hash identifying one synthesized clip"""
+    payload = json.dumps(
+        {"text": text, "voice": voice, "engine": engine, "options": options or {}},
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def blob_path(key, cache_dir=CACHE_DIR):
+    return os.path.join(cache_dir, "blobs", key[:2], f"{key}.mp3")
+
+
+def refresh_blobs(filenames, cache_dir=CACHE_DIR):
+    """
+    Replace the cached blobs of `filenames` with the files as they are now.
+
+    Files that no manifest tracks are ignored. Returns the number of blobs
+    replaced.
+    """
+    manifests = {}
+    refreshed = 0
+    for filename in filenames:
+        name = os.path.basename(os.path.normpath(os.path.dirname(os.path.abspath(filename))))
+        if name not in manifests:
+            try:
+                with open(os.path.join(cache_dir, "manifests", f"{name}.json"), encoding="utf-8") as f:
+                    manifests[name] = json.load(f)
+            except (FileNotFoundError, json.JSONDecodeError):
+                manifests[name] = {}
+        entry = manifests[name].get(os.path.basename(filename))
+        if not entry:
+            continue
+        blob = blob_path(entry["key"], cache_dir)
+        os.makedirs(os.path.dirname(blob), exist_ok=True)
+        tmp_path = blob + ".tmp"
+        shutil.copyfile(filename, tmp_path)
+        os.replace(tmp_path, blob)
+        refreshed += 1
+    return refreshed
+
+
+class SynthesisCache:
+    """Cache and manifest for one output directory rendered by one engine/voice"""
+
+    def __init__(self, output_dir, engine, voice, options=None, force=False, cache_dir=CACHE_DIR):
+        self.output_dir = output_dir
+        self.engine = engine
+        self.voice = voice
+        self.options = options or {}
+        self.force = force
+        self.cache_dir = cache_dir
+
+        name = os.path.basename(os.path.normpath(output_dir))
+        self.manifest_path = os.path.join(cache_dir, "manifests", f"{name}.json")
+        self.manifest = self._load_manifest()
+
+        self.up_to_date = 0
+        self.restored = 0
+        self.adopted = 0
+        self.synthesized = 0
+
+    def _load_manifest(self):
+        try:
+            with open(self.manifest_path, encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def key(self, text):
+        return cache_key(text, self.voice, self.engine, self.options)
+
+    def blob_path(self, key):
+        return blob_path(key, self.cache_dir)
+
+    def _record(self, filename, text, key):
+        self.manifest[os.path.basename(filename)] = {
+            "text": text,
+            "key": key,
+            "engine": self.engine,
+            "voice": self.voice,
+        }
+
+    def restore(self, filename, text):
+        """
+        Make `filename` up to date without synthesizing, if possible.
+
+        Returns True when the output already matches (or was copied from the
+        cache), False when the clip still has to be synthesized.
+        """
+        if self.force:
+            return False
+
+        key = self.key(text)
+        entry = self.manifest.get(os.path.basename(filename))
+        exists = os.path.exists(filename)
+
+        if entry and entry.get("key") == key and exists:
+            self.up_to_date += 1
+            build_events.record(filename, cache="hit")
+            return True
+
+        blob = self.blob_path(key)
+        if os.path.exists(blob):
+            shutil.copyfile(blob, filename)
+            self._record(filename, text, key)
+            self.restored += 1
+            build_events.record(filename, cache="restored")
+            return True
+
+        if entry is None and exists:
+            # File predates the manifest: adopt it instead of re-rendering.
+            # Use --force to re-synthesize adopted clips.
+            self._record(filename, text, key)
+            self.adopted += 1
+            build_events.record(filename, cache="adopted")
+            return True
+
+        return False
+
+    def store(self, filename, text):
+        """Copy a freshly synthesized clip into the cache and record it"""
+        key = self.key(text)
+        blob = self.blob_path(key)
+        os.makedirs(os.path.dirname(blob), exist_ok=True)
+        shutil.copyfile(filename, blob)
+        self._record(filename, text, key)
+        self.synthesized += 1
+
+    def prune(self, keep):
+        """Delete manifest-tracked outputs that are not in `keep` (list of paths)"""
+        keep_names = {os.path.basename(f) for f in keep}
+        removed = []
+        for name in sorted(set(self.manifest) - keep_names):
+            path = os.path.join(self.output_dir, name)
+            if os.path.exists(path):
+                os.remove(path)
+            del self.manifest[name]
+            removed.append(name)
+            print(f"✗ Pruned {path}")
+        return removed
+
+    def save(self):
+        """Write the manifest atomically"""
+        os.makedirs(os.path.dirname(self.manifest_path), exist_ok=True)
+        tmp_path = self.manifest_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.manifest, f, indent=2, ensure_ascii=False, sort_keys=True)
+        os.replace(tmp_path, self.manifest_path)
+
+    def summary(self):
+        return (f"{self.up_to_date} up to date, {self.restored} restored from cache, "
+                f"{self.adopted} adopted, {self.synthesized} synthesized")
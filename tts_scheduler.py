@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Shared asyncio job scheduler for the generate_*_audio.py scripts
+
+- Bounded concurrency (--concurrency) instead of one-at-a-time loops or
+  firing every request at once
+- Exponential backoff with jitter on failures (--retries)
+- Atomic writes: each job renders into a temp file in the output directory
+  which is renamed over the target only when complete, so a crash or retry
+  never leaves a half-written mp3 behind
+- Throughput report (files/s) at the end of a run
+
+A job is a (filename, render) pair where render is an async callable that
+writes the clip to the path it is given:
+
+    async def render(path):
+        await edge_tts.Communicate(text, VOICE).save(path)
+
+    results = await run_jobs([(filename, render), ...], concurrency=8)
+"""
+
+import asyncio
+import os
+import random
+import tempfile
+import time
+
+import build_events
+
+DEFAULT_CONCURRENCY = 8
+DEFAULT_RETRIES = 4
+BASE_DELAY = 0.5   # seconds before the first retry
+MAX_DELAY = 10.0   # cap for a single backoff sleep
+
+
+def add_scheduler_arguments(parser, concurrency=DEFAULT_CONCURRENCY):
+    """Add the shared --concurrency/--retries flags to a generator's argument parser"""
+    parser.add_argument(
+        "--concurrency", type=int, default=concurrency,
+        help=f"Maximum number of clips rendered at once (default: {concurrency})")
+    parser.add_argument(
+        "--retries", type=int, default=DEFAULT_RETRIES,
+        help=f"Retries per clip on failure, with exponential backoff (default: {DEFAULT_RETRIES})")
+
+
+def backoff_delay(attempt, base=BASE_DELAY, cap=MAX_DELAY):
+    """Full-jitter exponential backoff: random delay in [0, min(cap, base * 2^attempt)]"""
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+async def write_atomic(filename, render):
+    """Run render(tmp_path) and move the result over filename only if it succeeds"""
+    directory = os.path.dirname(filename) or "."
+    fd, tmp_path = tempfile.mkstemp(
+        dir=directory, prefix=".", suffix=os.path.splitext(filename)[1] + ".part")
+    os.close(fd)
+    try:
+        await render(tmp_path)
+        if os.path.getsize(tmp_path) == 0:
+            raise IOError("renderer produced an empty file")
+        os.replace(tmp_path, filename)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+async def run_jobs(jobs, concurrency=DEFAULT_CONCURRENCY, retries=DEFAULT_RETRIES):
+    """
+    Render all (filename, render) jobs with at most `concurrency` in flight.
+
+    Returns a list of booleans in the same order as `jobs`.
+    """
+    if not jobs:
+        return []
+
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def run_one(filename, render):
+        async with semaphore:
+            with build_events.asset(filename) as event:
+                event.cache = "miss"
+                for attempt in range(retries + 1):
+                    try:
+                        with event.stage("tts"):
+                            await write_atomic(filename, render)
+                        event.bytes = os.path.getsize(filename)
+                        print(f"✓ Saved {filename}")
+                        return True
+                    except Exception as e:
+                        if attempt == retries:
+                            event.status = "error"
+                            print(f"✗ Error ({filename}): {e}")
+                            return False
+                        event.retries = attempt + 1
+                        delay = backoff_delay(attempt)
+                        print(f"  ↻ Retry {attempt + 1}/{retries} for {filename} in {delay:.1f}s ({e})")
+                        with event.stage("backoff"):
+                            await asyncio.sleep(delay)
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(run_one(f, render) for f, render in jobs))
+    report_throughput(sum(results), time.perf_counter() - start)
+    return list(results)
+
+
+def report_throughput(count, elapsed):
+    rate = count / elapsed if elapsed > 0 else 0.0
+    print(f"\n⏱ Rendered {count} files in {elapsed:.1f}s ({rate:.1f} files/s)")
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Keep the TTS clips in sync with the JS modules they are generated from
+Output: public/{word,letter,pokemon}_audio/*.mp3 + .build_cache/asset_graph.json
+
+Watches the game's source of truth and re-renders only what changed:
+
+    src/speechVocabulary.js  SPEECH_VOCABULARY       -> public/word_audio/<word>.mp3
+    src/letterData.js        DEFAULT_SWEDISH_LETTERS -> public/letter_audio/<letter>.mp3
+    src/pokemonData.js       POKEMON_DATA            -> public/pokemon_audio/<id>_<name>.mp3
+
+The dependency graph (source -> entry -> output file and spoken text) is
+kept in .build_cache/asset_graph.json. When a source is saved it is parsed
+again (see js_sources.py) and diffed against the graph:
+- added or changed entries are rendered (through the same .tts_cache/ as
+  the generator scripts, so a word that comes back is restored, not
+  re-synthesized)
+- removed entries have their clip deleted
+- entries whose clip is missing from disk are rendered again
+
+A source that fails to parse (saved mid-edit) is reported and retried on
+the next save; the graph is left as it was.
+
+    python watch_assets.py              # sync once, then watch (Ctrl+C to stop)
+    python watch_assets.py --once       # sync once and exit
+    python watch_assets.py --targets words letters
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import time
+
+import generate_letter_audio
+import generate_pokemon_audio
+import generate_word_audio
+import js_sources
+from tts_backends import BACKENDS, backend_job, get_backend
+from tts_cache import SynthesisCache
+from tts_scheduler import add_scheduler_arguments, run_jobs
+
+GRAPH_FILE = os.path.join(".build_cache", "asset_graph.json")
+POLL_INTERVAL = 0.5   # seconds between source checks
+SETTLE_TIME = 0.2     # a changed source must be unchanged this long before it is parsed
+
+
+def word_entries():
+    return {word: (generate_word_audio.word_filename(word), word)
+            for word in js_sources.speech_words()}
+
+
+def letter_entries():
+    return {letter: (generate_letter_audio.letter_filename(letter), letter)
+            for letter in js_sources.swedish_letters()}
+
+
+def pokemon_entries():
+    return {str(pokemon_id): (generate_pokemon_audio.pokemon_filename(pokemon_id, name),
+                              generate_pokemon_audio.spoken_name(name))
+            for pokemon_id, name in js_sources.pokemon_names()}
+
+
+# name: (source module, {entry: (output file, text)} reader, output dir, language,
+#        default backend, backend options) - same settings as the generator scripts
+TARGETS = {
+    "words": (js_sources.SPEECH_VOCABULARY_JS, word_entries, generate_word_audio.OUTPUT_DIR,
+              generate_word_audio.LANG, "gtts", generate_word_audio.GTTS_OPTIONS),
+    "letters": (js_sources.LETTER_DATA_JS, letter_entries, generate_letter_audio.OUTPUT_DIR,
+                generate_letter_audio.LANG, "edge-tts", None),
+    "pokemon": (js_sources.POKEMON_DATA_JS, pokemon_entries, generate_pokemon_audio.OUTPUT_DIR,
+                generate_pokemon_audio.LANG, "edge-tts", None),
+}
+
+
+def load_graph():
+    try:
+        with open(GRAPH_FILE, encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_graph(graph):
+    os.makedirs(os.path.dirname(GRAPH_FILE), exist_ok=True)
+    tmp_path = GRAPH_FILE + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(graph, f, indent=1, ensure_ascii=False, sort_keys=True)
+    os.replace(tmp_path, GRAPH_FILE)
+
+
+def diff_entries(old, new):
+    """(added, changed, removed, missing) entry names between two {entry: (output, text)} maps"""
+    added = sorted(set(new) - set(old))
+    removed = sorted(set(old) - set(new))
+    changed = sorted(e for e in set(old) & set(new) if tuple(old[e]) != tuple(new[e]))
+    dirty = set(added) | set(changed)
+    missing = sorted(e for e in new if e not in dirty and not os.path.exists(new[e][0]))
+    return added, changed, removed, missing
+
+
+class Watcher:
+    """Diffs each target's source against the graph and re-renders what changed"""
+
+    def __init__(self, targets, backend=None, voice=None, concurrency=8, retries=4):
+        self.targets = targets
+        self.backend_name = backend
+        self.voice = voice
+        self.concurrency = concurrency
+        self.retries = retries
+        self.graph = load_graph()
+        self.backends = {}
+
+    def backend(self, target):
+        if target not in self.backends:
+            _, _, _, lang, default, options = TARGETS[target]
+            name = self.backend_name or default
+            self.backends[target] = get_backend(name, lang, self.voice,
+                                                options if name == default else None)
+        return self.backends[target]
+
+    async def sync(self, target):
+        """Bring one target's clips up to date with its source. Returns False if it didn't parse"""
+        source, read_entries, output_dir, _, _, _ = TARGETS[target]
+        try:
+            entries = read_entries()
+        except (OSError, js_sources.JSSyntaxError, KeyError, TypeError) as e:
+            print(f"✗ {target}: could not read {source} ({e}) - keeping the previous graph")
+            return False
+
+        old = self.graph.get(target, {}).get("entries", {})
+        added, changed, removed, missing = diff_entries(old, entries)
+        if not (added or changed or removed or missing):
+            return True
+        print(f"{target}: {len(added)} added, {len(changed)} changed, {len(removed)} removed, "
+              f"{len(missing)} missing ({source})")
+
+        backend = self.backend(target)
+        os.makedirs(output_dir, exist_ok=True)
+        cache = SynthesisCache(output_dir, engine=backend.name, voice=backend.voice,
+                               options=backend.options)
+
+        # Clips nothing depends on any more: removed entries, and the old file
+        # of entries whose output name changed
+        outputs = {output for output, _ in entries.values()}
+        for entry in removed + changed:
+            old_output = old[entry][0]
+            if old_output not in outputs:
+                cache.manifest.pop(os.path.basename(old_output), None)
+                if os.path.exists(old_output):
+                    os.remove(old_output)
+                    print(f"✗ Removed {old_output}")
+
+        dirty = [e for e in added + changed + missing
+                 if not cache.restore(entries[e][0], entries[e][1])]
+        jobs = [backend_job(backend, entries[e][1], entries[e][0]) for e in dirty]
+        results = await run_jobs(jobs, concurrency=self.concurrency, retries=self.retries)
+        failed = set()
+        for entry, result in zip(dirty, results):
+            if result:
+                cache.store(entries[entry][0], entries[entry][1])
+            else:
+                failed.add(entry)
+        cache.save()
+
+        # Failed entries stay out of the graph, so the next sync retries them
+        self.graph[target] = {
+            "source": source,
+            "entries": {e: list(v) for e, v in entries.items() if e not in failed},
+        }
+        save_graph(self.graph)
+        print(f"✓ {target} up to date ({cache.summary()})")
+        return True
+
+    async def sync_all(self):
+        for target in self.targets:
+            await self.sync(target)
+
+    async def watch(self, interval=POLL_INTERVAL):
+        """Poll the sources' mtimes and sync each target whose source was saved"""
+        sources = {target: TARGETS[target][0] for target in self.targets}
+        seen = {target: source_mtime(source) for target, source in sources.items()}
+        print(f"\nWatching {', '.join(sorted(set(sources.values())))} (Ctrl+C to stop)")
+        while True:
+            await asyncio.sleep(interval)
+            for target, source in sources.items():
+                mtime = source_mtime(source)
+                if mtime == seen[target]:
+                    continue
+                # Editors save in several writes: wait until the file settles
+                await asyncio.sleep(SETTLE_TIME)
+                if source_mtime(source) != mtime:
+                    continue
+                seen[target] = mtime
+                start = time.perf_counter()
+                if await self.sync(target):
+                    print(f"  (synced in {time.perf_counter() - start:.1f}s)")
+
+
+def source_mtime(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Re-render TTS clips when their JS source changes")
+    parser.add_argument("--targets", nargs="+", choices=list(TARGETS), default=list(TARGETS),
+                        help="What to keep in sync (default: all)")
+    parser.add_argument("--backend", choices=sorted(BACKENDS), default=os.environ.get("TTS_BACKEND"),
+                        help="TTS engine for every target (default: each generator's own, or $TTS_BACKEND)")
+    parser.add_argument("--voice", default=None, help="Voice/model for --backend")
+    parser.add_argument("--once", action="store_true", help="Sync once and exit instead of watching")
+    parser.add_argument("--interval", type=float, default=POLL_INTERVAL,
+                        help=f"Seconds between source checks (default: {POLL_INTERVAL})")
+    add_scheduler_arguments(parser)
+    args = parser.parse_args()
+
+    watcher = Watcher(args.targets, args.backend, args.voice, args.concurrency, args.retries)
+
+    async def run():
+        await watcher.sync_all()
+        if not args.once:
+            await watcher.watch(args.interval)
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        print("\nStopped")
+
+
+if __name__ == "__main__":
+    main()